@@ -0,0 +1,74 @@
+"""Traffic spike against a backend that serves ~640 req/s (32 x 50ms)
+
+3x overload for 3 seconds, with and without AdmissionController.
+Counts responses that made Kakao's 5 second deadline.
+
+python benchmarks/bench_admission.py
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kakao_json import Kakao
+from kakao_json.admission import AdmissionController
+from kakao_json.loadtest import percentile
+from kakao_json.skill import SkillRequest
+
+RPS = 1920
+DURATION = 3.0
+DEADLINE = 5.0
+
+
+async def run(admission):
+    backend = asyncio.Semaphore(32)
+
+    async def handler(req):
+        async with backend:
+            await asyncio.sleep(0.05)
+        k = Kakao()
+        k.add_simple_text("ok")
+        return k
+
+    if admission is not None:
+        handler = admission.wrap(handler)
+
+    latencies, busy = [], 0
+
+    async def one():
+        nonlocal busy
+        start = time.perf_counter()
+        result = await handler(SkillRequest())
+        if isinstance(result, bytes):
+            busy += 1
+        else:
+            latencies.append(time.perf_counter() - start)
+
+    tasks = []
+    start = time.perf_counter()
+    for i in range(int(RPS * DURATION)):
+        delay = start + i / RPS - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.ensure_future(one()))
+    await asyncio.gather(*tasks)
+
+    latencies.sort()
+    ok = sum(1 for latency in latencies if latency <= DEADLINE)
+    print(
+        f"{'admission' if admission else 'no admission':<14}"
+        f" in time {ok:5d}  late {len(latencies) - ok:5d}  busy {busy:5d}"
+        f"  p50 {percentile(latencies, 50) * 1000:7.0f} ms  p99 {percentile(latencies, 99) * 1000:7.0f} ms"
+    )
+
+
+def main():
+    asyncio.run(run(None))
+    asyncio.run(run(AdmissionController(limit=32, queue_size=2048)))
+
+
+if __name__ == "__main__":
+    main()
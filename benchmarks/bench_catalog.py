@@ -0,0 +1,83 @@
+"""Bulk CommerceCard rendering vs per-row setters
+
+python benchmarks/bench_catalog.py [rows]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import msgspec
+
+from kakao_json import CommerceCard, Thumbnail
+from kakao_json import catalog
+from kakao_json.catalog import commerce_carousels
+
+
+def make_catalog(n, seed=0):
+    rng = random.Random(seed)
+    return {
+        "description": [f"상품 {i}" for i in range(n)],
+        "price": [rng.randrange(1000, 200000, 100) for _ in range(n)],
+        "discount_rate": [rng.choice([None, 10, 20, 35, 50]) for _ in range(n)],
+        "image_url": [f"https://img.example.com/{i}.jpg" for i in range(n)],
+    }
+
+
+def per_row(data):
+    cards = []
+    for desc, price, rate, url in zip(
+        data["description"], data["price"], data["discount_rate"], data["image_url"]
+    ):
+        card = CommerceCard(desc, price, "won").set_thumbnail(Thumbnail(url))
+        if rate is not None:
+            card.set_discount_rate(rate).set_discounted_price(
+                int(round(price * (100 - rate) / 100))
+            )
+        cards.append(card)
+    return [cards[i : i + 10] for i in range(0, len(cards), 10)]
+
+
+def bench(name, fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - started)
+    print(f"{name:<28} {best * 1000:9.2f} ms")
+    return out
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    data = make_catalog(n)
+    print(f"rows: {n}, numpy: {catalog.np is not None}")
+
+    bench("per-row setters", lambda: per_row(data))
+    bench("commerce_carousels (lists)", lambda: commerce_carousels(**data))
+
+    if catalog.np is not None:
+        np = catalog.np
+        arrays = dict(data)
+        arrays["price"] = np.array(data["price"])
+        arrays["discount_rate"] = np.array(data["discount_rate"], dtype=float)
+        arrays["image_url"] = np.array(data["image_url"])
+        bench("commerce_carousels (numpy)", lambda: commerce_carousels(**arrays))
+
+    bench("price math, per-row python", lambda: catalog._prices_python(
+        data["price"], None, data["discount_rate"], None, True))
+    if catalog.np is not None:
+        np = catalog.np
+        price, rate = np.array(data["price"]), np.array(data["discount_rate"], dtype=float)
+        bench("price math, numpy", lambda: catalog._prices_numpy(price, None, rate, None, True))
+
+    encoder = msgspec.json.Encoder()
+    carousels = commerce_carousels(**data)
+    bench("encode carousels", lambda: [encoder.encode(c) for c in carousels])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""CardMapper vs hand written setter chains, 10k dataclass rows -> ListItem / BasicCard
+
+python benchmarks/bench_mapper.py
+"""
+
+import os
+import sys
+import time
+from dataclasses import dataclass
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kakao_json import BasicCard, ListItem
+from kakao_json.mapper import CardMapper
+
+
+@dataclass
+class Item:
+    name: str
+    number: int
+    url: str
+
+
+def by_hand_items(items):
+    out = []
+    for item in items:
+        list_item = ListItem(item.name, f"{item.number}번")
+        list_item.set_link(item.url)
+        out.append(list_item)
+    return out
+
+
+def by_hand_cards(items):
+    out = []
+    for item in items:
+        out.append(BasicCard().set_title(item.name).set_image(item.url))
+    return out
+
+
+def bench(name, fn, items, repeat=20):
+    fn(items)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(items)
+    per_item = (time.perf_counter() - start) / repeat / len(items) * 1e9
+    print(f"{name:<24} {per_item:8.0f} ns/item")
+
+
+def main():
+    items = [Item(f"item {i}", i, f"https://example.com/{i}") for i in range(10000)]
+    to_item = CardMapper(ListItem, title="name", description=lambda o: f"{o.number}번", link="url")
+    to_card = CardMapper(BasicCard, title="name", thumbnail="url")
+
+    bench("ListItem by hand", by_hand_items, items)
+    bench("ListItem CardMapper", to_item.map, items)
+    bench("BasicCard by hand", by_hand_cards, items)
+    bench("BasicCard CardMapper", to_card.map, items)
+
+
+if __name__ == "__main__":
+    main()
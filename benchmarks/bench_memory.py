@@ -0,0 +1,224 @@
+"""Memory footprint of response trees and caches (tracemalloc)
+
+- tree: bytes / allocations held by one built Kakao, per card type and carousel size
+- to_json: transient peak while encoding one tree (above the tree itself)
+- cache: steady state bytes per entry of N cached responses (Kakao, JSON bytes, snapshot, Frozen)
+
+python benchmarks/bench_memory.py                          # table
+python benchmarks/bench_memory.py --json memory.json       # machine readable
+python benchmarks/bench_memory.py --compare memory.json    # exit 1 if a metric grew more than --tolerance
+
+Allocation sizes depend on the Python version, compare results from the same interpreter.
+"""
+
+import argparse
+import gc
+import os
+import platform
+import sys
+import tracemalloc
+
+import msgspec
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kakao_json import BasicCard, Button, CommerceCard, ItemCard, Kakao, ListCard, ListItem
+from kakao_json import snapshot
+from kakao_json.cache import TTLCache
+from kakao_json.components.cards import Head, ItemList
+from kakao_json.components.common import Thumbnail
+from kakao_json.kakao import Carousel
+from kakao_json.parallel import freeze
+
+CAROUSEL_SIZES = (1, 5, 10)
+COPIES = 200  # trees built per measurement, results are per tree
+CACHED = 1000
+
+
+def basic_card(i):
+    card = BasicCard().set_title(f"오늘의 메뉴 {i}").set_desc("제육볶음, 된장찌개").set_image(f"https://example.com/{i}.jpg")
+    card.add_button(Button("자세히", "webLink", webLinkUrl=f"https://example.com/menu/{i}"))
+    return card
+
+
+def commerce_card(i):
+    return CommerceCard(
+        f"상품 {i}", 10000 + i, "won", discount=1000,
+        thumbnails=[Thumbnail(f"https://example.com/p/{i}.jpg")],
+        buttons=[Button("구매하기", "webLink", webLinkUrl=f"https://example.com/buy/{i}")],
+    )
+
+
+def list_card(i):
+    card = ListCard().set_header(f"공지사항 {i}")
+    for j in range(5):
+        card.add_item(ListItem(f"[학사] 수강신청 안내 {j}", "2026.10.19").set_link(f"https://example.com/n/{i}/{j}"))
+    return card
+
+
+def item_card(i):
+    return ItemCard(
+        [ItemList("가격", f"{1000 + i:,}원"), ItemList("배송", "무료")],
+        head=Head(f"상품 {i}"),
+        title=f"상품 {i}",
+    )
+
+
+CARDS = {
+    "basicCard": basic_card,
+    "commerceCard": commerce_card,
+    "listCard": list_card,
+    "itemCard": item_card,
+}
+
+
+def build_carousel(card, size):
+    def build():
+        k = Kakao()
+        carousel = Carousel()
+        for i in range(size):
+            carousel.add_card(card(i))
+        k.add_output(carousel)
+        k.add_qr("처음으로")
+        return k
+
+    return build
+
+
+def build_text():
+    k = Kakao()
+    k.add_simple_text("안녕하세요! 무엇을 도와드릴까요?")
+    k.add_qr("처음으로")
+    return k
+
+
+def held(build, copies=COPIES):
+    """(bytes, allocations) held per object returned by build"""
+    build()  # warm caches (interned strings, type caches)
+    gc.collect()
+    before = tracemalloc.take_snapshot()
+    keep = [build() for _ in range(copies)]
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    stats = after.compare_to(before, "filename")
+    size = sum(s.size_diff for s in stats)
+    count = sum(s.count_diff for s in stats)
+    del keep
+    return size / copies, count / copies
+
+
+def encode_peak(tree):
+    """Transient peak bytes while encoding tree, and the size of the result"""
+    tree.to_json()
+    gc.collect()
+    tracemalloc.reset_peak()
+    current, _ = tracemalloc.get_traced_memory()
+    body = tree.to_json()
+    _, peak = tracemalloc.get_traced_memory()
+    return peak - current, len(body)
+
+
+def run():
+    results = {}
+    tracemalloc.start()
+    try:
+        builders = {"simpleText": build_text}
+        for name, card in CARDS.items():
+            for size in CAROUSEL_SIZES:
+                builders[f"{name} x{size}"] = build_carousel(card, size)
+
+        for name, build in builders.items():
+            size, count = held(build)
+            peak, body = encode_peak(build())
+            results[f"tree/{name}"] = {"bytes": round(size), "allocs": round(count)}
+            results[f"to_json/{name}"] = {"peak_bytes": peak, "json_bytes": body}
+
+        # steady state of a response cache: what is stored per entry
+        tree = build_carousel(basic_card, 10)()
+        body = tree.to_json()
+        snap = snapshot.dumps(tree)
+        stored = {
+            "kakao": lambda: build_carousel(basic_card, 10)(),
+            "json_bytes": lambda: bytes(bytearray(body)),
+            "snapshot": lambda: bytes(bytearray(snap)),
+            "frozen": lambda: freeze(tree),
+        }
+        for name, make in stored.items():
+
+            def fill(make=make):
+                cache = TTLCache(3600, maxsize=CACHED)
+                for i in range(CACHED):
+                    cache.set(i, make())
+                return cache
+
+            size, count = held(fill, copies=1)
+            results[f"cache/{name} x{CACHED}"] = {
+                "bytes_per_entry": round(size / CACHED),
+                "allocs_per_entry": round(count / CACHED, 1),
+            }
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "package": "kakao_json",
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "msgspec": msgspec.__version__,
+        "results": results,
+    }
+
+
+def compare(report, baseline, tolerance):
+    """Rows of (metric, old, new, change), and whether any grew beyond tolerance"""
+    rows, failed = [], False
+    for name, metrics in report["results"].items():
+        old_metrics = baseline["results"].get(name)
+        if old_metrics is None:
+            continue
+        for metric, new in metrics.items():
+            old = old_metrics.get(metric)
+            if not old:
+                continue
+            change = (new - old) / old
+            regressed = change > tolerance
+            failed |= regressed
+            rows.append((f"{name} {metric}", old, new, change, regressed))
+    return rows, failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON ('-' for stdout)")
+    parser.add_argument("--compare", metavar="PATH", help="baseline JSON from a previous --json run")
+    parser.add_argument("--tolerance", type=float, default=0.05, help="allowed growth (default 0.05 = 5%%)")
+    args = parser.parse_args(argv)
+
+    report = run()
+    encoded = msgspec.json.format(msgspec.json.encode(report), indent=2)
+    if args.json == "-":
+        sys.stdout.buffer.write(encoded + b"\n")
+    elif args.json:
+        with open(args.json, "wb") as f:
+            f.write(encoded + b"\n")
+
+    if args.compare:
+        with open(args.compare, "rb") as f:
+            baseline = msgspec.json.decode(f.read())
+        if baseline.get("python") != report["python"]:
+            print(f"warning: baseline is python {baseline.get('python')}, this is {report['python']}")
+        rows, failed = compare(report, baseline, args.tolerance)
+        for metric, old, new, change, regressed in rows:
+            if change:
+                print(f"{'REGRESSION ' if regressed else ''}{metric:<48} {old:>10} -> {new:<10} {change:+.1%}")
+        print("memory regression" if failed else f"no metric grew more than {args.tolerance:.0%}")
+        return 1 if failed else 0
+
+    if args.json != "-":
+        for name, metrics in report["results"].items():
+            values = "  ".join(f"{k} {v:>8}" for k, v in metrics.items())
+            print(f"{name:<32} {values}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
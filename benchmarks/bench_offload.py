@@ -0,0 +1,91 @@
+"""Event loop responsiveness while rendering big catalogs, inline vs Offloader
+
+A ticker asks for a 1ms sleep in a loop and records how late it wakes up,
+that delay is what every other user waits while a render holds the loop.
+
+python benchmarks/bench_offload.py
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kakao_json import ItemCard, Kakao
+from kakao_json.components.cards import Head, ItemList
+from kakao_json.kakao import Carousel
+from kakao_json.loadtest import percentile
+from kakao_json.offload import Offloader
+
+RENDERS = 40
+
+
+def render_catalog(names: list[str], prices: list[int]) -> Kakao:
+    """~300 ItemCards in carousels of 10"""
+    k = Kakao()
+    for start in range(0, len(names), 10):
+        carousel = Carousel()
+        for name, price in zip(names[start : start + 10], prices[start : start + 10]):
+            carousel.add_card(
+                ItemCard(
+                    [ItemList("가격", f"{price:,}원"), ItemList("할인가", f"{price * 9 // 10:,}원"), ItemList("배송", "무료")],
+                    head=Head(name),
+                    title=name,
+                    description=f"{name} 상품 설명",
+                )
+            )
+        k.add_output(carousel)
+    body = k.to_json()
+    # extra CPU: sorting and re-encoding like a real search result page
+    for _ in range(30):
+        sorted(zip(prices, names))
+        k.to_json()
+    return body
+
+
+async def ticker(lags, stop):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append(time.perf_counter() - start - 0.001)
+
+
+async def run(render, label):
+    names = [f"상품 {i}" for i in range(300)]
+    prices = [1000 + i * 37 for i in range(300)]
+    lags: list[float] = []
+    stop = asyncio.Event()
+    tick = asyncio.ensure_future(ticker(lags, stop))
+    start = time.perf_counter()
+    await asyncio.gather(*(render(names, prices) for _ in range(RENDERS)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await tick
+    lags.sort()
+    print(
+        f"{label:<10} {elapsed * 1000:7.0f} ms total"
+        f"  loop lag p50 {percentile(lags, 50) * 1000:6.2f} ms"
+        f"  p99 {percentile(lags, 99) * 1000:6.2f} ms  max {lags[-1] * 1000:6.2f} ms"
+    )
+
+
+async def main():
+    async def inline(names, prices):
+        await asyncio.sleep(0)
+        return render_catalog(names, prices)
+
+    await run(inline, "inline")
+
+    workers = min(4, os.cpu_count() or 1)
+    offloader = Offloader(max_workers=workers).register(render_catalog)
+    start = time.perf_counter()
+    await offloader.start()
+    print(f"warm start of {workers} workers: {(time.perf_counter() - start) * 1000:.0f} ms")
+    await run(lambda names, prices: offloader.render(render_catalog, names, prices), "offload")
+    offloader.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
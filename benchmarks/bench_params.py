@@ -0,0 +1,62 @@
+"""ParamParser vs json.loads per parameter (request already decoded)
+
+python benchmarks/bench_params.py
+"""
+
+import datetime
+import json
+import os
+import sys
+import time
+
+import msgspec
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kakao_json.params import ParamParser
+from kakao_json.skill import decode_request
+
+PLUGIN_DATE = '{"value":"2026-10-19","userTimeZone":"UTC+9","date":"2026-10-19","dateTag":"today","dateHeadword":null}'
+PLUGIN_TIME = '{"value":"15:30:00","userTimeZone":"UTC+9","time":"15:30:00","hour":3,"minute":30,"second":null,"timeHeadword":"pm"}'
+
+
+def by_hand(req):
+    details = req.action.detailParams
+    day = json.loads(details["day"].value)
+    at = json.loads(details["at"].value)
+    return {
+        "day": datetime.date.fromisoformat(day["value"]),
+        "at": datetime.time.fromisoformat(at["value"]),
+        "count": int(details["count"].value),
+        "place": details["place"].value,
+    }
+
+
+def main():
+    req = decode_request(
+        msgspec.json.encode(
+            {
+                "action": {
+                    "detailParams": {
+                        "day": {"origin": "오늘", "value": PLUGIN_DATE},
+                        "at": {"origin": "오후 3시 반", "value": PLUGIN_TIME},
+                        "count": {"origin": "3", "value": "3"},
+                        "place": {"origin": "강남구", "value": "강남구"},
+                    }
+                }
+            }
+        )
+    )
+    parser = ParamParser(day="sys.plugin.date", at="sys.plugin.time", count="sys.number", place="sys.location")
+
+    for name, fn in (("json.loads", lambda: by_hand(req)), ("ParamParser", lambda: parser.parse(req))):
+        fn()
+        n = 100000
+        start = time.perf_counter()
+        for _ in range(n):
+            fn()
+        print(f"{name:<12} {(time.perf_counter() - start) / n * 1e6:6.2f} us/request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""RateLimiter.allow overhead with many distinct users
+
+python benchmarks/bench_ratelimit.py [distinct users] [calls]
+
+The clock is simulated so the calls span a few generations: the tail (p99, max)
+includes the calls that rotate and free expired generations.
+"""
+
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kakao_json.ratelimit import RateLimiter
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def main():
+    users = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    calls = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000_000
+    rng = random.Random(0)
+    ids = ["%064x" % rng.getrandbits(256) for _ in range(users)]
+    keys = [ids[rng.randrange(users)] for _ in range(calls)]
+
+    clock = Clock()
+    limiter = RateLimiter(rate=5, per=10, burst=3, clock=clock)
+    tracemalloc.start()
+    for key in ids:
+        limiter.allow(key)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"users {len(limiter)}, limiter memory ~{size / len(limiter):.0f} B/user (excluding key strings)")
+
+    # 4 generations over the calls
+    step = limiter.generation * 4 / calls
+    allow = limiter.allow
+    timer = time.perf_counter_ns
+    latencies = [0] * calls
+    started = time.perf_counter()
+    for i, key in enumerate(keys):
+        clock.now += step
+        t = timer()
+        allow(key)
+        latencies[i] = timer() - t
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    p50 = latencies[calls // 2] / 1000
+    p99 = latencies[min(calls - 1, calls * 99 // 100)] / 1000
+    p999 = latencies[min(calls - 1, calls * 999 // 1000)] / 1000
+    worst = latencies[-1] / 1000
+    print(f"allow(): {elapsed / calls * 1e6:.3f} us/call (loop included) over {calls} calls, limited {limiter.limited}")
+    print(f"latency: p50 {p50:.2f} us  p99 {p99:.2f} us  p99.9 {p999:.2f} us  max {worst:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""KeywordRouter (Aho-Corasick) vs linear `in` scan at 10, 1k, 100k keywords
+
+python benchmarks/bench_router.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kakao_json.router import KeywordRouter, normalize
+
+
+def handler(req):
+    return None
+
+
+def linear(keywords, utterance):
+    text = normalize(utterance)
+    best = None
+    for keyword in keywords:
+        if keyword in text and (best is None or len(keyword) > len(best)):
+            best = keyword
+    return best
+
+
+def main():
+    rng = random.Random(0)
+    syllables = [chr(0xAC00 + rng.randrange(11172)) for _ in range(400)]
+    utterances = [
+        " ".join("".join(rng.choices(syllables, k=rng.randint(1, 4))) for _ in range(rng.randint(2, 6)))
+        for _ in range(2000)
+    ]
+
+    print(f"{'keywords':>9} {'compile':>10} {'router':>12} {'linear scan':>13}")
+    for n in (10, 1_000, 100_000):
+        keywords = list({"".join(rng.choices(syllables, k=rng.randint(2, 5))) for _ in range(n)})
+        router = KeywordRouter()
+        for keyword in keywords:
+            router.add(keyword, handler)
+
+        started = time.perf_counter()
+        router.compile()
+        compiled = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for u in utterances:
+            router.match(u)
+        routed = (time.perf_counter() - started) / len(utterances)
+
+        sample = utterances[: max(10, 20000 // n)]
+        normalized = [normalize(k) for k in keywords]
+        started = time.perf_counter()
+        for u in sample:
+            linear(normalized, u)
+        scanned = (time.perf_counter() - started) / len(sample)
+
+        print(
+            f"{len(keywords):>9} {compiled * 1000:>8.1f}ms {routed * 1e6:>10.2f}us {scanned * 1e6:>11.2f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""SearchIndex query latency at 100k entries vs brute-force Levenshtein
+
+python benchmarks/bench_search.py [entries]
+
+Per query type: mean / p50 / p99 / max latency of search() (ms), and how often the
+top result matches an index that counts every gram (no candidate pruning).
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kakao_json.search import SearchIndex, choseong, decompose
+
+
+def levenshtein(a, b):
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i]
+        for j, cb in enumerate(b, 1):
+            cur.append(min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb)))
+        prev = cur
+    return prev[-1]
+
+
+def typo(rng, text):
+    chars = list(text)
+    i = rng.randrange(len(chars))
+    if "가" <= chars[i] <= "힣":
+        chars[i] = chr(ord(chars[i]) + rng.choice([-1, 1, 28, -28]))
+    return "".join(chars)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = random.Random(0)
+    words = ["".join(chr(0xAC00 + rng.randrange(11172)) for _ in range(rng.randint(2, 3))) for _ in range(3000)]
+    titles = [" ".join(rng.choices(words, k=rng.randint(2, 4))) for _ in range(n)]
+
+    index = SearchIndex()
+    started = time.perf_counter()
+    for i, title in enumerate(titles):
+        index.add(title, link=f"https://example.com/{i}")
+    print(f"entries {n}, build {time.perf_counter() - started:.2f}s")
+
+    targets = [rng.choice(titles) for _ in range(500)]
+    queries = {
+        "exact word": [t.split()[0] for t in targets],
+        "typo": [typo(rng, t.split()[0]) for t in targets],
+        "full title typo": [typo(rng, t) for t in targets],
+        "choseong": [choseong(t.split()[0]) for t in targets],
+    }
+    def exhaustive(q):
+        budget, index.budget = index.budget, sys.maxsize
+        try:
+            return index.search_ids(q, 1)
+        finally:
+            index.budget = budget
+
+    print(f"{'':<16} {'mean':>8} {'p50':>8} {'p99':>8} {'max':>8}  top1 = exhaustive")
+    for name, qs in queries.items():
+        latencies = []
+        for q in qs:
+            started = time.perf_counter()
+            index.search(q)
+            latencies.append((time.perf_counter() - started) * 1000)
+        latencies.sort()
+        same = sum(index.search_ids(q, 1) == exhaustive(q) for q in qs) / len(qs)
+        print(
+            f"{name:<16} {sum(latencies) / len(qs):8.3f} {latencies[len(qs) // 2]:8.3f} "
+            f"{latencies[len(qs) * 99 // 100]:8.3f} {latencies[-1]:8.3f}  {same:.1%}"
+        )
+
+    jamo = [decompose(t) for t in titles]
+    sample = queries["typo"][:3]
+    started = time.perf_counter()
+    for q in sample:
+        qj = decompose(q)
+        sorted(range(n), key=lambda i: levenshtein(qj, jamo[i]))[:5]
+    print(f"{'brute levenshtein':<16} {(time.perf_counter() - started) / len(sample) * 1000:8.1f} ms/query")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""snapshot (msgpack) vs JSON for representative carousels: size, encode, decode
+
+JSON decode can only return plain dicts (the output unions can not be decoded to structs),
+snapshot.loads returns a Kakao ready for to_json().
+
+python benchmarks/bench_snapshot.py
+"""
+
+import gzip
+import os
+import sys
+import time
+
+import msgspec
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kakao_json import BasicCard, Button, CommerceCard, Kakao, ListCard, ListItem
+from kakao_json.components.common import Thumbnail
+from kakao_json.kakao import Carousel
+from kakao_json import snapshot
+
+
+def basic_carousel():
+    k = Kakao()
+    carousel = Carousel()
+    for i in range(10):
+        card = BasicCard().set_title(f"오늘의 메뉴 {i}").set_desc("제육볶음, 된장찌개, 김치").set_image(
+            f"https://example.com/images/menu/{i}.jpg"
+        )
+        card.add_button(Button("자세히", "webLink", webLinkUrl=f"https://example.com/menu/{i}"))
+        card.add_button(Button("공유", "share"))
+        carousel.add_card(card)
+    k.add_output(carousel)
+    for label in ("학식", "공지", "처음으로"):
+        k.add_qr(label)
+    return k
+
+
+def list_cards():
+    k = Kakao()
+    carousel = Carousel()
+    for c in range(5):
+        card = ListCard().set_header(f"공지사항 {c}")
+        for i in range(5):
+            card.add_item(
+                ListItem(f"[학사] 2026학년도 수강신청 안내 {i}", "2026.10.19").set_link(
+                    f"https://example.com/notice/{c}/{i}"
+                )
+            )
+        card.add_button(Button("더보기", "webLink", webLinkUrl="https://example.com/notice"))
+        carousel.add_card(card)
+    k.add_output(carousel)
+    return k
+
+
+def commerce_carousel():
+    k = Kakao()
+    carousel = Carousel()
+    for i in range(10):
+        carousel.add_card(
+            CommerceCard(
+                f"상품 {i}", 10000 + i * 500, "won", discount=1000,
+                thumbnails=[Thumbnail(f"https://example.com/p/{i}.jpg")],
+                buttons=[Button("구매하기", "webLink", webLinkUrl=f"https://example.com/buy/{i}")],
+            )
+        )
+    k.add_output(carousel)
+    return k
+
+
+def timeit(fn, repeat=20000):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    json_decode = msgspec.json.Decoder().decode
+    print(f"{'':<20}{'bytes':>14}{'gzip':>12}{'encode us':>16}{'decode us':>16}")
+    for name, build in (("basicCard x10", basic_carousel), ("listCard x5", list_cards), ("commerceCard x10", commerce_carousel)):
+        k = build()
+        js = k.to_json()
+        snap = snapshot.dumps(k)
+        assert snapshot.loads(snap).to_json() == js
+        print(
+            f"{name:<20}"
+            f"{len(js):>6} -> {len(snap):<5}"
+            f"{len(gzip.compress(js)):>5} -> {len(gzip.compress(snap)):<5}"
+            f"{timeit(k.to_json):>7.2f} -> {timeit(lambda: snapshot.dumps(k)):<6.2f}"
+            f"{timeit(lambda: json_decode(js)):>7.2f} -> {timeit(lambda: snapshot.loads(snap)):<6.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
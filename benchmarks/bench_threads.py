@@ -0,0 +1,69 @@
+"""Thread scaling of encode_many and per-thread building, 1 .. N threads
+
+python benchmarks/bench_threads.py [responses] [max threads]
+
+GIL 빌드에서는 thread 가 늘어도 빨라지지 않습니다. free-threaded (3.13t) 빌드에서 비교하세요.
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kakao_json import BasicCard, Kakao, ListItem
+from kakao_json.parallel import encode_many
+
+
+def build(i):
+    k = Kakao()
+    k.add_qr("처음으로")
+    list_card = k.init_list_card().set_header(f"공지 {i}")
+    for j in range(5):
+        list_card.add_item(ListItem(f"공지 {i}-{j}").set_desc("설명").set_link("https://naver.com"))
+    k.add_output(list_card)
+    carousel = k.init_carousel()
+    for j in range(10):
+        carousel.add_card(BasicCard().set_title(f"메뉴 {j}").set_image("https://img"))
+    k.add_output(carousel)
+    return k
+
+
+def best_of(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    max_threads = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 4)
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"python {sys.version.split()[0]}, GIL enabled: {gil}, responses: {n}")
+
+    items = [build(i) for i in range(n)]
+    print(f"{'threads':>7} {'encode/s':>12} {'speedup':>8} {'build+encode/s':>15} {'speedup':>8}")
+    base_enc = base_build = None
+    threads = 1
+    while threads <= max_threads:
+        with ThreadPoolExecutor(threads) as pool:
+            enc = best_of(lambda: encode_many(items, chunk_size=256, executor=pool))
+            chunks = [range(i, min(i + 256, n)) for i in range(0, n, 256)]
+            both = best_of(
+                lambda: list(pool.map(lambda r: [build(i).to_json() for i in r], chunks))
+            )
+        base_enc = base_enc or enc
+        base_build = base_build or both
+        print(
+            f"{threads:>7} {n / enc:>12.0f} {base_enc / enc:>7.2f}x"
+            f" {n / both:>15.0f} {base_build / both:>7.2f}x"
+        )
+        threads *= 2
+
+
+if __name__ == "__main__":
+    main()
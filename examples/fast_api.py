@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Dict, Union
 
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 import sys
@@ -11,7 +11,9 @@ import os
 # Add the root directory to sys.path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from kakao_json import Button, Kakao, ListItem
+from kakao_json import BasicCard, Button, Kakao, ListItem
+from kakao_json.mapper import CardMapper, const
+from kakao_json.skill import decode_request
 
 app = FastAPI(title="FastAPI kakao-py example", version="1.0.0")
 app.add_middleware(
@@ -55,11 +57,13 @@ def read_item():
         ListItem("title").set_desc("description").set_link("https://naver.com")
     )
 
-    carousel = k.init_carousel()
-    for i in range(5):
-        basic_card = k.init_basic_card()
-        basic_card.set_title(f"Hey {i}").set_image("https://kakao")
-        carousel.add_card(basic_card)
+    # python objects -> cards, the mapping is compiled once for Item
+    carousel = CardMapper(
+        BasicCard,
+        title="name",
+        description=lambda item: f"number {item.number}",
+        thumbnail=const("https://kakao"),
+    ).carousel(items)
 
     k.add_output(list_card)
     k.add_output(carousel)
@@ -70,5 +74,24 @@ def read_item():
     return k.to_json()
 
 
+@app.post("/skill")
+async def skill(request: Request):
+    # python -m kakao_json.loadtest examples.fast_api:app --path /skill
+    req = decode_request(await request.body())
+
+    k = Kakao()
+    k.add_simple_text(f"{req.userRequest.utterance} 결과입니다.")
+    k.add_qr("처음으로")
+
+    list_card = k.init_list_card().set_header(req.userRequest.block.name or "공지")
+    for i in range(5):
+        list_card.add_item(
+            ListItem(f"공지 {i}").set_desc("description").set_link("https://naver.com")
+        )
+    k.add_output(list_card)
+
+    return Response(k.to_json(), media_type="application/json")
+
+
 if __name__ == "__main__":
     uvicorn.run(app)
@@ -0,0 +1,45 @@
+"""HTTP/1.1 response parsing shared by ImageProbe and loadtest"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Optional
+
+__all__ = ["read_chunk", "read_head"]
+
+
+async def read_head(
+    reader: asyncio.StreamReader, status_line: Optional[bytes] = None
+) -> tuple[int, dict[str, str]]:
+    """Read the status line and headers, returns (status, lower-cased headers)
+
+    HTTP/1.0 응답은 keep-alive 가 아니면 `connection: close` 로 취급합니다.
+    """
+    if status_line is None:
+        status_line = await reader.readline()
+    if not status_line:
+        raise EOFError("connection closed")
+    parts = status_line.split(None, 2)
+    if len(parts) < 2 or not parts[0].startswith(b"HTTP/"):
+        raise ValueError("invalid HTTP response")
+    headers: dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    if parts[0] == b"HTTP/1.0" and headers.get("connection", "").lower() != "keep-alive":
+        headers["connection"] = "close"
+    return int(parts[1]), headers
+
+
+async def read_chunk(reader: asyncio.StreamReader) -> bytes:
+    """Read one chunk of a chunked body, b"" after the last chunk (trailer included)"""
+    size = int((await reader.readline()).split(b";")[0], 16)
+    if size == 0:
+        await reader.readline()
+        return b""
+    data = await reader.readexactly(size)
+    await reader.readline()
+    return data
@@ -0,0 +1,19 @@
+"""msgpack decoders shared by snapshot and state"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import msgspec
+
+__all__ = ["decoder"]
+
+_decoders: dict[Any, msgspec.msgpack.Decoder] = {}
+
+
+def decoder(type: Any) -> msgspec.msgpack.Decoder:
+    """msgpack Decoder for type, created once per type"""
+    dec = _decoders.get(type)
+    if dec is None:
+        dec = _decoders[type] = msgspec.msgpack.Decoder(type)
+    return dec
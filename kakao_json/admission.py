@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import Callable, Union
+
+from msgspec import Struct
+
+from .kakao import Kakao
+from .skill import Handler, SkillRequest, encode_response, text_response
+
+__all__ = ["AdmissionController", "AdmissionMetrics", "busy_text"]
+
+
+def busy_text(text: str = "지금 요청이 많아 처리할 수 없어요. 잠시 후 다시 시도해주세요.") -> bytes:
+    """SimpleText response for shed requests"""
+    return text_response(text)
+
+
+class AdmissionMetrics(Struct):
+    """Snapshot of an AdmissionController, `msgspec.json.encode(metrics)` to export"""
+
+    active: int
+    queued: int
+    limit: int
+    admitted: int
+    completed: int
+    shed_full: int  # queue was full
+    shed_deadline: int  # estimated wait + service time over the deadline
+    shed_timeout: int  # waited in the queue until the deadline
+    service_time: float  # moving average (seconds)
+    estimated_wait: float
+    shed_rate: float  # shed / (admitted + shed)
+
+
+class AdmissionController:
+    """# AdmissionController
+
+    handler 동시 실행 수를 limit 개로 제한하고, 나머지는 크기가 정해진 queue 에서 기다리게 합니다.
+
+    queue 대기 시간은 (대기 순서 / limit) x 평균 처리 시간으로 추정하고,
+
+    대기 + 처리가 deadline 안에 끝나지 않을 요청은 기다리지 않고 바로 미리 encode 해둔 "busy" 응답을 받습니다.
+
+    몰리는 시간 (수강 신청 등)에 모든 요청이 같이 timeout 되는 대신, 받은 요청은 제 시간에 처리합니다.
+
+    ## Parameters
+
+    limit: 동시에 실행할 handler 수
+
+    queue_size: 기다릴 수 있는 요청 수
+
+    deadline: 요청을 받고 응답해야 하는 시간 (초, 카카오는 5초)
+
+    response: 거절한 요청에 보낼 Kakao 혹은 bytes
+
+    ## Example
+
+    ```python
+    admission = AdmissionController(limit=32, queue_size=256)
+    handler = admission.wrap(handler)
+
+    @app.get("/metrics")
+    async def metrics():
+        return Response(msgspec.json.encode(admission.metrics()), media_type="application/json")
+    ```
+    """
+
+    def __init__(
+        self,
+        limit: int = 32,
+        queue_size: int = 256,
+        deadline: float = 4.5,
+        response: Union[Kakao, bytes, None] = None,
+        service_time: float = 0.05,
+        alpha: float = 0.1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if limit < 1 or queue_size < 0 or deadline <= 0:
+            raise Exception("limit must be at least 1, queue_size non negative and deadline positive")
+        self.limit = limit
+        self.queue_size = queue_size
+        self.deadline = deadline
+        self.response = encode_response(busy_text() if response is None else response)
+        self.service_time = service_time
+        self.alpha = alpha
+        self.clock = clock
+        self.active = 0
+        self.admitted = 0
+        self.completed = 0
+        self.shed_full = 0
+        self.shed_deadline = 0
+        self.shed_timeout = 0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    def estimated_wait(self, position: int = 0) -> float:
+        """Estimated queue wait (seconds) of the position-th waiter"""
+        if self.active < self.limit and not self._waiters:
+            return 0.0
+        return (position + 1) * self.service_time / self.limit
+
+    async def acquire(self) -> bool:
+        """Wait for a slot, False if the request should be shed"""
+        waiters = self._waiters
+        if self.active < self.limit and not waiters:
+            self.active += 1
+            self.admitted += 1
+            return True
+        if len(waiters) >= self.queue_size:
+            self.shed_full += 1
+            return False
+        wait = self.estimated_wait(len(waiters))
+        if wait + self.service_time > self.deadline:
+            self.shed_deadline += 1
+            return False
+
+        future = asyncio.get_running_loop().create_future()
+        waiters.append(future)
+        try:
+            # the slot is handed over by release(), active is not changed here
+            await asyncio.wait_for(future, self.deadline - self.service_time)
+        except asyncio.TimeoutError:
+            if future.done() and not future.cancelled():
+                # handed the slot in the same tick as the timeout (3.12+), pass it on
+                self.release()
+            else:
+                self._remove(future)
+            self.shed_timeout += 1
+            return False
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release()  # got the slot but nobody will use it
+            else:
+                self._remove(future)
+            raise
+        self.admitted += 1
+        return True
+
+    def release(self, elapsed: float = -1.0) -> None:
+        """Give the slot back (to the next waiter), elapsed updates the service time average"""
+        if elapsed >= 0:
+            self.completed += 1
+            self.service_time += self.alpha * (elapsed - self.service_time)
+        waiters = self._waiters
+        while waiters:
+            future = waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                return
+        self.active -= 1
+
+    def _remove(self, future: asyncio.Future) -> None:
+        try:
+            self._waiters.remove(future)
+        except ValueError:
+            pass
+
+    def wrap(self, handler: Handler) -> Handler:
+        """Wrap a handler, shed requests get the busy response without running it"""
+
+        async def admitted(request: SkillRequest) -> Union[Kakao, bytes]:
+            if not await self.acquire():
+                return self.response
+            start = self.clock()
+            try:
+                return await handler(request)
+            finally:
+                self.release(self.clock() - start)
+
+        return admitted
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    @property
+    def shed(self) -> int:
+        return self.shed_full + self.shed_deadline + self.shed_timeout
+
+    def metrics(self) -> AdmissionMetrics:
+        shed = self.shed
+        total = self.admitted + shed
+        return AdmissionMetrics(
+            active=self.active,
+            queued=self.queued,
+            limit=self.limit,
+            admitted=self.admitted,
+            completed=self.completed,
+            shed_full=self.shed_full,
+            shed_deadline=self.shed_deadline,
+            shed_timeout=self.shed_timeout,
+            service_time=self.service_time,
+            estimated_wait=self.estimated_wait(self.queued),
+            shed_rate=shed / total if total else 0.0,
+        )
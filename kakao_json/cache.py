@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+__all__ = ["TTLCache"]
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class TTLCache(Generic[K, V]):
+    """# TTLCache
+
+    만료 시간(TTL)을 갖는 작은 in-memory 캐시입니다.
+
+    만료된 값은 조회할 때 지워지고, maxsize를 넘으면 가장 오래 전에 저장된 값부터 지웁니다.
+
+    thread-safe 하지 않으므로 하나의 event loop 혹은 하나의 thread 안에서 사용하세요.
+
+    ## Parameters
+
+    ttl: 기본 만료 시간 (초)
+
+    maxsize: 최대 저장 개수
+
+    clock: 시간 함수, 기본값 time.monotonic
+    """
+
+    __slots__ = ("ttl", "maxsize", "clock", "_data")
+
+    def __init__(
+        self,
+        ttl: float,
+        maxsize: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if ttl <= 0:
+            raise Exception("ttl must be positive")
+        if maxsize <= 0:
+            raise Exception("maxsize must be positive")
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.clock = clock
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires, value = entry
+        if expires <= self.clock():
+            del self._data[key]
+            return default
+        return value
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        data = self._data
+        data[key] = (self.clock() + (self.ttl if ttl is None else ttl), value)
+        data.move_to_end(key)
+        while len(data) > self.maxsize:
+            data.popitem(last=False)
+
+    def pop(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        entry = self._data.pop(key, _MISSING)
+        if entry is _MISSING:
+            return default
+        expires, value = entry  # type: ignore
+        return value if expires > self.clock() else default
+
+    def expire(self) -> int:
+        """Drop every expired entry, returns the number of dropped entries"""
+        now = self.clock()
+        dead = [key for key, (expires, _) in self._data.items() if expires <= now]
+        for key in dead:
+            del self._data[key]
+        return len(dead)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __contains__(self, key: K) -> bool:
+        return self.get(key, _MISSING) is not _MISSING  # type: ignore
+
+    def __len__(self) -> int:
+        return len(self._data)
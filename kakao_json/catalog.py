@@ -0,0 +1,181 @@
+"""# catalog
+
+상품 목록 (수천 개의 SKU)을 한 번에 CommerceCard 로 만듭니다.
+
+가격 계산은 NumPy 가 설치되어 있으면 vectorized 로, 없으면 순수 Python 으로 합니다.
+
+각 column 은 NumPy array, list, tuple 모두 가능하며 값이 없는 칸은 None 혹은 NaN 입니다.
+
+## 가격 규칙 (CommerceCard 문서 기준)
+
+- discountedPrice 가 있으면 그대로 사용합니다.
+- 없으면 discountRate 로 계산하고 (price * (100 - rate) / 100), 그것도 없으면 price - discount 입니다.
+- discountRate 은 discountedPrice 가 있어야 노출되므로, 할인가를 알 수 있으면 항상 discountedPrice 를 채웁니다.
+- fill_rate=True 이면 discountRate 이 없는 할인 상품에 할인율을 계산해서 채웁니다. (discountRate 이 discount 보다 우선 노출)
+- 할인가는 0 이상 price 이하로, discountRate 은 0 이상 100 이하로 맞춥니다.
+- 소수 값은 계산 전에 정수로 반올림합니다. (round half to even, NumPy 와 순수 Python 결과가 같습니다)
+
+```python
+cards = commerce_cards(
+    description=df["name"].to_numpy(),
+    price=df["price"].to_numpy(),
+    discount_rate=df["rate"].to_numpy(),  # NaN = 할인 없음
+    image_url=df["image"].to_numpy(),
+)
+carousels = commerce_carousels(**catalog)  # 10개씩 나눈 Carousel
+```
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional, Sequence
+
+from .components.cards import CommerceCard
+from .components.common import Thumbnail
+from .kakao import Carousel
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+__all__ = ["commerce_prices", "commerce_cards", "commerce_carousels"]
+
+Column = Any  # numpy.ndarray | Sequence
+
+
+def _present(value: Any) -> bool:
+    return value is not None and value == value  # NaN != NaN
+
+
+def _prices_python(price, discount, rate, discounted, fill_rate):
+    n = len(price)
+    discount = [None] * n if discount is None else list(discount)
+    rate = [None] * n if rate is None else list(rate)
+    discounted = [None] * n if discounted is None else list(discounted)
+
+    out_price, out_discount, out_rate, out_dp = [], [], [], []
+    for p, d, r, dp in zip(price, discount, rate, discounted):
+        p = int(round(p))
+        d = int(round(d)) if _present(d) else None
+        r = min(max(int(round(r)), 0), 100) if _present(r) else None
+        if _present(dp):
+            dp = int(round(dp))
+        elif r is not None:
+            dp = int(round(p * (100 - r) / 100))
+        elif d is not None:
+            dp = p - d
+        else:
+            dp = None
+        if dp is not None:
+            dp = min(max(dp, 0), p)
+            if r is None and fill_rate and p > 0 and dp < p:
+                r = int(round((p - dp) * 100 / p))
+        out_price.append(p)
+        out_discount.append(d)
+        out_rate.append(r)
+        out_dp.append(dp)
+    return out_price, out_discount, out_rate, out_dp
+
+
+def _nullable(values, mask) -> list:
+    """values.tolist() with None where mask is False"""
+    if mask.all():
+        return values.tolist()
+    return [v if m else None for v, m in zip(values.tolist(), mask.tolist())]
+
+
+def _prices_numpy(price, discount, rate, discounted, fill_rate):
+    price = np.rint(np.asarray(price, dtype=np.float64))
+    n = price.shape[0]
+    nan = np.full(n, np.nan)
+    discount = nan if discount is None else np.rint(np.asarray(discount, dtype=np.float64))
+    rate = nan if rate is None else np.clip(np.rint(np.asarray(rate, dtype=np.float64)), 0, 100)
+    discounted = nan if discounted is None else np.asarray(discounted, dtype=np.float64)
+
+    has_discount = ~np.isnan(discount)
+    has_rate = ~np.isnan(rate)
+    dp = np.where(
+        ~np.isnan(discounted),
+        np.rint(discounted),
+        np.where(has_rate, np.rint(price * (100 - rate) / 100), price - discount),
+    )
+    has_dp = ~np.isnan(dp)
+    dp = np.clip(dp, 0, price)
+
+    if fill_rate:
+        safe = np.where(price > 0, price, 1)
+        computed = np.rint((price - dp) * 100 / safe)
+        fill = ~has_rate & has_dp & (price > 0) & (dp < price)
+        rate = np.where(fill, computed, rate)
+        has_rate = has_rate | fill
+
+    int_ = np.int64
+    return (
+        price.astype(int_).tolist(),
+        _nullable(np.where(has_discount, discount, 0).astype(int_), has_discount),
+        _nullable(np.where(has_rate, rate, 0).astype(int_), has_rate),
+        _nullable(np.where(has_dp, dp, 0).astype(int_), has_dp),
+    )
+
+
+def commerce_prices(
+    price: Column,
+    discount: Optional[Column] = None,
+    discount_rate: Optional[Column] = None,
+    discounted_price: Optional[Column] = None,
+    fill_rate: bool = True,
+) -> tuple[list[int], list[Optional[int]], list[Optional[int]], list[Optional[int]]]:
+    """Returns (price, discount, discountRate, dicountedPrice) columns as python lists"""
+    columns = (price, discount, discount_rate, discounted_price)
+    lengths = {len(c) for c in columns if c is not None}
+    if len(lengths) > 1:
+        raise Exception("every column must have the same length")
+    if np is not None:
+        return _prices_numpy(price, discount, discount_rate, discounted_price, fill_rate)
+    return _prices_python(price, discount, discount_rate, discounted_price, fill_rate)
+
+
+def commerce_cards(
+    description: Column,
+    price: Column,
+    discount: Optional[Column] = None,
+    discount_rate: Optional[Column] = None,
+    discounted_price: Optional[Column] = None,
+    image_url: Optional[Column] = None,
+    currency: str = "won",
+    fill_rate: bool = True,
+) -> list[CommerceCard]:
+    """Build one CommerceCard per row"""
+    if currency != "won":
+        raise Exception("Currently only supports 'won'")
+    prices, discounts, rates, dps = commerce_prices(
+        price, discount, discount_rate, discounted_price, fill_rate
+    )
+    descriptions = description.tolist() if hasattr(description, "tolist") else description
+    if len(descriptions) != len(prices):
+        raise Exception("every column must have the same length")
+
+    if image_url is None:
+        return [
+            CommerceCard(str(desc), p, currency, d, r, dp)
+            for desc, p, d, r, dp in zip(descriptions, prices, discounts, rates, dps)
+        ]
+    urls = image_url.tolist() if hasattr(image_url, "tolist") else image_url
+    return [
+        CommerceCard(
+            str(desc), p, currency, d, r, dp, [Thumbnail(url)] if url else []
+        )
+        for desc, p, d, r, dp, url in zip(descriptions, prices, discounts, rates, dps, urls)
+    ]
+
+
+def commerce_carousels(*args: Any, size: int = 10, **kwargs: Any) -> list[Carousel]:
+    """Same parameters as commerce_cards, returns carousels of at most size cards"""
+    if not 0 < size <= 10:
+        raise Exception("carousel size must be between 1 and 10")
+    cards: Sequence[CommerceCard] = commerce_cards(*args, **kwargs)
+    return [
+        Carousel("commerceCard", list(cards[i : i + size]))
+        for i in range(0, len(cards), size)
+    ]
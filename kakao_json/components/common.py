@@ -60,7 +60,7 @@ class Profile(Struct, omit_defaults=True):
         height: Optional[int] = None,
     ) -> Profile:
         self.title = title
-        self.url = url
+        self.imageUrl = url
         self.width = width
         self.height = height
 
@@ -221,6 +221,11 @@ class ListItem(Struct, omit_defaults=True):
             self.link.mobile = url
         return self
 
+    def set_extra(self, extra: Mapping[str, Any]) -> ListItem:
+        """블록 호출시 스킬 서버에 전달할 정보 (action.clientExtra)"""
+        self.extra = extra
+        return self
+
 
 class Button(Struct, omit_defaults=True):
     """# Button
@@ -323,6 +328,11 @@ class Button(Struct, omit_defaults=True):
         self.action = "operator"
         return self
 
+    def set_extra(self, extra: Mapping[str, Any]) -> Button:
+        """블록 호출시 스킬 서버에 전달할 정보 (action.clientExtra)"""
+        self.extra = extra
+        return self
+
     def set_thumbnail(self, thumbnail: Thumbnail) -> Button:
         self.thumbnail = thumbnail
         return self
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+from typing import Any, Awaitable, Callable, Optional, Union
+
+from .kakao import Kakao
+
+__all__ = ["Composer", "Slot"]
+
+Source = Union[Awaitable[Any], Callable[[], Awaitable[Any]]]
+
+
+class Slot:
+    """# Slot
+
+    Composer 의 출력 자리 하나입니다.
+
+    ## Attributes:
+        - source: coroutine 혹은 coroutine 함수, 카드/Carousel/SimpleText 등 output (혹은 list, None)을 반환
+
+        - timeout: float, 이 자리의 timeout (초)
+
+        - placeholder: 시간 초과나 예외시 대신 넣을 output (str 이면 SimpleText), None 이면 자리를 뺍니다.
+
+        - error: BaseException, build() 이후 실패한 이유 (TimeoutError 포함)
+    """
+
+    __slots__ = ("source", "timeout", "placeholder", "error")
+
+    def __init__(
+        self, source: Source, timeout: Optional[float] = None, placeholder: Any = None
+    ):
+        self.source = source
+        self.timeout = timeout
+        self.placeholder = placeholder
+        self.error: Optional[BaseException] = None
+
+    async def run(self) -> Any:
+        source = self.source
+        try:
+            aw = source() if callable(source) and not inspect.isawaitable(source) else source
+            if self.timeout is None:
+                return await aw
+            return await asyncio.wait_for(aw, self.timeout)
+        except Exception as e:
+            self.error = e
+            return self.placeholder
+
+
+class Composer:
+    """# Composer
+
+    여러 backend 에서 오는 출력들을 동시에 채워서 하나의 Kakao 응답을 만듭니다.
+
+    slot 은 화면에 보일 순서대로 선언하고, build() 는 모든 slot 을 동시에 실행합니다.
+
+    전체 시간은 각 backend 시간의 합이 아니라 가장 느린 backend 시간이 됩니다.
+
+    ## Example
+
+    ```python
+    k = await (
+        Composer()
+        .slot(notice_list_card(), timeout=1.0)
+        .slot(weather_basic_card(), timeout=0.5, placeholder="날씨 정보를 불러오지 못했어요.")
+        .slot(menu_carousel)  # coroutine 함수도 가능
+        .build()
+    )
+    ```
+    """
+
+    def __init__(self, kakao: Optional[Kakao] = None):
+        self.kakao = Kakao() if kakao is None else kakao
+        self.slots: list[Slot] = []
+
+    def slot(
+        self, source: Source, timeout: Optional[float] = None, placeholder: Any = None
+    ) -> Composer:
+        """Declare the next output slot"""
+        self.slots.append(Slot(source, timeout, placeholder))
+        return self
+
+    async def build(self) -> Kakao:
+        """Fill every slot concurrently and add outputs in declared order"""
+        results = await asyncio.gather(*(slot.run() for slot in self.slots))
+        k = self.kakao
+        for result in results:
+            for output in result if isinstance(result, (list, tuple)) else (result,):
+                if output is None:
+                    continue
+                if isinstance(output, str):
+                    k.add_simple_text(output)
+                else:
+                    k.add_output(output)
+        return k
+
+    @property
+    def errors(self) -> list[Optional[BaseException]]:
+        """Errors of each slot after build(), None if the slot succeeded"""
+        return [slot.error for slot in self.slots]
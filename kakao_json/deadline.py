@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import urllib.request
+from typing import Any, Awaitable, Callable, Hashable, Optional, TypeVar, Union
+
+import msgspec
+
+from .cache import TTLCache
+from .kakao import Kakao
+from .skill import SkillRequest, encode_response, text_response
+
+__all__ = [
+    "Deadline",
+    "DeadlineHandler",
+    "DeadlineRunner",
+    "default_cache_key",
+    "retry_text",
+]
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+DeadlineHandler = Callable[[SkillRequest, "Deadline"], Awaitable[Union[Kakao, bytes]]]
+"""async handler(request, deadline) -> Kakao | bytes"""
+
+
+class Deadline:
+    """# Deadline
+
+    요청 하나의 시간 예산입니다. handler 는 `remaining()`을 보고 느린 작업을 줄이거나,
+
+    `wait_for()`로 남은 시간 안에서만 기다릴 수 있습니다.
+
+    ## Parameters
+
+    budget: 시간 예산 (초)
+    """
+
+    __slots__ = ("started", "expires", "clock")
+
+    def __init__(self, budget: float, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self.started = clock()
+        self.expires = self.started + budget
+
+    def remaining(self) -> float:
+        """Seconds left, never negative"""
+        return max(0.0, self.expires - self.clock())
+
+    def elapsed(self) -> float:
+        return self.clock() - self.started
+
+    def expired(self) -> bool:
+        return self.clock() >= self.expires
+
+    async def wait_for(
+        self, aw: Awaitable[T], reserve: float = 0.0, default: Any = None
+    ) -> T:
+        """Await aw for at most remaining() - reserve seconds, returns default on timeout"""
+        try:
+            return await asyncio.wait_for(aw, max(0.0, self.remaining() - reserve))
+        except asyncio.TimeoutError:
+            return default
+
+    def __repr__(self) -> str:
+        return f"Deadline(remaining={self.remaining():.3f})"
+
+
+def retry_text(text: str = "응답이 지연되고 있어요. 잠시 후 다시 시도해주세요.") -> bytes:
+    """SimpleText fallback response"""
+    return text_response(text)
+
+
+def default_cache_key(request: SkillRequest) -> Hashable:
+    """(user id, block id, utterance, params) of the request
+
+    응답은 사용자마다 다를 수 있으므로 사용자끼리 공유하지 않습니다.
+    """
+    return (
+        request.userRequest.user.id,
+        request.userRequest.block.id,
+        request.userRequest.utterance,
+        msgspec.json.encode(request.action.params, order="sorted"),
+    )
+
+
+def _post(url: str, body: bytes) -> None:
+    req = urllib.request.Request(
+        url, body, {"Content-Type": "application/json"}, method="POST"
+    )
+    with urllib.request.urlopen(req, timeout=10) as resp:
+        resp.read()
+
+
+async def _send_callback(url: str, body: bytes) -> None:
+    await asyncio.to_thread(_post, url, body)
+
+
+class DeadlineRunner:
+    """# DeadlineRunner
+
+    카카오는 5초 안에 응답하지 않은 스킬 응답을 버립니다.
+
+    handler 를 시간 예산 안에서 실행하고, 예산을 넘기면 미리 encode 해둔 fallback 을 보냅니다.
+
+    - fallback 우선순위: 캐시된 같은 요청의 응답 > fallback (기본값: "잠시 후 다시 시도" SimpleText)
+    - callback=True 이고 요청에 callbackUrl 이 있으면 useCallback 응답을 보내고, 결과는 callbackUrl 로 보냅니다.
+    - 늦게 끝난 결과도 캐시에 저장되므로 다음 요청은 결과를 받을 수 있습니다.
+
+    ## Parameters
+
+    handler: async handler(request, deadline) -> Kakao | bytes
+
+    budget: 시간 예산 (초), 네트워크 시간을 고려해서 5초보다 작게
+
+    fallback: 시간 초과시 보낼 Kakao 혹은 bytes
+
+    cache: 응답 캐시, 기본값 TTLCache(ttl=60)
+
+    key: 요청 -> 캐시 key, 기본값 (user id, block id, utterance, params)
+    사용자 구분 없이 같은 응답을 공유하려면 user id 를 뺀 key 를 직접 넘기세요.
+    (예: `key=lambda req: (req.userRequest.block.id, req.userRequest.utterance)`)
+
+    callback: 시간 초과시 callback 응답 사용 여부
+
+    callback_text: useCallback 응답에 보일 문구
+
+    ## Example
+
+    ```python
+    async def notice(req: SkillRequest, deadline: Deadline) -> Kakao:
+        rows = await deadline.wait_for(db.fetch(...), reserve=0.2, default=[])
+        ...
+
+    runner = DeadlineRunner(notice, budget=4.0)
+    body: bytes = await runner(decode_request(await request.body()))
+    ```
+    """
+
+    def __init__(
+        self,
+        handler: DeadlineHandler,
+        budget: float = 4.5,
+        fallback: Union[Kakao, bytes, None] = None,
+        cache: Optional[TTLCache] = None,
+        key: Callable[[SkillRequest], Hashable] = default_cache_key,
+        callback: bool = False,
+        callback_text: str = "답변을 준비하고 있어요.",
+        send_callback: Callable[[str, bytes], Awaitable[None]] = _send_callback,
+    ):
+        self.handler = handler
+        self.budget = budget
+        self.fallback = encode_response(retry_text() if fallback is None else fallback)
+        self.cache = TTLCache(60) if cache is None else cache
+        self.key = key
+        self.callback = callback
+        self.callback_ack = msgspec.json.encode(
+            {"version": "2.0", "useCallback": True, "data": {"text": callback_text}}
+        )
+        self.send_callback = send_callback
+        self.timeouts = 0
+        self._background: set[asyncio.Task] = set()
+
+    async def __call__(self, request: SkillRequest) -> bytes:
+        deadline = Deadline(self.budget)
+        task = asyncio.ensure_future(self.handler(request, deadline))
+        key = self.key(request)
+
+        try:
+            done, _ = await asyncio.wait((task,), timeout=deadline.remaining())
+        except asyncio.CancelledError:
+            task.cancel()  # nobody is left to receive the response
+            raise
+        if done:
+            body = encode_response(task.result())
+            self.cache.set(key, body)
+            return body
+
+        self.timeouts += 1
+        url = request.userRequest.callbackUrl if self.callback else None
+        self._background.add(task)
+        task.add_done_callback(lambda t: self._finish(t, key, url))
+        if url:
+            return self.callback_ack
+        return self.cache.get(key) or self.fallback
+
+    def _finish(self, task: asyncio.Task, key: Hashable, url: Optional[str]) -> None:
+        self._background.discard(task)
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            logger.error("late handler failed", exc_info=task.exception())
+            return
+        body = encode_response(task.result())
+        self.cache.set(key, body)
+        if url:
+            send = asyncio.ensure_future(self.send_callback(url, body))
+            self._background.add(send)
+            send.add_done_callback(self._discard)
+
+    def _discard(self, task: asyncio.Task) -> None:
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("callback failed", exc_info=task.exception())
+
+    async def drain(self) -> None:
+        """Wait for every late handler and callback to finish"""
+        while self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from typing import Callable, Optional
+
+import msgspec
+
+from .cache import TTLCache
+from .skill import Handler, SkillRequest, encode_response
+
+__all__ = ["Idempotency", "fingerprint"]
+
+_encoder = msgspec.json.Encoder(order="sorted")
+
+
+def fingerprint(request: SkillRequest) -> bytes:
+    """Hash of (user, utterance, block, params, clientExtra)
+
+    시간은 넣지 않습니다. 같은 요청이 언제까지 같은 요청인지는 Idempotency 의 ttl 이 정합니다.
+    """
+    user = request.userRequest
+    action = request.action
+    return hashlib.blake2b(
+        _encoder.encode(
+            (
+                user.user.id,
+                user.utterance,
+                user.block.id,
+                action.params,
+                action.clientExtra,
+            )
+        ),
+        digest_size=16,
+    ).digest()
+
+
+class Idempotency:
+    """# Idempotency
+
+    응답이 늦으면 카카오는 같은 요청을 다시 보냅니다.
+
+    같은 요청 (fingerprint)이 다시 오면 handler 를 다시 실행하지 않고
+
+    - 이미 끝났으면 캐시에 저장된 encode 된 응답 bytes 를 돌려주고,
+    - 아직 실행 중이면 실행 중인 결과를 같이 기다립니다.
+
+    handler 는 별도의 task 에서 실행하므로 처음 요청이 취소되어도 (연결 끊김 등) 실행은 계속되고
+    같이 기다리던 요청과 다음 재시도가 결과를 받습니다.
+
+    ## Parameters
+
+    handler: async handler(request) -> Kakao | bytes
+
+    ttl: 응답을 캐시할 시간 (초), 이 시간 안에 다시 온 같은 요청은 handler 를 실행하지 않습니다.
+
+    key: 요청 -> key, 기본값 fingerprint
+
+    ## Example
+
+    ```python
+    skill = Idempotency(notice_handler, ttl=30)
+    body: bytes = await skill(decode_request(await request.body()))
+    ```
+    """
+
+    def __init__(
+        self,
+        handler: Handler,
+        ttl: float = 30.0,
+        maxsize: int = 10000,
+        key: Optional[Callable[[SkillRequest], bytes]] = None,
+    ):
+        self.handler = handler
+        self.cache: TTLCache[bytes, bytes] = TTLCache(ttl, maxsize)
+        self.key = key or fingerprint
+        self.hits = 0
+        self.joined = 0
+        self._inflight: dict[bytes, asyncio.Task] = {}
+
+    async def __call__(self, request: SkillRequest) -> bytes:
+        key = self.key(request)
+        body = self.cache.get(key)
+        if body is not None:
+            self.hits += 1
+            return body
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._inflight[key] = asyncio.ensure_future(self._run(key, request))
+            task.add_done_callback(_retrieve)
+        else:
+            self.joined += 1
+        # cancelling one caller does not cancel the shared run
+        return await asyncio.shield(task)
+
+    async def _run(self, key: bytes, request: SkillRequest) -> bytes:
+        try:
+            body = encode_response(await self.handler(request))
+        finally:
+            del self._inflight[key]
+        self.cache.set(key, body)
+        return body
+
+
+def _retrieve(task: asyncio.Task) -> None:
+    """Mark the exception retrieved, nobody may be waiting after every caller was cancelled"""
+    if not task.cancelled():
+        task.exception()
@@ -0,0 +1,364 @@
+from __future__ import annotations
+
+import asyncio
+import ssl
+from typing import Any, Iterable, Optional
+from urllib.parse import urljoin, urlsplit
+
+from msgspec import Struct
+
+from ._http import read_chunk, read_head
+from .cache import TTLCache
+from .components.common import Profile, Thumbnail
+
+__all__ = ["ImageInfo", "ImageProbe", "parse_image_size"]
+
+_MISSING = object()
+_REDIRECTS = (301, 302, 303, 307, 308)
+# JPEG SOF markers (C4 DHT, C8 JPG, CC DAC are not frames)
+_JPEG_SOF = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+class ImageInfo(Struct, frozen=True):
+    """# ImageInfo
+
+    ## Attributes:
+        - format: String, png | jpeg | gif | webp
+
+        - width: int, 이미지의 넓이 (px)
+
+        - height: int, 이미지의 높이 (px)
+    """
+
+    format: str
+    width: int
+    height: int
+
+
+def _jpeg_size(data: bytes) -> Optional[ImageInfo]:
+    i, n = 2, len(data)
+    while i + 4 <= n:
+        if data[i] != 0xFF:
+            return None
+        marker = data[i + 1]
+        if marker == 0xFF:  # fill byte
+            i += 1
+            continue
+        if marker in _JPEG_SOF:
+            if i + 9 > n:
+                return None
+            height = int.from_bytes(data[i + 5 : i + 7], "big")
+            width = int.from_bytes(data[i + 7 : i + 9], "big")
+            return ImageInfo("jpeg", width, height)
+        if marker == 0x01 or 0xD0 <= marker <= 0xD9:  # standalone markers
+            i += 2
+            continue
+        i += 2 + int.from_bytes(data[i + 2 : i + 4], "big")
+    return None
+
+
+def parse_image_size(data: bytes) -> Optional[ImageInfo]:
+    """Parse width/height from the first bytes of a PNG, JPEG, GIF or WebP image
+
+    None 을 반환하면 지원하지 않는 형식이거나 데이터가 더 필요한 경우입니다.
+    """
+    if data[:8] == b"\x89PNG\r\n\x1a\n":
+        if len(data) < 24:
+            return None
+        return ImageInfo(
+            "png",
+            int.from_bytes(data[16:20], "big"),
+            int.from_bytes(data[20:24], "big"),
+        )
+    if data[:6] in (b"GIF87a", b"GIF89a"):
+        if len(data) < 10:
+            return None
+        return ImageInfo(
+            "gif",
+            int.from_bytes(data[6:8], "little"),
+            int.from_bytes(data[8:10], "little"),
+        )
+    if data[:2] == b"\xff\xd8":
+        return _jpeg_size(data)
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        chunk = data[12:16]
+        if chunk == b"VP8 " and len(data) >= 30:
+            return ImageInfo(
+                "webp",
+                int.from_bytes(data[26:28], "little") & 0x3FFF,
+                int.from_bytes(data[28:30], "little") & 0x3FFF,
+            )
+        if chunk == b"VP8L" and len(data) >= 25:
+            bits = int.from_bytes(data[21:25], "little")
+            return ImageInfo(
+                "webp", (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+            )
+        if chunk == b"VP8X" and len(data) >= 30:
+            return ImageInfo(
+                "webp",
+                int.from_bytes(data[24:27], "little") + 1,
+                int.from_bytes(data[27:30], "little") + 1,
+            )
+    return None
+
+
+def _retrieve(task: asyncio.Task) -> None:
+    """Mark the exception retrieved, nobody may be waiting after every caller was cancelled"""
+    if not task.cancelled():
+        task.exception()
+
+
+def _collect(obj: Any, out: list) -> None:
+    if isinstance(obj, (Thumbnail, Profile)):
+        out.append(obj)
+    elif isinstance(obj, (list, tuple)):
+        for item in obj:
+            _collect(item, out)
+    elif isinstance(obj, Struct):
+        for name in obj.__struct_fields__:
+            value = getattr(obj, name)
+            if isinstance(value, (Struct, list, tuple)):
+                _collect(value, out)
+
+
+class ImageProbe:
+    """# ImageProbe
+
+    이미지 URL의 앞부분 (header bytes)만 받아서 width/height를 알아냅니다.
+
+    `Thumbnail`의 `fixedRatio`가 true 인 경우 width, height가 필요하고,
+
+    케로셀 내에서는 모든 이미지를 동일 비율로 맞춰야 하기 때문에 사용합니다.
+
+    - HTTP Range 요청으로 필요한 만큼만 읽습니다.
+    - host 별로 keep-alive connection을 재사용합니다.
+    - 결과는 TTL 캐시에 저장되고, 같은 URL에 대한 동시 요청은 하나로 합쳐집니다.
+
+    ## Parameters
+
+    ttl: 성공한 결과의 캐시 시간 (초)
+
+    negative_ttl: 실패한 결과의 캐시 시간 (초)
+
+    max_connections: 동시에 열 수 있는 최대 connection 수
+
+    header_bytes: 이미지당 최대로 읽는 byte 수
+
+    timeout: 이미지당 timeout (초)
+
+    ## Example
+
+    ```python
+    async with ImageProbe() as probe:
+        await probe.fill(carousel)  # 모든 Thumbnail/Profile width, height 채우기
+    ```
+    """
+
+    def __init__(
+        self,
+        ttl: float = 3600,
+        negative_ttl: float = 60,
+        max_connections: int = 16,
+        header_bytes: int = 65536,
+        timeout: float = 5.0,
+        maxsize: int = 4096,
+    ):
+        self.negative_ttl = negative_ttl
+        self.max_connections = max_connections
+        self.header_bytes = header_bytes
+        self.timeout = timeout
+        self.cache: TTLCache[str, Optional[ImageInfo]] = TTLCache(ttl, maxsize)
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._idle: dict[tuple, list[tuple[asyncio.StreamReader, asyncio.StreamWriter]]] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._ssl: Optional[ssl.SSLContext] = None
+
+    async def __aenter__(self) -> ImageProbe:
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close every pooled connection"""
+        idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for _, writer in conns:
+                writer.close()
+
+    async def probe(self, url: str) -> Optional[ImageInfo]:
+        """Returns ImageInfo of url, None if the image could not be read"""
+        cached = self.cache.get(url, _MISSING)  # type: ignore
+        if cached is not _MISSING:
+            return cached  # type: ignore
+
+        task = self._inflight.get(url)
+        if task is None:
+            task = self._inflight[url] = asyncio.ensure_future(self._shared(url))
+            task.add_done_callback(_retrieve)
+        # a cancelled caller (e.g. a Composer slot timeout) leaves the probe running for the others
+        return await asyncio.shield(task)
+
+    async def _shared(self, url: str) -> Optional[ImageInfo]:
+        try:
+            info = await self._probe(url)
+        finally:
+            del self._inflight[url]
+        self.cache.set(url, info, None if info else self.negative_ttl)
+        return info
+
+    async def probe_many(self, urls: Iterable[str]) -> list[Optional[ImageInfo]]:
+        """Probe every url concurrently, keeps the order of urls"""
+        return await asyncio.gather(*(self.probe(url) for url in urls))
+
+    async def for_list_card(self, url: str) -> Thumbnail:
+        """Creates Thumbnail with width/height of the image"""
+        thumbnail = Thumbnail(url)
+        info = await self.probe(url)
+        if info is not None:
+            thumbnail.for_list_card(url, info.width, info.height)
+        return thumbnail
+
+    async def fill(self, *targets: Any) -> None:
+        """Fill missing width/height of every Thumbnail and Profile found in targets
+
+        Thumbnail, Profile, 카드, Carousel, Kakao 모두 넘길 수 있습니다.
+        """
+        found: list[Thumbnail | Profile] = []
+        _collect(targets, found)
+        found = [
+            obj
+            for obj in found
+            if obj.imageUrl and (obj.width is None or obj.height is None)
+        ]
+        if not found:
+            return
+
+        urls = list(dict.fromkeys(obj.imageUrl for obj in found))
+        infos = dict(zip(urls, await self.probe_many(urls)))  # type: ignore
+        for obj in found:
+            info = infos[obj.imageUrl]
+            if info is not None:
+                obj.width = info.width
+                obj.height = info.height
+
+    async def _probe(self, url: str) -> Optional[ImageInfo]:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_connections)
+        async with self._semaphore:
+            try:
+                return await asyncio.wait_for(self._fetch(url, 3), self.timeout)
+            except (OSError, asyncio.TimeoutError, ValueError, EOFError):
+                return None
+
+    async def _connect(self, key: tuple, fresh: bool):
+        idle = self._idle.get(key)
+        while idle and not fresh:
+            reader, writer = idle.pop()
+            if not reader.at_eof() and not writer.is_closing():
+                return reader, writer, True
+            writer.close()
+
+        host, port, secure = key
+        if secure and self._ssl is None:
+            self._ssl = ssl.create_default_context()
+        reader, writer = await asyncio.open_connection(
+            host, port, ssl=self._ssl if secure else None
+        )
+        return reader, writer, False
+
+    def _release(self, key: tuple, reader, writer) -> None:
+        idle = self._idle.setdefault(key, [])
+        if len(idle) < self.max_connections:
+            idle.append((reader, writer))
+        else:
+            writer.close()
+
+    async def _fetch(self, url: str, redirects: int) -> Optional[ImageInfo]:
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            return None
+        secure = parts.scheme == "https"
+        key = (parts.hostname, parts.port or (443 if secure else 80), secure)
+        target = (parts.path or "/") + ("?" + parts.query if parts.query else "")
+        request = (
+            f"GET {target} HTTP/1.1\r\n"
+            f"Host: {parts.netloc}\r\n"
+            f"Range: bytes=0-{self.header_bytes - 1}\r\n"
+            "Accept: image/*\r\n"
+            "User-Agent: kakao_json\r\n"
+            "\r\n"
+        ).encode("latin-1")
+
+        for fresh in (False, True):
+            reader, writer, reused = await self._connect(key, fresh)
+            try:
+                writer.write(request)
+                await writer.drain()
+                status_line = await reader.readline()
+            except (OSError, asyncio.IncompleteReadError):
+                writer.close()
+                if reused:
+                    continue
+                raise
+            except BaseException:  # cancelled
+                writer.close()
+                raise
+            if status_line or not reused:
+                break
+            writer.close()  # stale keep-alive connection, retry with a new one
+
+        try:
+            status, headers = await read_head(reader, status_line)
+            if status in _REDIRECTS and "location" in headers and redirects > 0:
+                writer.close()
+                return await self._fetch(
+                    urljoin(url, headers["location"]), redirects - 1
+                )
+            info, done = await self._read_body(reader, headers)
+        except BaseException:
+            writer.close()
+            raise
+
+        if status not in (200, 206):
+            info = None
+        if done and headers.get("connection", "").lower() != "close":
+            self._release(key, reader, writer)
+        else:
+            writer.close()
+        return info
+
+    async def _read_body(self, reader, headers: dict[str, str]):
+        """Read until the image size is known, returns (info, connection reusable)"""
+        limit = self.header_bytes
+        data = bytearray()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            while len(data) < limit:
+                chunk = await read_chunk(reader)
+                if not chunk:
+                    return parse_image_size(bytes(data)), True
+                data += chunk
+                info = parse_image_size(bytes(data))
+                if info is not None:
+                    return info, False
+            return parse_image_size(bytes(data)), False
+
+        length = headers.get("content-length")
+        remaining = int(length) if length is not None else -1
+        info = None
+        while remaining != 0 and len(data) < limit:
+            chunk = await reader.read(
+                min(remaining, 4096) if remaining > 0 else 4096
+            )
+            if not chunk:
+                break
+            data += chunk
+            if remaining > 0:
+                remaining -= len(chunk)
+            info = parse_image_size(bytes(data))
+            if info is not None:
+                break
+        if info is None:
+            info = parse_image_size(bytes(data))
+        return info, remaining == 0
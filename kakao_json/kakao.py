@@ -52,16 +52,22 @@ class Carousel(Struct, omit_defaults=True):
     def add_card(self, card: Card) -> Carousel:
         match (card.__name__):
             case "BasicCard":
-                self.type = "basicCard"
+                card_type = "basicCard"
             case "CommerceCard":
-                self.type = "commerceCard"
+                card_type = "commerceCard"
             case "ListCard":
-                self.type = "listCard"
+                card_type = "listCard"
             case "ItemCard":
-                self.type = "itemCard"
+                card_type = "itemCard"
             case _:
                 raise Exception("Unknown Card type")
 
+        if self.items and self.type != card_type:
+            raise Exception(
+                f"Carousel of {self.type} can not have {card_type}, use kakao_json.layout.CarouselLayout"
+            )
+        self.type = card_type
+
         self.items.append(card)
         return self
 
@@ -86,6 +92,11 @@ class QuickReply(Struct, omit_defaults=True):
     blockId: Optional[str] = None
     extra: Optional[Any] = None
 
+    def set_extra(self, extra: Mapping[str, Any]) -> QuickReply:
+        """블록 호출시 스킬 서버에 전달할 정보 (action.clientExtra)"""
+        self.extra = extra
+        return self
+
 
 Output = (
     OuterSimpleText
@@ -102,6 +113,17 @@ class Outputs(Struct, omit_defaults=True):
 
 
 class Kakao(Struct):
+    """# Kakao
+
+    스킬 응답입니다.
+
+    ## Thread safety
+
+    하나의 Kakao 는 한 thread 에서 만드세요. 다 만든 응답을 여러 thread 에서 공유하거나
+
+    thread pool 에서 encode 하려면 `kakao_json.parallel.freeze`, `encode_many` 를 사용하세요.
+    """
+
     version: str = "2.0"
     template: Optional[Outputs] = field(default_factory=Outputs) # type: ignore
     # context: Optional[ContextControl] = None
@@ -112,11 +134,17 @@ class Kakao(Struct):
         self.template = Outputs()
 
     def add_qr(
-        self, label: str, messageText: Optional[str] = None, action: str = "message"
+        self,
+        label: str,
+        messageText: Optional[str] = None,
+        action: str = "message",
+        extra: Optional[Mapping[str, Any]] = None,
     ):
-        """Add Quick reply (label, messageText (optional), action)"""
+        """Add Quick reply (label, messageText (optional), action, extra (optional))"""
         self.template.quickReplies.append(
-            QuickReply(action, label, label if messageText is None else messageText)
+            QuickReply(
+                action, label, label if messageText is None else messageText, extra=extra
+            )
         )
 
     def add_simple_text(self, text):
@@ -175,13 +203,15 @@ class Kakao(Struct):
         return Carousel()
 
     def add_output(self, output):
-        match (output.__name__):
+        match (getattr(output, "__name__", None)):
             case "CommerceCard":
                 self.template.outputs.append(OuterCommerceCard(output))
             case "BasicCard":
                 self.template.outputs.append(OuterBasicCard(output))
             case "ListCard":
                 self.template.outputs.append(OuterListCard(output))
+            case "Carousel":
+                self.template.outputs.append(OuterCarousel(output))
             case _:
                 self.template.outputs.append(output)
 
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, Union
+
+from msgspec import Struct
+
+from .admission import AdmissionController, AdmissionMetrics
+from .kakao import Kakao
+from .skill import Handler, SkillRequest
+
+__all__ = ["Lane", "LaneScheduler", "LaneStats"]
+
+FAST = "fast"
+SLOW = "slow"
+
+
+class Lane:
+    """Concurrency pool (AdmissionController) and thread pool of one lane"""
+
+    __slots__ = ("name", "admission", "executor")
+
+    def __init__(self, name: str, admission: AdmissionController, executor: ThreadPoolExecutor):
+        self.name = name
+        self.admission = admission
+        self.executor = executor
+
+
+class LaneStats(Struct):
+    name: str
+    lane: str
+    declared: bool
+    latency: float  # moving average (seconds)
+    calls: int
+
+
+class _Route:
+    __slots__ = ("name", "handler", "is_async", "inline", "declared", "fast", "latency", "calls")
+
+    def __init__(self, name: str, handler: Callable, lane: Optional[str]):
+        self.name = name
+        self.handler = handler
+        self.is_async = inspect.iscoroutinefunction(handler)
+        # only a sync handler declared fast may run on the event loop, a learned one may still block
+        self.inline = not self.is_async and lane == FAST
+        self.declared = lane is not None
+        self.fast = lane == FAST
+        self.latency = 0.0
+        self.calls = 0
+
+
+class LaneScheduler:
+    """# LaneScheduler
+
+    캐시된 응답처럼 바로 끝나는 handler (fast)와 DB 를 기다리는 handler (slow)를 다른 lane 에서 실행합니다.
+
+    - lane 마다 동시 실행 수와 대기열 (AdmissionController)이 따로 있습니다. slow lane 이 밀려도 fast lane 은 기다리지 않습니다.
+    - sync handler 는 lane 별 thread pool 에서 실행합니다. lane="fast" 로 선언한 sync handler 만 event loop 에서 바로 실행합니다.
+      (실행 시간으로 fast lane 에 온 sync handler 는 가끔 느려질 수 있으므로 event loop 를 막지 않도록 thread pool 에서 실행)
+    - lane 을 선언하지 않은 handler 는 slow lane 에서 시작하고, 관찰한 평균 실행 시간이 threshold / 2 아래면 fast lane 으로,
+      threshold 를 넘으면 다시 slow lane 으로 옮깁니다. fast lane 에서 실행 중인 호출 하나가 threshold 를 넘기면
+      끝나기를 기다리지 않고 바로 옮깁니다.
+    - 실행 시간으로 fast lane 에 온 handler 는 fast lane 을 learned_limit 개까지만 같이 씁니다. 나머지는 slow lane 에서 실행하므로
+      갑자기 느려진 handler 가 몰려도 lane="fast" 로 선언한 handler 의 자리는 남습니다.
+    - lane 이 가득 차면 미리 encode 해둔 busy 응답을 돌려줍니다.
+
+    ## Parameters
+
+    threshold: fast lane 으로 분류할 실행 시간 기준 (초)
+
+    fast_limit, slow_limit: lane 별 동시 실행 수 (slow_limit 은 slow thread pool 크기이기도 합니다)
+
+    fast_threads: fast lane 의 sync handler 를 실행할 thread pool 크기
+
+    learned_limit: 실행 시간으로 fast lane 에 온 handler 들이 fast lane 에서 동시에 실행할 수 있는 수, 기본값 fast_limit / 2
+
+    fast_queue, slow_queue: lane 별 대기열 크기
+
+    ## Example
+
+    ```python
+    lanes = LaneScheduler(slow_limit=16)
+
+    menu = lanes.wrap(menu_handler, lane="fast")  # 미리 encode 된 응답
+    notice = lanes.wrap(notice_handler, lane="slow")  # DB
+    search = lanes.wrap(search_handler)  # 실행 시간을 보고 분류
+    ```
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.005,
+        fast_limit: int = 1024,
+        slow_limit: int = 16,
+        fast_queue: int = 4096,
+        slow_queue: int = 256,
+        fast_threads: Optional[int] = None,
+        learned_limit: Optional[int] = None,
+        deadline: float = 4.5,
+        response: Union[Kakao, bytes, None] = None,
+        min_samples: int = 8,
+        alpha: float = 0.2,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self.threshold = threshold
+        self.min_samples = min_samples
+        self.alpha = alpha
+        self.clock = clock
+        self.learned_limit = max(1, fast_limit // 2) if learned_limit is None else learned_limit
+        self._learned_active = 0  # learned calls holding or waiting for a fast lane slot
+        self.fast = Lane(
+            FAST,
+            AdmissionController(fast_limit, fast_queue, deadline, response, service_time=0.001),
+            ThreadPoolExecutor(fast_threads, thread_name_prefix="kakao-fast-lane"),
+        )
+        self.slow = Lane(
+            SLOW,
+            AdmissionController(slow_limit, slow_queue, deadline, response),
+            ThreadPoolExecutor(slow_limit, thread_name_prefix="kakao-slow-lane"),
+        )
+        self._routes: dict[str, _Route] = {}
+
+    def wrap(
+        self, handler: Callable, lane: Optional[str] = None, name: Optional[str] = None
+    ) -> Handler:
+        """Run handler (async or sync) in lane ("fast", "slow", None = learned), name must be unique"""
+        if lane not in (FAST, SLOW, None):
+            raise Exception(f"unknown lane: {lane}")
+        name = name or getattr(handler, "__qualname__", repr(handler))
+        if name in self._routes:
+            raise Exception(f"{name} is already wrapped, give each handler its own name=")
+        route = self._routes[name] = _Route(name, handler, lane)
+
+        async def scheduled(request: SkillRequest) -> Union[Kakao, bytes, Any]:
+            return await self._run(route, request)
+
+        return scheduled
+
+    def lane_of(self, name: str) -> str:
+        return FAST if self._routes[name].fast else SLOW
+
+    async def _run(self, route: _Route, request: SkillRequest) -> Any:
+        if not route.fast:
+            return await self._call(route, self.slow, request, False)
+        if route.declared:
+            return await self._call(route, self.fast, request, False)
+        if self._learned_active >= self.learned_limit:
+            # the rest of the fast lane is kept for declared fast handlers
+            return await self._call(route, self.slow, request, False)
+        self._learned_active += 1
+        try:
+            return await self._call(route, self.fast, request, True)
+        finally:
+            self._learned_active -= 1
+
+    async def _call(self, route: _Route, lane: Lane, request: SkillRequest, watch: bool) -> Any:
+        admission = lane.admission
+        if not await admission.acquire():
+            return admission.response
+
+        start = self.clock()
+        # a learned fast call running past the threshold moves the route before it finishes
+        timer = asyncio.get_running_loop().call_later(self.threshold, self._overrun, route) if watch else None
+        try:
+            if route.is_async:
+                return await route.handler(request)
+            if route.inline:
+                return route.handler(request)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(lane.executor, route.handler, request)
+        finally:
+            if timer is not None:
+                timer.cancel()
+            elapsed = self.clock() - start
+            admission.release(elapsed)
+            self._observe(route, elapsed)
+
+    def _observe(self, route: _Route, elapsed: float) -> None:
+        route.calls += 1
+        if route.calls == 1:
+            route.latency = elapsed
+        else:
+            route.latency += self.alpha * (elapsed - route.latency)
+        if route.declared or route.calls < self.min_samples:
+            return
+        # hysteresis: a handler near the threshold does not flip every call
+        if route.fast and route.latency > self.threshold:
+            route.fast = False
+        elif not route.fast and route.latency < self.threshold / 2:
+            route.fast = True
+
+    def _overrun(self, route: _Route) -> None:
+        if route.fast and not route.declared:
+            route.fast = False
+            # at least the threshold, so calls that finished fast do not move it straight back
+            route.latency = max(route.latency, self.threshold)
+
+    def stats(self) -> list[LaneStats]:
+        return [
+            LaneStats(route.name, FAST if route.fast else SLOW, route.declared, route.latency, route.calls)
+            for route in self._routes.values()
+        ]
+
+    def metrics(self) -> dict[str, AdmissionMetrics]:
+        """Admission metrics per lane"""
+        return {lane.name: lane.admission.metrics() for lane in (self.fast, self.slow)}
+
+    def shutdown(self, wait: bool = True) -> None:
+        for lane in (self.fast, self.slow):
+            lane.executor.shutdown(wait)
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import copy
+from typing import Any, Iterable, Mapping, Optional
+
+from .components.cards import BasicCard, CommerceCard, ItemCard, ListCard
+from .components.common import Thumbnail
+from .kakao import Carousel, Kakao
+
+__all__ = ["CarouselLayout"]
+
+_TYPES = {
+    BasicCard: "basicCard",
+    CommerceCard: "commerceCard",
+    ListCard: "listCard",
+    ItemCard: "itemCard",
+}
+
+# max cards in one carousel
+_MAX_CARDS = {"basicCard": 10, "commerceCard": 10, "listCard": 5, "itemCard": 10}
+
+# itemCard carousel: these fields are all or nothing
+_ITEM_CARD_SHARED = ("thumbnail", "head", "profile", "imageTitle")
+
+WIDE = "wide"  # 2:1
+SQUARE = "square"  # 1:1 (fixedRatio)
+
+# fixedRatio needs width and height, used for thumbnails without them (1:1, 800*800)
+_SQUARE_SIZE = 800
+
+
+def _thumbnails(card: Any) -> list[Thumbnail]:
+    if type(card) is CommerceCard:
+        return card.thumbnails
+    thumbnail = getattr(card, "thumbnail", None)
+    return [] if thumbnail is None else [thumbnail]
+
+
+class CarouselLayout:
+    """# CarouselLayout
+
+    카드 묶음을 카카오 carousel 규칙에 맞게 한 번에 정리해서 Carousel 목록으로 만듭니다.
+
+    - 카드 종류가 섞여 있으면 종류별로 나누고 (처음 나온 순서), 최대 카드 수 (listCard 5, 나머지 10)씩 나눕니다.
+    - carousel type 은 카드 종류로 미리 정하므로 add_card 를 카드마다 부르지 않습니다.
+    - 같은 종류의 이미지는 모두 와이드형 (2:1) 혹은 모두 정사각형 (1:1, fixedRatio)으로 맞춥니다.
+      ratio 를 정하지 않으면 많이 쓰인 쪽을 따르고, itemCard 는 2:1 만 가능합니다.
+      fixedRatio 에 필요한 width, height 가 없는 이미지는 800*800 으로 채웁니다.
+      (실제 크기를 쓰려면 ImageProbe.fill 을 먼저 부르세요)
+    - itemCard 의 thumbnail, head, profile, imageTitle 은 모든 카드에 있거나 모두 없어야 합니다.
+      head 와 profile 이 섞여 있으면 많이 쓰인 쪽만 남기고, 빠진 카드는 shared 값의 복사본으로 채웁니다.
+      채울 값이 없는 필드는 모든 카드에서 지웁니다. (strict=True 이면 Exception)
+    - itemCard carousel 에서 buttonLayout 은 지우고, buttons 는 2개, itemList 는 5개까지만 남깁니다.
+
+    카드는 복사하지 않고 그대로 수정합니다.
+
+    ## Parameters
+
+    ratio: "wide" | "square" | None (많이 쓰인 쪽)
+
+    shared: 빠진 카드에 채울 값, {"thumbnail": Thumbnail(...), "head": Head(...)}
+
+    strict: 채울 수 없는 필드가 있으면 지우지 않고 Exception
+
+    ## Example
+
+    ```python
+    layout = CarouselLayout(shared={"head": Head("추천 상품")})
+    for carousel in layout(cards):
+        k.add_output(carousel)
+
+    layout.add_to(k, cards)  # 같은 동작
+    ```
+    """
+
+    def __init__(
+        self,
+        ratio: Optional[str] = None,
+        shared: Optional[Mapping[str, Any]] = None,
+        strict: bool = False,
+    ):
+        if ratio not in (WIDE, SQUARE, None):
+            raise Exception('ratio must be "wide", "square" or None')
+        shared = dict(shared or {})
+        unknown = set(shared) - set(_ITEM_CARD_SHARED)
+        if unknown:
+            raise Exception(f"shared fields must be in {_ITEM_CARD_SHARED}: {sorted(unknown)}")
+        self.ratio = ratio
+        self.shared = shared
+        self.strict = strict
+
+    def __call__(self, cards: Iterable[Any]) -> list[Carousel]:
+        groups: dict[str, list] = {}
+        for card in cards:
+            kind = _TYPES.get(type(card))
+            if kind is None:
+                raise Exception(f"{type(card).__name__} can not be a carousel card")
+            group = groups.get(kind)
+            if group is None:
+                group = groups[kind] = []
+            group.append(card)
+
+        carousels = []
+        for kind, group in groups.items():
+            if kind == "itemCard":
+                self._item_cards(group)
+            self._uniform_ratio(group, WIDE if kind == "itemCard" else self.ratio)
+            size = _MAX_CARDS[kind]
+            for start in range(0, len(group), size):
+                carousels.append(Carousel(kind, group[start : start + size]))
+        return carousels
+
+    def add_to(self, kakao: Kakao, cards: Iterable[Any]) -> Kakao:
+        """Add the carousels of cards to kakao"""
+        for carousel in self(cards):
+            kakao.add_output(carousel)
+        return kakao
+
+    def _uniform_ratio(self, cards: list, ratio: Optional[str]) -> None:
+        thumbnails = [t for card in cards for t in _thumbnails(card)]
+        if not thumbnails:
+            return
+        if ratio is None:
+            square = sum(1 for t in thumbnails if t.fixedRatio)
+            ratio = SQUARE if square * 2 > len(thumbnails) else WIDE
+        if ratio != SQUARE:
+            for thumbnail in thumbnails:
+                thumbnail.fixedRatio = None
+            return
+        for thumbnail in thumbnails:
+            thumbnail.fixedRatio = True
+            if thumbnail.width is None or thumbnail.height is None:
+                thumbnail.width = thumbnail.height = _SQUARE_SIZE
+
+    def _item_cards(self, cards: list[ItemCard]) -> None:
+        n = len(cards)
+        heads = sum(1 for card in cards if card.head is not None)
+        profiles = sum(1 for card in cards if card.profile is not None)
+        # head and profile can not be mixed, keep the one most cards use
+        if heads and profiles:
+            drop = "profile" if heads >= profiles else "head"
+            if self.strict:
+                raise Exception("itemCard carousel mixes head and profile")
+            for card in cards:
+                setattr(card, drop, None)
+
+        for name in _ITEM_CARD_SHARED:
+            present = sum(1 for card in cards if getattr(card, name) is not None)
+            if present in (0, n):
+                continue
+            value = self.shared.get(name)
+            if value is None and self.strict:
+                raise Exception(f"itemCard carousel: {name} is set on {present} of {n} cards")
+            for card in cards:
+                if value is None:
+                    setattr(card, name, None)
+                elif getattr(card, name) is None:
+                    # each card gets its own copy, editing one card must not change the others
+                    setattr(card, name, copy.deepcopy(value))
+
+        for card in cards:
+            card.buttonLayout = None  # carousel is always horizontal
+            if card.buttons and len(card.buttons) > 2:
+                card.buttons = card.buttons[:2]
+            if len(card.itemList) > 5:
+                card.itemList = card.itemList[:5]
@@ -0,0 +1,413 @@
+"""# loadtest
+
+스킬 서버의 처리량과 응답 시간 (p50/p99)을 배포 전에 측정하는 도구입니다.
+
+실제와 비슷한 스킬 요청 payload 를 만들어서 (발화, 파라미터, 사용자 id),
+
+ASGI app 을 직접 (in-process) 호출하거나 localhost 서버에 HTTP 로 목표 RPS 만큼 보냅니다.
+
+응답 시간은 요청을 보내기로 예정된 시간부터 측정하므로 서버가 밀려도 지연이 숨겨지지 않습니다.
+
+```bash
+# in-process (module:attribute)
+python -m kakao_json.loadtest examples.fast_api:app --path /skill --rps 500 --duration 10
+
+# localhost server
+python -m kakao_json.loadtest http://127.0.0.1:8000/skill --rps 500 --duration 10
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib
+import os
+import random
+import sys
+import time
+from typing import Any, Awaitable, Callable, Optional, Sequence
+from urllib.parse import urlsplit
+
+import msgspec
+from msgspec import Struct
+
+from ._http import read_chunk, read_head
+from .skill import (
+    Action,
+    Block,
+    Bot,
+    DetailParam,
+    Intent,
+    SkillRequest,
+    User,
+    UserRequest,
+)
+
+__all__ = [
+    "UTTERANCES",
+    "LoadReport",
+    "generate_requests",
+    "percentile",
+    "call_asgi",
+    "run_asgi",
+    "run_http",
+    "main",
+]
+
+UTTERANCES = [
+    "오늘 공지 보여줘",
+    "어제 공지",
+    "학식 메뉴",
+    "오늘 날씨 어때",
+    "도서관 좌석",
+    "셔틀버스 시간표",
+    "장학금 공지 알려줘",
+    "내일 학식",
+    "시험 일정",
+    "도움말",
+    "ㄱㅅ",
+    "처음으로",
+]
+
+_BLOCKS = [
+    Block("5f1a0c1e2a3b4c5d6e7f8a90", "공지"),
+    Block("5f1a0c1e2a3b4c5d6e7f8a91", "학식"),
+    Block("5f1a0c1e2a3b4c5d6e7f8a92", "날씨"),
+    Block("5f1a0c1e2a3b4c5d6e7f8a93", "폴백 블록"),
+]
+
+_ENCODER = msgspec.json.Encoder()
+
+
+def generate_requests(
+    n: int,
+    seed: int = 0,
+    users: int = 1000,
+    utterances: Sequence[str] = UTTERANCES,
+) -> list[bytes]:
+    """Generate n JSON encoded skill request payloads (deterministic for a seed)"""
+    rng = random.Random(seed)
+    user_ids = [
+        "%064x" % rng.getrandbits(256) for _ in range(max(1, users))
+    ]
+    bot = Bot("5f1a0c1e2a3b4c5d6e7f8aff", "테스트 봇")
+
+    payloads = []
+    for _ in range(n):
+        block = rng.choice(_BLOCKS)
+        utterance = rng.choice(utterances)
+        params: dict[str, Any] = {}
+        detail: dict[str, DetailParam] = {}
+        if rng.random() < 0.3:
+            params["date"] = f"2024-0{rng.randint(1, 9)}-{rng.randint(10, 28)}"
+            detail["date"] = DetailParam(
+                utterance, params["date"], ""
+            )
+        if rng.random() < 0.2:
+            params["number"] = str(rng.randint(1, 100))
+            detail["number"] = DetailParam(params["number"], params["number"], "")
+
+        user_id = user_ids[min(int(rng.paretovariate(1.2)) - 1, len(user_ids) - 1)]
+        request = SkillRequest(
+            userRequest=UserRequest(
+                utterance=utterance,
+                user=User(user_id, "botUserKey", {"botUserKey": user_id}),
+                block=block,
+                lang="kr",
+                params={"ignoreMe": "true"},
+            ),
+            intent=Intent(block.id, block.name),
+            bot=bot,
+            action=Action(
+                "%024x" % rng.getrandbits(96), "skill", params, detail, {}
+            ),
+        )
+        payloads.append(_ENCODER.encode(request))
+    return payloads
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of sorted values (q: 0 ~ 100)"""
+    if not values:
+        return 0.0
+    rank = max(1, int(len(values) * q / 100 + 0.999999))
+    return values[min(rank, len(values)) - 1]
+
+
+class LoadReport(Struct):
+    """# LoadReport
+
+    ## Attributes:
+        - requests: int, 보낸 요청 수
+
+        - errors: int, 실패 (예외 혹은 status >= 400) 수
+
+        - duration: float, 전체 실행 시간 (초)
+
+        - throughput: float, 초당 완료된 요청 수
+
+        - latency_ms: Map<String, float>, p50/p90/p99/max/mean (ms)
+
+        - size: Map<String, float>, 응답 크기 min/p50/p99/max/mean (bytes)
+
+        - status: Map<int, int>, status code 별 개수 (0 은 예외)
+    """
+
+    requests: int
+    errors: int
+    duration: float
+    throughput: float
+    latency_ms: dict[str, float]
+    size: dict[str, float]
+    status: dict[int, int]
+
+    def __str__(self) -> str:
+        lat, size = self.latency_ms, self.size
+        return "\n".join(
+            [
+                f"requests   {self.requests} ({self.errors} errors) in {self.duration:.2f}s",
+                f"throughput {self.throughput:.1f} req/s",
+                "latency    p50 {p50:.2f}ms  p90 {p90:.2f}ms  p99 {p99:.2f}ms  max {max:.2f}ms  mean {mean:.2f}ms".format(**lat),
+                "size       min {min:.0f}B  p50 {p50:.0f}B  p99 {p99:.0f}B  max {max:.0f}B  mean {mean:.0f}B".format(**size),
+                "status     " + "  ".join(f"{k}: {v}" for k, v in sorted(self.status.items())),
+            ]
+        )
+
+
+def _report(samples: list[tuple[float, int, int]], duration: float) -> LoadReport:
+    latencies = sorted(s[0] * 1000 for s in samples)
+    sizes = sorted(s[2] for s in samples if s[1])
+    status: dict[int, int] = {}
+    for _, code, _ in samples:
+        status[code] = status.get(code, 0) + 1
+    errors = sum(v for k, v in status.items() if k == 0 or k >= 400)
+
+    def summary(values, keys):
+        out = {f"p{q}": percentile(values, q) for q in keys}
+        out["max"] = values[-1] if values else 0.0
+        out["mean"] = sum(values) / len(values) if values else 0.0
+        return out
+
+    size = summary(sizes, (50, 99))
+    size["min"] = sizes[0] if sizes else 0
+    return LoadReport(
+        requests=len(samples),
+        errors=errors,
+        duration=duration,
+        throughput=len(samples) / duration if duration > 0 else 0.0,
+        latency_ms=summary(latencies, (50, 90, 99)),
+        size=size,
+        status=status,
+    )
+
+
+async def _drive(
+    send: Callable[[bytes], Awaitable[tuple[int, int]]],
+    payloads: Sequence[bytes],
+    rps: float,
+    total: int,
+) -> LoadReport:
+    """Open-loop: request i is scheduled at start + i / rps regardless of responses"""
+    loop = asyncio.get_running_loop()
+    samples: list[tuple[float, int, int]] = []
+
+    async def one(body: bytes, scheduled: float) -> None:
+        try:
+            code, size = await send(body)
+        except Exception:
+            code, size = 0, 0
+        samples.append((loop.time() - scheduled, code, size))
+
+    tasks = []
+    start = loop.time()
+    for i in range(total):
+        scheduled = start + i / rps
+        delay = scheduled - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(one(payloads[i % len(payloads)], scheduled)))
+    await asyncio.gather(*tasks)
+    return _report(samples, loop.time() - start)
+
+
+async def call_asgi(app: Callable, body: bytes, path: str = "/skill") -> tuple[int, bytes]:
+    """POST body to an ASGI app in-process, returns (status, response body)"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"host", b"loadtest"),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+        "client": ("127.0.0.1", 0),
+        "server": ("loadtest", 80),
+    }
+    sent = False
+    disconnect = asyncio.Event()
+    status = 0
+    chunks: list[bytes] = []
+
+    async def receive():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    try:
+        await app(scope, receive, send)
+    finally:
+        disconnect.set()
+    return status, b"".join(chunks)
+
+
+async def run_asgi(
+    app: Callable,
+    payloads: Sequence[bytes],
+    rps: float,
+    duration: float,
+    path: str = "/skill",
+) -> LoadReport:
+    """Call an ASGI app in-process (no network) at the target rps"""
+
+    async def send(body: bytes) -> tuple[int, int]:
+        status, response = await call_asgi(app, body, path)
+        return status, len(response)
+
+    return await _drive(send, payloads, rps, max(1, int(rps * duration)))
+
+
+async def run_http(
+    url: str,
+    payloads: Sequence[bytes],
+    rps: float,
+    duration: float,
+    connections: int = 64,
+) -> LoadReport:
+    """POST payloads to url over keep-alive HTTP/1.1 connections at the target rps"""
+    parts = urlsplit(url)
+    if parts.scheme != "http" or not parts.hostname:
+        raise Exception("only http:// urls are supported")
+    host, port = parts.hostname, parts.port or 80
+    target = (parts.path or "/") + ("?" + parts.query if parts.query else "")
+    head = (
+        f"POST {target} HTTP/1.1\r\n"
+        f"Host: {parts.netloc}\r\n"
+        "Content-Type: application/json\r\n"
+    )
+
+    pool: asyncio.Queue = asyncio.Queue()
+    for _ in range(connections):
+        pool.put_nowait(None)
+
+    async def send(body: bytes) -> tuple[int, int]:
+        conn = await pool.get()
+        try:
+            if conn is None:
+                conn = await asyncio.open_connection(host, port)
+            reader, writer = conn
+            writer.write(
+                (head + f"Content-Length: {len(body)}\r\n\r\n").encode("latin-1") + body
+            )
+            status, headers = await read_head(reader)
+
+            size = 0
+            if headers.get("transfer-encoding", "").lower() == "chunked":
+                while chunk := await read_chunk(reader):
+                    size += len(chunk)
+            else:
+                size = len(await reader.readexactly(int(headers.get("content-length", 0))))
+
+            if headers.get("connection", "").lower() == "close":
+                writer.close()
+                conn = None
+            return status, size
+        except BaseException:
+            if conn is not None:
+                conn[1].close()
+            conn = None
+            raise
+        finally:
+            pool.put_nowait(conn)
+
+    try:
+        return await _drive(send, payloads, rps, max(1, int(rps * duration)))
+    finally:
+        while not pool.empty():
+            conn = pool.get_nowait()
+            if conn is not None:
+                conn[1].close()
+
+
+def _load_app(target: str) -> Any:
+    module_name, _, attr = target.partition(":")
+    if os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())
+    obj = importlib.import_module(module_name)
+    for name in (attr or "app").split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m kakao_json.loadtest",
+        description="Load test a kakao skill server (ASGI app or http url)",
+    )
+    parser.add_argument("target", help="module:app (in-process ASGI) or http://host:port/path")
+    parser.add_argument("--path", default="/skill", help="request path for ASGI targets")
+    parser.add_argument("--rps", type=float, default=100.0)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--warmup", type=float, default=1.0, help="seconds, not reported")
+    parser.add_argument("--users", type=int, default=1000, help="distinct user ids")
+    parser.add_argument("--payloads", type=int, default=10000, help="distinct payloads")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--connections", type=int, default=64, help="http only")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    payloads = generate_requests(args.payloads, args.seed, args.users)
+
+    if args.target.startswith("http://"):
+        def run(duration):
+            return run_http(args.target, payloads, args.rps, duration, args.connections)
+    else:
+        app = _load_app(args.target)
+
+        def run(duration):
+            return run_asgi(app, payloads, args.rps, duration, args.path)
+
+    async def go() -> LoadReport:
+        if args.warmup > 0:
+            await run(args.warmup)
+        return await run(args.duration)
+
+    started = time.perf_counter()
+    report = asyncio.run(go())
+    if args.json:
+        print(msgspec.json.encode(report).decode())
+    else:
+        print(report)
+        print(f"elapsed    {time.perf_counter() - started:.2f}s")
+    return 1 if report.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
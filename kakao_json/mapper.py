@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import copy
+from collections.abc import Mapping
+from typing import Any, Callable, Generic, Iterable, Optional, TypeVar
+
+from .components.cards import BasicCard, CommerceCard, Head, ItemCard, ItemList, ListCard
+from .components.common import Link, ListItem, Thumbnail
+from .kakao import Carousel
+
+__all__ = ["CardMapper", "const"]
+
+T = TypeVar("T", ListItem, BasicCard, ItemCard, CommerceCard)
+
+_CAROUSEL_TYPES = {
+    BasicCard: "basicCard",
+    CommerceCard: "commerceCard",
+    ItemCard: "itemCard",
+    ListCard: "listCard",
+}
+
+
+class const:
+    """Constant value for a mapped field, `CardMapper(ListItem, action=const("block"))`
+
+    list, dict, Button 같은 변경 가능한 값은 카드마다 복사하므로 한 카드를 고쳐도 다른 카드는 바뀌지 않습니다.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+
+# target field -> setter, mapped values go through the same setters as hand written cards
+# (ListItem.set_title sets action="message" ...), list fields are added one by one
+_SETTERS: dict[type, dict[str, str]] = {
+    ListItem: {
+        "title": "set_title",
+        "description": "set_desc",
+        "imageUrl": "set_image",
+        "action": "set_action",
+        "messageText": "set_msg",
+        "extra": "set_extra",
+    },
+    BasicCard: {
+        "title": "set_title",
+        "description": "set_desc",
+        "thumbnail": "set_thumbnail",
+        "buttons": "add_button",
+    },
+    ItemCard: {"buttons": "add_button"},
+    CommerceCard: {
+        "description": "set_desc",
+        "price": "set_price",
+        "currency": "set_currency",
+        "discount": "set_discount",
+        "discountRate": "set_discount_rate",
+        "dicountedPrice": "set_discounted_price",
+        "thumbnails": "set_thumbnail",
+        "buttons": "add_button",
+    },
+}
+
+# target field -> wrapper for a plain url string, url -> Link/Thumbnail/Head
+_WRAPPERS: dict[tuple[type, str], Callable[[str], Any]] = {
+    (ListItem, "link"): lambda url: Link(web=url),
+    (BasicCard, "thumbnail"): Thumbnail,
+    (ItemCard, "thumbnail"): Thumbnail,
+    (ItemCard, "head"): Head,
+    (CommerceCard, "thumbnails"): Thumbnail,
+}
+
+# fields holding a list, a single value is added as a one item list
+_LIST_FIELDS = {"buttons", "thumbnails", "itemList"}
+
+_ATOMIC = (str, int, float, bool, bytes, type(None))
+
+
+def _const_getter(value: Any) -> Callable[[Any], Any]:
+    """Getter giving each card its own copy of a mutable const value"""
+    if isinstance(value, _ATOMIC):
+        return lambda obj: value
+    if type(value) is list and all(isinstance(v, _ATOMIC) for v in value):
+        return lambda obj: list(value)
+    return lambda obj: copy.deepcopy(value)
+
+
+# source class -> is a Mapping, isinstance on an ABC costs more than the rest of a field
+_MAPPING_TYPES: dict[type, bool] = {dict: True}
+
+
+def _is_mapping(cls: type) -> bool:
+    is_mapping = _MAPPING_TYPES.get(cls)
+    if is_mapping is None:
+        is_mapping = _MAPPING_TYPES[cls] = issubclass(cls, Mapping)
+    return is_mapping
+
+
+def _path_getter(spec: str) -> Callable[[Any], Any]:
+    keys = spec.split(".")
+    if not all(key.isidentifier() for key in keys):
+        raise Exception(f"invalid field name: {spec!r}")
+
+    if len(keys) == 1:
+        key = keys[0]
+
+        def get_one(obj: Any) -> Any:
+            if _is_mapping(type(obj)):
+                return obj.get(key)
+            return getattr(obj, key)
+
+        return get_one
+
+    def get(obj: Any) -> Any:
+        for key in keys:
+            if obj is None:
+                return None
+            obj = obj.get(key) if _is_mapping(type(obj)) else getattr(obj, key)
+        return obj
+
+    return get
+
+
+def _getter(spec: Any) -> Callable[[Any], Any]:
+    if isinstance(spec, const):
+        return _const_getter(spec.value)
+    if callable(spec):
+        return spec
+    if isinstance(spec, str):
+        return _path_getter(spec)
+    raise Exception(f"field spec must be str, callable or const: {spec!r}")
+
+
+def _field(target: type, name: str, get: Callable[[Any], Any]) -> Callable[[Any, Any], None]:
+    """fill(card, obj), sets the mapped value of one field through its setter"""
+    method = _SETTERS[target].get(name)
+    setter = getattr(target, method) if method else None
+    wrapper = _WRAPPERS.get((target, name))
+
+    if name in _LIST_FIELDS:
+
+        def fill_list(card: Any, obj: Any) -> None:
+            values = get(obj)
+            if values is None:
+                return
+            if setter is None or getattr(card, name) is None:
+                setattr(card, name, [])  # ItemCard.buttons defaults to None
+            add = setter or getattr(card, name).append
+            for value in values if type(values) is list else [values]:
+                if wrapper is not None and type(value) is str:
+                    value = wrapper(value)
+                if setter is None:
+                    add(value)
+                else:
+                    add(card, value)
+
+        return fill_list
+
+    if wrapper is not None:
+
+        def fill_wrapped(card: Any, obj: Any) -> None:
+            value = get(obj)
+            if value is not None:
+                if type(value) is str:
+                    value = wrapper(value)
+                if setter is None:
+                    setattr(card, name, value)
+                else:
+                    setter(card, value)
+
+        return fill_wrapped
+
+    if setter is None:
+
+        def fill_attr(card: Any, obj: Any) -> None:
+            value = get(obj)
+            if value is not None:
+                setattr(card, name, value)
+
+        return fill_attr
+
+    def fill(card: Any, obj: Any) -> None:
+        value = get(obj)
+        if value is not None:
+            setter(card, value)
+
+    return fill
+
+
+def _item_list_getter(rows: Mapping[str, Any]) -> Callable[[Any], list[ItemList]]:
+    getters = [(title, _getter(spec)) for title, spec in rows.items()]
+    return lambda obj: [ItemList(title, str(get(obj))) for title, get in getters]
+
+
+class CardMapper(Generic[T]):
+    """# CardMapper
+
+    모델 객체 (dataclass, ORM row, pydantic model, dict 등)를 ListItem/BasicCard/ItemCard/CommerceCard 로 변환합니다.
+
+    필드 매핑은 한 번만 선언하고, 값은 직접 카드를 만들 때와 같은 setter 로 넣습니다.
+
+    (ListItem.set_title 은 action 을 "message" 로 정하는 등 setter 의 동작이 그대로 적용됩니다)
+
+    ## 필드 값
+
+    - str: 모델의 attribute 이름 (dict 이면 key), "a.b" 처럼 중첩 가능
+    - callable: 모델 객체를 받아 값을 반환
+    - const(value): 고정 값
+    - ItemCard 의 itemList 는 {"제목": 필드, ...} dict 도 가능
+
+    url 문자열은 필드에 맞게 Link/Thumbnail/Head 로 감쌉니다. (ListItem.link, BasicCard.thumbnail, CommerceCard.thumbnails ...)
+
+    buttons, thumbnails 는 값 하나 혹은 list 가 가능하며 list 의 url 문자열도 각각 감쌉니다.
+
+    ## Example
+
+    ```python
+    @dataclass
+    class Item:
+        name: str
+        number: int
+        url: str
+
+    to_item = CardMapper(ListItem, title="name", description=lambda o: f"{o.number}번", link="url")
+    list_card = to_item.list_card(items, header="리스트 카드 제목")
+
+    to_card = CardMapper(BasicCard, title="name", thumbnail="image_url")
+    carousel = to_card.carousel(items)
+    ```
+    """
+
+    def __init__(self, target: type[T], **fields: Any):
+        if target not in (ListItem, BasicCard, ItemCard, CommerceCard):
+            raise Exception("target must be ListItem, BasicCard, ItemCard or CommerceCard")
+        names = target.__struct_fields__
+        unknown = set(fields) - set(names)
+        if unknown:
+            raise Exception(f"unknown fields for {target.__name__}: {sorted(unknown)}")
+        required = names[: len(names) - len(target.__struct_defaults__)]
+        missing = [name for name in required if name not in fields]
+        if missing:
+            raise Exception(f"missing fields for {target.__name__}: {missing}")
+        self.target = target
+        self.fields = fields
+        # required fields are filled by the setters below
+        self._blank = dict.fromkeys(required)
+        self._fills = [
+            _field(
+                target,
+                name,
+                _item_list_getter(spec) if name == "itemList" and isinstance(spec, Mapping) else _getter(spec),
+            )
+            for name, spec in fields.items()
+        ]
+
+    def __call__(self, obj: Any) -> T:
+        card = self.target(**self._blank)
+        for fill in self._fills:
+            fill(card, obj)
+        return card
+
+    def map(self, objs: Iterable[Any]) -> list[T]:
+        """Convert every object"""
+        return [self(obj) for obj in objs]
+
+    def list_card(self, objs: Iterable[Any], header: Optional[str] = None) -> ListCard:
+        """ListItem mapper only, ListCard with the first 5 items"""
+        if self.target is not ListItem:
+            raise Exception("list_card needs a ListItem mapper")
+        card = ListCard()
+        if header is not None:
+            card.set_header(header)
+        card.items = self.map(list(objs)[:5])  # type: ignore
+        return card
+
+    def carousel(self, objs: Iterable[Any]) -> Carousel:
+        """Carousel of mapped cards (max 10)"""
+        cards = self.map(objs)
+        if len(cards) > 10:
+            raise Exception("a carousel can have at most 10 cards, use carousels()")
+        return self._carousel(cards)
+
+    def carousels(self, objs: Iterable[Any], size: int = 10) -> list[Carousel]:
+        """Carousels of at most size (1 ~ 10) cards each"""
+        if not 0 < size <= 10:
+            raise Exception("carousel size must be between 1 and 10")
+        cards = self.map(objs)
+        return [self._carousel(cards[i : i + size]) for i in range(0, len(cards), size)]
+
+    def _carousel(self, cards: list) -> Carousel:
+        if self.target is ListItem:
+            raise Exception("ListItem can not be a carousel card, use list_card()")
+        return Carousel(_CAROUSEL_TYPES[self.target], cards)
@@ -0,0 +1,183 @@
+"""# offload
+
+카탈로그나 검색 결과를 수십 개의 ListCard/ItemCard carousel 로 만드는 일은 CPU 를 오래 쓰므로
+
+event loop 에서 하면 그동안 다른 사용자의 요청이 모두 멈춥니다.
+
+`Offloader` 는 등록한 render 함수를 process pool 에서 실행합니다.
+
+- 인자는 msgpack 으로 encode 해서 보내고, worker 에서 함수의 type hint 대로 decode 합니다. (dataclass, Struct 등)
+- 결과 (Kakao, 카드 등)는 worker 에서 JSON 으로 encode 하고 bytes 만 돌려받습니다. struct tree 를 pickle 하지 않습니다.
+- render 함수는 module 최상위 함수여야 합니다. (worker 가 "module:함수" 로 import)
+
+```python
+# renders.py
+def catalog(items: list[Product], page: int = 0) -> Kakao:
+    ...
+
+# app.py
+offloader = Offloader(max_workers=4).register(renders.catalog)
+
+@app.on_event("startup")
+async def startup():
+    await offloader.start()  # worker 를 미리 띄우고 render 함수를 import
+
+@app.post("/catalog")
+async def skill(request: Request):
+    body = await offloader.render(renders.catalog, items, page=1)
+    return Response(body, media_type="application/json")
+```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import inspect
+import multiprocessing
+import os
+import time
+import typing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional, Sequence, Union
+
+import msgspec
+
+__all__ = ["Offloader", "function_name"]
+
+_encoder = msgspec.msgpack.Encoder()
+_json_encoder = msgspec.json.Encoder()
+
+# worker side: "module:qualname" -> (function, arguments decoder)
+_loaded: dict[str, tuple[Callable, msgspec.msgpack.Decoder]] = {}
+
+
+def function_name(fn: Callable) -> str:
+    """"module:qualname" used by workers to import fn"""
+    if not callable(fn) or "<" in fn.__qualname__:
+        raise Exception(f"{fn!r} is not a module level function")
+    return f"{fn.__module__}:{fn.__qualname__}"
+
+
+def _arguments_type(fn: Callable) -> type:
+    """Struct of the parameters of fn, typed by its hints"""
+    hints = typing.get_type_hints(fn)
+    fields = []
+    for param in inspect.signature(fn).parameters.values():
+        if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+            raise Exception(f"{fn.__qualname__}: *args and **kwargs are not supported")
+        hint = hints.get(param.name, Any)
+        if param.default is param.empty:
+            fields.append((param.name, hint))
+        else:
+            fields.append((param.name, hint, param.default))
+    return msgspec.defstruct(f"{fn.__name__}_arguments", fields)
+
+
+def _load(name: str) -> tuple[Callable, msgspec.msgpack.Decoder]:
+    loaded = _loaded.get(name)
+    if loaded is None:
+        module_name, _, qualname = name.partition(":")
+        obj: Any = importlib.import_module(module_name)
+        for attr in qualname.split("."):
+            obj = getattr(obj, attr)
+        loaded = _loaded[name] = (obj, msgspec.msgpack.Decoder(_arguments_type(obj)))
+    return loaded
+
+
+def _run(name: str, arguments: bytes) -> bytes:
+    fn, decoder = _load(name)
+    args = decoder.decode(arguments)
+    result = fn(**msgspec.structs.asdict(args))
+    if isinstance(result, (bytes, bytearray, memoryview)):
+        return bytes(result)
+    return _json_encoder.encode(result)  # Kakao, Carousel, cards ...
+
+
+def _init(names: Sequence[str]) -> None:
+    for name in names:
+        _load(name)
+
+
+def _ping() -> int:
+    time.sleep(0.01)  # hold the worker so the other pings go to the other workers
+    return os.getpid()
+
+
+class Offloader:
+    """# Offloader
+
+    render 함수를 process pool 에서 실행하고 encode 된 JSON bytes 를 돌려줍니다.
+
+    ## Parameters
+
+    max_workers: worker process 수, 기본값 os.cpu_count()
+
+    context: multiprocessing start method, 기본값 "spawn" (event loop 와 thread 를 복사하지 않음)
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, context: str = "spawn"):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.context = context
+        self.names: dict[Callable, str] = {}
+        self._signatures: dict[Callable, inspect.Signature] = {}
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def register(self, fn: Callable) -> Offloader:
+        """Register a module level render function, workers import it when they start"""
+        _arguments_type(fn)  # fail early on unsupported signatures
+        self.names[fn] = function_name(fn)
+        self._signatures[fn] = inspect.signature(fn)
+        return self
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                self.max_workers,
+                mp_context=multiprocessing.get_context(self.context),
+                initializer=_init,
+                initargs=(tuple(self.names.values()),),
+            )
+        return self._pool
+
+    async def start(self) -> set[int]:
+        """Start every worker now (warm start), returns the worker pids"""
+        loop = asyncio.get_running_loop()
+        pool = self._executor()
+        pids: set[int] = set()
+        # each round keeps every worker busy, new workers are spawned until max_workers
+        for _ in range(3):
+            pids.update(
+                await asyncio.gather(
+                    *(loop.run_in_executor(pool, _ping) for _ in range(self.max_workers * 2))
+                )
+            )
+            if len(pids) >= self.max_workers:
+                break
+        return pids
+
+    async def render(self, fn: Union[Callable, str], *args: Any, **kwargs: Any) -> bytes:
+        """Run fn(*args, **kwargs) in a worker, returns the encoded JSON response"""
+        if isinstance(fn, str):
+            name = fn
+        else:
+            name = self.names.get(fn) or function_name(fn)
+            signature = self._signatures.get(fn) or inspect.signature(fn)
+            args, kwargs = (), signature.bind(*args, **kwargs).arguments
+        if args:
+            raise Exception("positional arguments need the function, not its name")
+        arguments = _encoder.encode(kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor(), _run, name, arguments)
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait, cancel_futures=True)
+            self._pool = None
+
+    async def __aenter__(self) -> Offloader:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.shutdown)
@@ -0,0 +1,74 @@
+"""# parallel
+
+Kakao 와 카드 struct 들은 mutable 입니다. 여러 thread 에서 사용할 때의 규칙:
+
+- 하나의 Kakao/카드를 여러 thread 에서 동시에 만들지 마세요. 만드는 중인 객체는 한 thread 가 소유합니다.
+  (add_qr, add_output, add_card, add_item, add_button 은 list.append 하나이므로 동시에 호출해도 항목이 사라지지는 않지만 순서는 보장되지 않습니다.)
+- 다 만든 객체는 `freeze()` 로 immutable snapshot 을 만들어 어느 thread 에서든 공유하세요.
+- 많은 응답은 `encode_many()` 로 thread pool 에서 encode 할 수 있습니다. free-threaded (3.13t) 빌드에서는 thread 수에 따라 빨라집니다.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Iterable, Optional
+
+import msgspec
+from msgspec import Struct
+
+__all__ = ["Frozen", "freeze", "encode_many"]
+
+
+class Frozen(Struct, frozen=True):
+    """# Frozen
+
+    encode 가 끝난 immutable snapshot 입니다. 원본을 나중에 수정해도 바뀌지 않습니다.
+
+    ## Attributes:
+        - json: bytes, encode 된 JSON
+    """
+
+    json: bytes
+
+    def to_json(self) -> bytes:
+        return self.json
+
+    def __str__(self) -> str:
+        return self.json.decode(encoding="utf-8")
+
+
+def freeze(obj: Any) -> Frozen:
+    """Snapshot of a Kakao, card or any msgspec struct"""
+    if isinstance(obj, Frozen):
+        return obj
+    return Frozen(msgspec.json.encode(obj))
+
+
+def _encode_chunk(chunk: list) -> list[bytes]:
+    encode = msgspec.json.Encoder().encode
+    return [obj.json if isinstance(obj, Frozen) else encode(obj) for obj in chunk]
+
+
+def encode_many(
+    objs: Iterable[Any],
+    max_workers: Optional[int] = None,
+    chunk_size: int = 64,
+    executor: Optional[Executor] = None,
+) -> list[bytes]:
+    """Encode objs to JSON in a thread pool, keeps the order of objs
+
+    encode 중에는 objs 를 수정하지 마세요. (freeze 된 객체는 상관 없음)
+    """
+    items = list(objs)
+    chunks = [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+    if len(chunks) <= 1 or max_workers == 1:
+        return _encode_chunk(items)
+
+    if executor is not None:
+        results = executor.map(_encode_chunk, chunks)
+    else:
+        workers = max_workers or min(len(chunks), os.cpu_count() or 1)
+        with ThreadPoolExecutor(workers) as pool:
+            results = list(pool.map(_encode_chunk, chunks))
+    return [body for chunk in results for body in chunk]
@@ -0,0 +1,234 @@
+"""# params
+
+`action.detailParams` 의 시스템 엔티티 값을 Python 값으로 변환합니다.
+
+sys.plugin.* 의 value 는 JSON 문자열이므로 `json.loads` 를 두 번 하는 대신 msgspec 으로 한 번에 typed struct 로 decode 하고,
+
+같은 문자열은 다시 decode 하지 않도록 캐시합니다. (결과는 frozen struct 혹은 immutable 값이므로 공유해도 안전합니다.)
+
+```python
+parser = ParamParser(day="sys.plugin.date", count="sys.number", place="sys.location")
+
+values = parser.parse(req)
+values["day"].value  # datetime.date(2026, 10, 19)
+values["count"]  # 3
+```
+"""
+
+from __future__ import annotations
+
+import datetime
+import functools
+from typing import Any, Callable, Optional, Union
+
+import msgspec
+from msgspec import Struct
+
+from .skill import SkillRequest
+
+__all__ = [
+    "ParamParser",
+    "PluginDate",
+    "PluginDatetime",
+    "PluginTime",
+    "parse_value",
+    "register",
+]
+
+
+class PluginDate(Struct, frozen=True):
+    """# PluginDate
+
+    sys.plugin.date, sys.date
+
+    ## Attributes:
+        - value: date, 2026-10-19
+
+        - userTimeZone: String, UTC+9
+
+        - dateTag: String, today, tomorrow ...
+
+        - dateHeadword: String, 다음주 월요일의 "다음주" 등
+    """
+
+    value: datetime.date
+    userTimeZone: Optional[str] = None
+    dateTag: Optional[str] = None
+    dateHeadword: Optional[str] = None
+
+
+class PluginTime(Struct, frozen=True):
+    """# PluginTime
+
+    sys.plugin.time
+
+    ## Attributes:
+        - value: time, 15:30:00
+
+        - userTimeZone: String, UTC+9
+
+        - timeHeadword: String, am | pm
+
+        - hour, minute, second: 발화에 포함된 값
+    """
+
+    value: datetime.time
+    userTimeZone: Optional[str] = None
+    timeHeadword: Optional[str] = None
+    hour: Optional[int] = None
+    minute: Optional[int] = None
+    second: Optional[int] = None
+
+
+class PluginDatetime(Struct, frozen=True):
+    """# PluginDatetime
+
+    sys.plugin.datetime
+
+    ## Attributes:
+        - value: datetime, 2026-10-19T15:30:00 (timezone 없음, userTimeZone 참고)
+
+        - userTimeZone: String, UTC+9
+
+        - dateTag, dateHeadword, timeHeadword: sys.plugin.date, sys.plugin.time 과 같음
+    """
+
+    value: datetime.datetime
+    userTimeZone: Optional[str] = None
+    dateTag: Optional[str] = None
+    dateHeadword: Optional[str] = None
+    timeHeadword: Optional[str] = None
+
+
+class _Amount(Struct):
+    amount: Union[int, float]
+    unit: Optional[str] = None
+
+
+Parser = Callable[[Any], Any]
+
+_PARSERS: dict[str, Parser] = {}
+
+
+def register(entity: str, maxsize: int = 1024) -> Callable[[Parser], Parser]:
+    """Register a parser for entity, string values are cached (maxsize per entity)
+
+    ```python
+    @register("sys.unit.currency")
+    def currency(value):
+        ...
+    ```
+    """
+
+    def decorator(parser: Parser) -> Parser:
+        cached = functools.lru_cache(maxsize)(parser)
+
+        def parse(value: Any) -> Any:
+            if isinstance(value, str):
+                return cached(value)
+            return parser(value)
+
+        _PARSERS[entity] = parse
+        return parser
+
+    return decorator
+
+
+def _struct_parser(type: type) -> Parser:
+    decode = msgspec.json.Decoder(type).decode
+
+    def parse(value: Any) -> Any:
+        if isinstance(value, str):
+            return decode(value)
+        return msgspec.convert(value, type)
+
+    return parse
+
+
+register("sys.plugin.date")(_struct_parser(PluginDate))
+register("sys.plugin.time")(_struct_parser(PluginTime))
+register("sys.plugin.datetime")(_struct_parser(PluginDatetime))
+
+_plugin_date = _struct_parser(PluginDate)
+
+
+@register("sys.date")
+def _date(value: Any) -> PluginDate:
+    """JSON like sys.plugin.date, or a plain 2026-10-19"""
+    if isinstance(value, str) and not value.startswith("{"):
+        return PluginDate(datetime.date.fromisoformat(value))
+    return _plugin_date(value)
+
+
+_amount = _struct_parser(_Amount)
+
+
+@register("sys.number")
+def _number(value: Any) -> Union[int, float]:
+    """"3" -> 3, "2.5" -> 2.5, {"amount": 3, "unit": null} -> 3"""
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str) and not value.startswith("{"):
+        value = value.replace(",", "").strip()
+        try:
+            return int(value)
+        except ValueError:
+            return float(value)
+    return _amount(value).amount
+
+
+@register("sys.location")
+def _location(value: Any) -> str:
+    """Place name, "강남구" """
+    return value.strip() if isinstance(value, str) else str(value)
+
+
+def parse_value(entity: str, value: Any) -> Any:
+    """Parse a detailParams value of entity (unknown entities return value as is)"""
+    parser = _PARSERS.get(entity)
+    if parser is None or value is None:
+        return value
+    return parser(value)
+
+
+class ParamParser:
+    """# ParamParser
+
+    파라미터 이름 -> 시스템 엔티티 이름을 선언하고, 요청마다 typed 값을 꺼냅니다.
+
+    detailParams 에 없으면 action.params 의 값을 사용하고, 둘 다 없으면 None 입니다.
+
+    엔티티의 parser 는 호출할 때 찾으므로 ParamParser 를 만든 뒤에 register 한 parser 도 사용됩니다.
+
+    ## Example
+
+    ```python
+    parser = ParamParser(day="sys.plugin.date", count="sys.number")
+
+    async def reserve(req: SkillRequest) -> Kakao:
+        values = parser.parse(req)
+        ...
+    ```
+    """
+
+    def __init__(self, **entities: str):
+        self.entities = entities
+
+    def parse(self, request: SkillRequest) -> dict[str, Any]:
+        action = request.action
+        details = action.detailParams
+        params = action.params
+        parsers = _PARSERS
+        out: dict[str, Any] = {}
+        for name, entity in self.entities.items():
+            parser = parsers.get(entity)
+            detail = details.get(name)
+            value = detail.value if detail is not None else params.get(name)
+            out[name] = value if parser is None or value is None else parser(value)
+        return out
+
+    def get(self, request: SkillRequest, name: str) -> Any:
+        """Parse a single parameter"""
+        detail = request.action.detailParams.get(name)
+        value = detail.value if detail is not None else request.action.params.get(name)
+        return parse_value(self.entities[name], value)
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import Callable, Optional, Union
+
+from .kakao import Kakao
+from .skill import Handler, SkillRequest, encode_response, text_response
+
+__all__ = ["RateLimiter", "slow_down_text"]
+
+# each generation is split by key hash, a growing dict is resized (copied) 1/64 at a time
+_SHARDS = 64
+_MASK = _SHARDS - 1
+# expired users freed per allow() call, a call adds at most one user so the backlog shrinks
+_SWEEP = 4
+
+
+def slow_down_text(text: str = "요청이 너무 많아요. 잠시 후 다시 시도해주세요.") -> bytes:
+    """SimpleText response for rate limited users"""
+    return text_response(text)
+
+
+class RateLimiter:
+    """# RateLimiter
+
+    `userRequest.user.id` 별 요청 제한입니다. (GCRA, token bucket 과 같은 동작)
+
+    사용자 하나당 float 하나 (다음 허용 시각)만 저장합니다.
+
+    사용자는 두 세대 (dict)로 나눠 저장하고, 한 세대 동안 요청이 없던 사용자는 세대를 교체할 때 만료됩니다.
+
+    세대 길이는 제한이 풀리는 데 걸리는 최대 시간이므로 만료된 사용자는 처음 보는 사용자와 같습니다.
+
+    수백만 명이 든 dict 를 한 번에 해제하거나 키우면 그 요청이 수십 ms 멈추므로
+
+    - 세대는 key hash 로 64개의 dict 로 나눠서 dict 가 커질 때 복사하는 양을 줄이고
+    - 만료된 세대는 한 번에 지우지 않고 allow() 마다 조금씩 (4명) 지웁니다.
+
+    제한을 넘은 요청에는 미리 encode 해둔 "잠시 후 다시 시도" 응답을 돌려줍니다.
+
+    ## Parameters
+
+    rate: per 초 동안 허용할 요청 수
+
+    per: 기간 (초)
+
+    burst: 한 번에 몰아서 허용할 요청 수
+
+    response: 제한된 요청에 보낼 Kakao 혹은 bytes
+
+    ## Example
+
+    ```python
+    limiter = RateLimiter(rate=5, per=10, burst=3)
+
+    @app.post("/skill")
+    async def skill(request: Request):
+        req = decode_request(await request.body())
+        if (busy := limiter.check(req)) is not None:
+            return Response(busy, media_type="application/json")
+        ...
+
+    handler = limiter.wrap(handler)  # 혹은 handler 를 감싸기
+    ```
+    """
+
+    __slots__ = (
+        "interval",
+        "tolerance",
+        "clock",
+        "response",
+        "limited",
+        "generation",
+        "_current",
+        "_previous",
+        "_expired",
+        "_rotate_at",
+    )
+
+    def __init__(
+        self,
+        rate: float,
+        per: float = 1.0,
+        burst: int = 1,
+        response: Union[Kakao, bytes, None] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0 or per <= 0 or burst < 1:
+            raise Exception("rate, per must be positive and burst at least 1")
+        self.interval = per / rate
+        self.tolerance = self.interval * (burst - 1)
+        self.clock = clock
+        self.response = encode_response(
+            slow_down_text() if response is None else response
+        )
+        self.limited = 0
+        self.generation = max(self.tolerance + self.interval, 1.0)
+        # shards of user id -> theoretical arrival time
+        self._current: list[dict[str, float]] = [{} for _ in range(_SHARDS)]
+        self._previous: list[dict[str, float]] = [{} for _ in range(_SHARDS)]
+        # generations waiting to be freed, oldest first
+        self._expired: deque[dict[str, float]] = deque()
+        self._rotate_at = clock() + self.generation
+
+    def allow(self, key: str) -> bool:
+        """True if a request of key is allowed now"""
+        now = self.clock()
+        if now >= self._rotate_at:
+            self._rotate(now)
+        if self._expired:
+            self._sweep()
+        shard = hash(key) & _MASK
+        current = self._current[shard]
+        tat = current.get(key)
+        if tat is None:
+            previous = self._previous[shard]
+            tat = previous.pop(key, now) if previous else now
+        if tat < now:
+            tat = now
+        if tat - now > self.tolerance:
+            current[key] = tat
+            self.limited += 1
+            return False
+        current[key] = tat + self.interval
+        return True
+
+    def check(self, request: SkillRequest) -> Optional[bytes]:
+        """None if allowed, otherwise the pre-encoded slow down response"""
+        if self.allow(request.userRequest.user.id):
+            return None
+        return self.response
+
+    def wrap(self, handler: Handler) -> Handler:
+        """Wrap a handler, limited requests skip the handler"""
+
+        async def limited(request: SkillRequest) -> Union[Kakao, bytes]:
+            if self.allow(request.userRequest.user.id):
+                return await handler(request)
+            return self.response
+
+        return limited
+
+    def retry_after(self, key: str) -> float:
+        """Seconds until key is allowed again"""
+        shard = hash(key) & _MASK
+        tat = self._current[shard].get(key, self._previous[shard].get(key))
+        if tat is None:
+            return 0.0
+        return max(0.0, tat - self.tolerance - self.clock())
+
+    def _rotate(self, now: float) -> None:
+        """Users not seen for a whole generation expire, they are freed later by _sweep"""
+        self._expired.extend(shard for shard in self._previous if shard)
+        if now >= self._rotate_at + self.generation:
+            # idle for two generations
+            self._expired.extend(shard for shard in self._current if shard)
+            self._previous = [{} for _ in range(_SHARDS)]
+        else:
+            self._previous = self._current
+        self._current = [{} for _ in range(_SHARDS)]
+        self._rotate_at = now + self.generation
+
+    def _sweep(self) -> None:
+        dead = self._expired[0]
+        for _ in range(_SWEEP):
+            if not dead:
+                self._expired.popleft()
+                return
+            dead.popitem()
+
+    def __len__(self) -> int:
+        return sum(map(len, self._current)) + sum(map(len, self._previous))
@@ -0,0 +1,491 @@
+"""# recorder
+
+실제 트래픽을 기록하고 다시 재생해서 성능 저하를 재현하는 도구입니다.
+
+- `Recorder`: 스킬 요청 payload 와 encode 된 응답을 gzip 압축된 NDJSON 파일에 기록합니다.
+  파일 쓰기는 background thread 에서 하므로 요청 처리가 막히지 않습니다. (queue 가 가득 차면 버림)
+- `RecorderMiddleware`: ASGI app (FastAPI 등)의 요청/응답을 기록합니다.
+- replay: 기록을 handler 혹은 ASGI app 에 다시 넣어서 응답 bytes 와 시간을 비교합니다.
+
+```bash
+python -m kakao_json.recorder replay recordings/*.ndjson.gz --target examples.fast_api:app --asgi --path /skill
+python -m kakao_json.recorder replay recordings/*.ndjson.gz --target mybot.handlers:notice
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import glob
+import gzip
+import inspect
+import os
+import queue
+import sys
+import threading
+import time
+from typing import IO, Callable, Iterable, Iterator, Optional, Sequence
+
+import msgspec
+from msgspec import Struct
+
+from .loadtest import _load_app, call_asgi, percentile
+from .skill import decode_request, encode_response
+
+__all__ = [
+    "Record",
+    "Recorder",
+    "RecorderMiddleware",
+    "RecordReader",
+    "ReplayReport",
+    "read_records",
+    "replay",
+    "main",
+]
+
+
+class Record(Struct, array_like=True):
+    """# Record
+
+    ## Attributes:
+        - ts: float, 요청을 받은 시각 (unix time)
+
+        - duration: float, 응답을 만드는 데 걸린 시간 (초)
+
+        - request: 요청 payload (한 줄로 압축한 JSON)
+
+        - response: 응답 (한 줄로 압축한 JSON)
+
+        - status: int, HTTP status code
+
+        - encoded: int, JSON 이 아닌 body 는 base64 문자열로 저장하고 표시합니다. (1: request, 2: response)
+    """
+
+    ts: float
+    duration: float
+    request: msgspec.Raw
+    response: msgspec.Raw
+    status: int = 200
+    encoded: int = 0
+
+    def request_body(self) -> bytes:
+        return _body(self.request, self.encoded & _REQUEST)
+
+    def response_body(self) -> bytes:
+        return _body(self.response, self.encoded & _RESPONSE)
+
+
+_REQUEST = 1
+_RESPONSE = 2
+
+
+def _body(raw: msgspec.Raw, encoded: int) -> bytes:
+    if encoded:
+        return base64.b64decode(msgspec.json.decode(raw, type=str))
+    return bytes(raw)
+
+
+def _compact(body: bytes) -> tuple[msgspec.Raw, bool]:
+    """Single line JSON of body, or a base64 JSON string (True) if body is not JSON"""
+    try:
+        return msgspec.Raw(msgspec.json.encode(msgspec.json.decode(body))), False
+    except msgspec.DecodeError:
+        return msgspec.Raw(msgspec.json.encode(base64.b64encode(body).decode("ascii"))), True
+
+
+def _normalize(record: Record) -> None:
+    """Make one NDJSON line of record, runs in the writer thread"""
+    record.request, encoded = _compact(bytes(record.request))
+    if encoded:
+        record.encoded |= _REQUEST
+    record.response, encoded = _compact(bytes(record.response))
+    if encoded:
+        record.encoded |= _RESPONSE
+
+
+_STOP = object()
+
+
+class Recorder:
+    """# Recorder
+
+    ## Parameters
+
+    directory: 기록 파일을 저장할 폴더
+
+    prefix: 파일 이름 앞부분, `{prefix}-{시각}-{번호}.ndjson.gz`
+
+    max_bytes: 파일 하나의 최대 크기 (압축 전), 넘으면 새 파일로 교체
+
+    max_files: 보관할 최대 파일 수, 넘으면 오래된 파일부터 삭제 (None 이면 삭제 안함)
+
+    compress: gzip 압축 여부
+
+    queue_size: 쓰기 대기열 크기, 가득 차면 기록을 버리고 dropped 를 올립니다.
+
+    flush_interval: 파일에 flush 하는 주기 (초)
+
+    body 는 writer thread 에서 한 줄짜리 JSON 으로 다시 encode 합니다. (pretty print 된 JSON 도 한 줄로)
+    JSON 이 아닌 body (예: `Internal Server Error`)는 base64 문자열로 저장합니다.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        prefix: str = "skill",
+        max_bytes: int = 64 * 1024 * 1024,
+        max_files: Optional[int] = None,
+        compress: bool = True,
+        queue_size: int = 10000,
+        flush_interval: float = 1.0,
+    ):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.prefix = prefix
+        self.max_bytes = max_bytes
+        self.max_files = max_files
+        self.compress = compress
+        self.flush_interval = flush_interval
+        self.recorded = 0
+        self.dropped = 0
+        self.files: list[str] = []
+        self._queue: queue.Queue = queue.Queue(queue_size)
+        self._file: Optional[IO[bytes]] = None
+        self._written = 0
+        self._seq = 0
+        self._thread = threading.Thread(
+            target=self._run, name="kakao_json-recorder", daemon=True
+        )
+        self._thread.start()
+
+    def record(
+        self,
+        request: bytes,
+        response: bytes,
+        duration: float,
+        status: int = 200,
+        ts: Optional[float] = None,
+    ) -> bool:
+        """Queue one request/response pair, never blocks. False if it was dropped"""
+        try:
+            self._queue.put_nowait(
+                Record(
+                    time.time() if ts is None else ts,
+                    duration,
+                    msgspec.Raw(request),
+                    msgspec.Raw(response),
+                    status,
+                )
+            )
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def close(self) -> None:
+        """Write every queued record and close the current file"""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+
+    def __enter__(self) -> Recorder:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _open(self) -> IO[bytes]:
+        self._seq += 1
+        name = "%s-%s-%04d.ndjson%s" % (
+            self.prefix,
+            time.strftime("%Y%m%d-%H%M%S"),
+            self._seq,
+            ".gz" if self.compress else "",
+        )
+        path = os.path.join(self.directory, name)
+        self.files.append(path)
+        if self.max_files is not None:
+            while len(self.files) > self.max_files:
+                old = self.files.pop(0)
+                try:
+                    os.remove(old)
+                except OSError:
+                    pass
+        self._written = 0
+        if self.compress:
+            return gzip.open(path, "wb", compresslevel=6)
+        return open(path, "wb")
+
+    def _write(self, batch: list[Record], encoder: msgspec.json.Encoder) -> None:
+        for record in batch:
+            _normalize(record)
+        data = encoder.encode_lines(batch)
+        start = 0
+        while start < len(data):
+            if self._file is None or self._written >= self.max_bytes:
+                if self._file is not None:
+                    self._file.close()
+                self._file = self._open()
+            # split on line boundaries so files rotate close to max_bytes
+            end = start + self.max_bytes - self._written
+            if end < len(data):
+                end = data.index(b"\n", max(start, end - 1)) + 1
+            else:
+                end = len(data)
+            self._file.write(data[start:end])
+            self._written += end - start
+            start = end
+        self.recorded += len(batch)
+
+    def _run(self) -> None:
+        encoder = msgspec.json.Encoder()
+        last_flush = time.monotonic()
+        stop = False
+        while not stop:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                item = None
+
+            batch: list[Record] = []
+            while item is not None:
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+                if len(batch) >= 1024:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    item = None
+
+            if batch:
+                self._write(batch, encoder)
+            if self._file is not None and (
+                stop or time.monotonic() - last_flush >= self.flush_interval
+            ):
+                self._file.flush()
+                last_flush = time.monotonic()
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class RecorderMiddleware:
+    """# RecorderMiddleware
+
+    ASGI middleware, POST 요청 body 와 응답 body 를 Recorder 에 기록합니다.
+
+    ```python
+    app.add_middleware(RecorderMiddleware, recorder=Recorder("recordings"), path="/skill")
+    ```
+    """
+
+    def __init__(self, app: Callable, recorder: Recorder, path: Optional[str] = None):
+        self.app = app
+        self.recorder = recorder
+        self.path = path
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope.get("method") != "POST"
+            or (self.path is not None and scope.get("path") != self.path)
+        ):
+            return await self.app(scope, receive, send)
+
+        request: list[bytes] = []
+        response: list[bytes] = []
+        status = 0
+        started = time.perf_counter()
+
+        async def recv():
+            message = await receive()
+            if message["type"] == "http.request":
+                request.append(message.get("body", b""))
+            return message
+
+        async def snd(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                response.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    body = b"".join(request)
+                    if body:
+                        self.recorder.record(
+                            body,
+                            b"".join(response) or b"null",
+                            time.perf_counter() - started,
+                            status,
+                        )
+            await send(message)
+
+        await self.app(scope, recv, snd)
+
+
+class RecordReader:
+    """Iterate records of NDJSON files (.gz is decompressed)
+
+    깨진 줄 (쓰다 만 파일, 다른 도구가 쓴 줄 등)은 건너뛰고 skipped 에 셉니다.
+    """
+
+    def __init__(self, *paths: str):
+        self.paths = paths
+        self.skipped = 0
+
+    def __iter__(self) -> Iterator[Record]:
+        decoder = msgspec.json.Decoder(Record)
+        for path in self.paths:
+            opener = gzip.open if path.endswith(".gz") else open
+            with opener(path, "rb") as f:
+                try:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        try:
+                            record = decoder.decode(line)
+                        except msgspec.DecodeError:
+                            self.skipped += 1
+                            continue
+                        yield record
+                except EOFError:  # gzip file cut off while writing
+                    self.skipped += 1
+
+
+def read_records(*paths: str) -> RecordReader:
+    """Read records from NDJSON files (.gz is decompressed), bad lines are skipped"""
+    return RecordReader(*paths)
+
+
+class ReplayReport(Struct):
+    """# ReplayReport
+
+    ## Attributes:
+        - total: int, 재생한 요청 수
+
+        - matched: int, 기록된 응답과 bytes 가 같은 수
+
+        - mismatched: list[int], 응답이 다른 기록의 순번
+
+        - errors: int, 예외가 난 수
+
+        - skipped: int, 읽지 못하고 건너뛴 기록 수
+
+        - recorded_ms: Map<String, float>, 기록된 응답 시간 p50/p99/mean (ms)
+
+        - replayed_ms: Map<String, float>, 재생한 응답 시간 p50/p99/mean (ms)
+    """
+
+    total: int
+    matched: int
+    mismatched: list[int]
+    errors: int
+    recorded_ms: dict[str, float]
+    replayed_ms: dict[str, float]
+    skipped: int = 0
+
+    def __str__(self) -> str:
+        rec, rep = self.recorded_ms, self.replayed_ms
+
+        def diff(key):
+            return (rep[key] / rec[key] - 1) * 100 if rec[key] else 0.0
+
+        return "\n".join(
+            [
+                f"replayed   {self.total} ({self.errors} errors, {self.skipped} skipped)",
+                f"matched    {self.matched}, mismatched {len(self.mismatched)}",
+                "recorded   p50 {p50:.3f}ms  p99 {p99:.3f}ms  mean {mean:.3f}ms".format(**rec),
+                "replayed   p50 {p50:.3f}ms  p99 {p99:.3f}ms  mean {mean:.3f}ms".format(**rep),
+                f"change     p50 {diff('p50'):+.1f}%  p99 {diff('p99'):+.1f}%  mean {diff('mean'):+.1f}%",
+            ]
+        )
+
+
+def _summary(values: list[float]) -> dict[str, float]:
+    values = sorted(v * 1000 for v in values)
+    return {
+        "p50": percentile(values, 50),
+        "p99": percentile(values, 99),
+        "mean": sum(values) / len(values) if values else 0.0,
+    }
+
+
+async def replay(
+    records: Iterable[Record],
+    handler: Optional[Callable] = None,
+    app: Optional[Callable] = None,
+    path: str = "/skill",
+) -> ReplayReport:
+    """Feed records one by one to handler (SkillRequest -> Kakao | bytes) or an ASGI app"""
+    if (handler is None) == (app is None):
+        raise Exception("replay needs either handler or app")
+
+    recorded, replayed, mismatched = [], [], []
+    matched = errors = total = 0
+    for i, record in enumerate(records):
+        total += 1
+        body = record.request_body()
+        started = time.perf_counter()
+        try:
+            if app is not None:
+                _, out = await call_asgi(app, body, path)
+            else:
+                out = handler(decode_request(body))  # type: ignore
+                if inspect.isawaitable(out):
+                    out = await out
+                out = encode_response(out)
+        except Exception:
+            errors += 1
+            continue
+        replayed.append(time.perf_counter() - started)
+        recorded.append(record.duration)
+        expected = record.response_body()
+        if out != expected and not record.encoded & _RESPONSE:
+            out = bytes(_compact(out)[0])  # recorded JSON is compacted
+        if out == expected:
+            matched += 1
+        else:
+            mismatched.append(i)
+
+    return ReplayReport(
+        total,
+        matched,
+        mismatched,
+        errors,
+        _summary(recorded),
+        _summary(replayed),
+        getattr(records, "skipped", 0),
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m kakao_json.recorder")
+    sub = parser.add_subparsers(dest="command", required=True)
+    rep = sub.add_parser("replay", help="replay recordings through a handler or ASGI app")
+    rep.add_argument("files", nargs="+", help="recording files (glob patterns allowed)")
+    rep.add_argument("--target", required=True, help="module:handler or module:app")
+    rep.add_argument("--asgi", action="store_true", help="target is an ASGI app")
+    rep.add_argument("--path", default="/skill", help="request path for ASGI targets")
+    rep.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    files = sorted(f for pattern in args.files for f in glob.glob(pattern)) or args.files
+    target = _load_app(args.target)
+    records = read_records(*files)
+    if args.asgi:
+        report = asyncio.run(replay(records, app=target, path=args.path))
+    else:
+        report = asyncio.run(replay(records, handler=target))
+
+    print(msgspec.json.encode(report).decode() if args.json else report)
+    return 1 if report.mismatched or report.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
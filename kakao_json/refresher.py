@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import time
+from concurrent.futures import Executor
+from typing import Any, Callable, Optional, Union
+
+from msgspec import Struct
+
+from .deadline import retry_text
+from .kakao import Kakao
+from .skill import Handler, SkillRequest, encode_response
+
+__all__ = ["Refresher", "RefreshStatus"]
+
+Builder = Callable[[], Any]
+"""builder() -> Kakao | bytes, sync (thread pool) or async"""
+
+
+class RefreshStatus(Struct):
+    name: str
+    interval: float
+    ready: bool  # built at least once
+    refreshing: bool
+    updated: Optional[float]  # clock() of the last good build
+    failures: int  # failures since the last good build
+    error: Optional[str]  # last failure
+    size: int  # bytes of the current response
+
+
+class _Entry:
+    __slots__ = ("name", "builder", "interval", "retry", "body", "updated", "failures", "error", "task")
+
+    def __init__(self, name: str, builder: Builder, interval: float, retry: float):
+        self.name = name
+        self.builder = builder
+        self.interval = interval
+        self.retry = retry
+        self.body: Optional[bytes] = None
+        self.updated: Optional[float] = None
+        self.failures = 0
+        self.error: Optional[str] = None
+        self.task: Optional[asyncio.Future] = None
+
+
+def _build_sync(builder: Builder) -> bytes:
+    return encode_response(builder())
+
+
+class Refresher:
+    """# Refresher
+
+    만드는 데 오래 걸리지만 자주 바뀌지 않는 응답 (크롤링한 공지 ListCard 등)을 background 에서 주기적으로 다시 만듭니다.
+
+    - 이름마다 builder 와 갱신 주기를 등록합니다. sync builder 는 thread pool 에서, async builder 는 event loop 에서 실행합니다.
+    - 결과는 encode 된 bytes 로 저장하고, 다 만든 뒤에 한 번에 교체합니다.
+    - 요청은 항상 마지막으로 성공한 bytes 를 바로 받습니다. 갱신 중이거나 실패해도 마찬가지입니다. (stale-while-revalidate)
+    - 실패하면 retry 초 뒤에 다시 시도합니다.
+
+    ## Parameters
+
+    executor: sync builder 를 실행할 executor, 기본값 event loop 의 기본 executor
+
+    fallback: 첫 build 가 끝나기 전에 보낼 Kakao 혹은 bytes
+
+    ## Example
+
+    ```python
+    refresher = Refresher()
+
+    @refresher.schedule("notice", interval=3600)
+    def notice() -> Kakao:
+        rows = scrape_notices()  # 몇 초 걸림
+        ...
+
+    @app.on_event("startup")
+    async def startup():
+        await refresher.start()
+
+    @app.post("/notice")
+    async def skill():
+        return Response(refresher.get("notice"), media_type="application/json")
+    ```
+    """
+
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        fallback: Union[Kakao, bytes, None] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.executor = executor
+        self.fallback = encode_response(retry_text() if fallback is None else fallback)
+        self.clock = clock
+        self._entries: dict[str, _Entry] = {}
+        self._loops: list[asyncio.Task] = []
+
+    def add(
+        self, name: str, builder: Builder, interval: float, retry: Optional[float] = None
+    ) -> Refresher:
+        """Register builder, rebuilt every interval seconds (retry seconds after a failure)"""
+        if name in self._entries:
+            raise Exception(f"{name} is already registered")
+        if interval <= 0:
+            raise Exception("interval must be positive")
+        retry = min(interval, 30.0) if retry is None else retry
+        self._entries[name] = _Entry(name, builder, interval, retry)
+        return self
+
+    def schedule(self, name: str, interval: float, retry: Optional[float] = None) -> Callable:
+        """Decorator version of add"""
+
+        def decorator(builder: Builder) -> Builder:
+            self.add(name, builder, interval, retry)
+            return builder
+
+        return decorator
+
+    def get(self, name: str) -> bytes:
+        """Last good response of name, fallback before the first build"""
+        body = self._entries[name].body
+        return self.fallback if body is None else body
+
+    def handler(self, name: str) -> Handler:
+        """Skill handler that answers with get(name)"""
+
+        async def cached(request: SkillRequest) -> bytes:
+            return self.get(name)
+
+        return cached
+
+    async def refresh(self, name: str) -> bool:
+        """Rebuild name now, joins a refresh already running. True on success"""
+        entry = self._entries[name]
+        if entry.task is None:
+            entry.task = asyncio.ensure_future(self._build(entry))
+        return await asyncio.shield(entry.task)
+
+    async def _build(self, entry: _Entry) -> bool:
+        try:
+            if inspect.iscoroutinefunction(entry.builder):
+                body = encode_response(await entry.builder())
+            else:
+                loop = asyncio.get_running_loop()
+                body = await loop.run_in_executor(self.executor, _build_sync, entry.builder)
+        except Exception as e:
+            entry.failures += 1
+            entry.error = f"{type(e).__name__}: {e}"
+            return False
+        finally:
+            entry.task = None
+        # one attribute store, readers see the old or the new bytes
+        entry.body = body
+        entry.updated = self.clock()
+        entry.failures = 0
+        entry.error = None
+        return True
+
+    async def _loop(self, entry: _Entry) -> None:
+        while True:
+            await asyncio.sleep(entry.retry if entry.failures else entry.interval)
+            await self.refresh(entry.name)
+
+    async def start(self, wait: bool = True) -> None:
+        """Build everything once (wait=False: in the background) and start the refresh loops"""
+        if self._loops:
+            raise Exception("already started")
+        first = asyncio.gather(*(self.refresh(name) for name in self._entries))
+        if wait:
+            await first
+        self._loops = [asyncio.ensure_future(self._loop(entry)) for entry in self._entries.values()]
+
+    async def stop(self) -> None:
+        """Cancel the refresh loops, running builds are left to finish"""
+        loops, self._loops = self._loops, []
+        for task in loops:
+            task.cancel()
+        await asyncio.gather(*loops, return_exceptions=True)
+
+    def status(self, name: str) -> RefreshStatus:
+        entry = self._entries[name]
+        return RefreshStatus(
+            name=name,
+            interval=entry.interval,
+            ready=entry.body is not None,
+            refreshing=entry.task is not None,
+            updated=entry.updated,
+            failures=entry.failures,
+            error=entry.error,
+            size=len(entry.body or b""),
+        )
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    async def __aenter__(self) -> Refresher:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
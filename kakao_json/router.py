@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import inspect
+import unicodedata
+from collections import deque
+from typing import Any, Callable, Iterable, NamedTuple, Optional, Union
+
+from .kakao import Kakao
+from .skill import SkillRequest
+
+__all__ = ["KeywordMatch", "KeywordRouter", "normalize"]
+
+_SPACES = dict.fromkeys(map(ord, " \t\r\n 　"))
+
+
+def normalize(text: str) -> str:
+    """NFKC, lower case, whitespace removed ("학식 메뉴" == "학식메뉴")"""
+    return unicodedata.normalize("NFKC", text).lower().translate(_SPACES)
+
+
+class KeywordMatch(NamedTuple):
+    keyword: str
+    handler: Callable
+    start: int  # position in the normalized utterance
+    end: int
+
+
+class KeywordRouter:
+    """# KeywordRouter
+
+    발화 (`userRequest.utterance`)에 포함된 키워드로 handler 를 고릅니다.
+
+    등록된 키워드 전체를 Aho-Corasick automaton 으로 한 번 compile 하므로
+
+    매칭 시간은 키워드 수와 관계 없이 발화 길이에 비례합니다.
+
+    여러 키워드가 포함되어 있으면 priority 가 높은 것, 같으면 긴 키워드, 같으면 먼저 등록된 키워드를 고릅니다.
+
+    ## Example
+
+    ```python
+    router = KeywordRouter(default=fallback)
+
+    @router.route("학식", "식단", "밥 뭐야")
+    async def menu(req: SkillRequest) -> Kakao:
+        ...
+
+    router.add(["공지", "알림"], notice, priority=1)
+
+    body = (await router(req)).to_json()
+    ```
+    """
+
+    def __init__(
+        self,
+        default: Optional[Callable] = None,
+        normalize: Callable[[str], str] = normalize,
+    ):
+        self.default = default
+        self.normalize = normalize
+        self._keywords: list[tuple[str, Callable, int]] = []
+        self._compiled = False
+        self._goto: list[dict[str, int]] = []
+        self._fail: list[int] = []
+        self._best: list[int] = []
+        self._rank: list[tuple[int, int, int]] = []
+
+    def add(
+        self, keywords: Union[str, Iterable[str]], handler: Callable, priority: int = 0
+    ) -> KeywordRouter:
+        """Register handler for one or more keywords (synonyms)"""
+        if isinstance(keywords, str):
+            keywords = (keywords,)
+        for keyword in keywords:
+            normalized = self.normalize(keyword)
+            if not normalized:
+                raise Exception(f"empty keyword: {keyword!r}")
+            self._keywords.append((normalized, handler, priority))
+        self._compiled = False
+        return self
+
+    def route(self, *keywords: str, priority: int = 0) -> Callable:
+        """Decorator version of add"""
+
+        def decorator(handler: Callable) -> Callable:
+            self.add(keywords, handler, priority)
+            return handler
+
+        return decorator
+
+    def compile(self) -> KeywordRouter:
+        """Build the automaton, called automatically on the first match"""
+        goto: list[dict[str, int]] = [{}]
+        best = [-1]
+        rank = [
+            (priority, len(keyword), -i)
+            for i, (keyword, _, priority) in enumerate(self._keywords)
+        ]
+
+        for i, (keyword, _, _) in enumerate(self._keywords):
+            state = 0
+            for ch in keyword:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    best.append(-1)
+                state = nxt
+            if best[state] < 0 or rank[i] > rank[best[state]]:
+                best[state] = i
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                f = goto[f].get(ch, 0)
+                fail[nxt] = f if f != nxt else 0
+                # best match ending here, including keywords that are suffixes
+                inherited = best[fail[nxt]]
+                if inherited >= 0 and (best[nxt] < 0 or rank[inherited] > rank[best[nxt]]):
+                    best[nxt] = inherited
+
+        self._goto, self._fail, self._best, self._rank = goto, fail, best, rank
+        self._compiled = True
+        return self
+
+    def match(self, utterance: str) -> Optional[KeywordMatch]:
+        """Best keyword found in utterance, None if nothing matches"""
+        if not self._compiled:
+            self.compile()
+        goto, fail, best, rank = self._goto, self._fail, self._best, self._rank
+
+        text = self.normalize(utterance)
+        state = 0
+        found = -1
+        end = 0
+        for i, ch in enumerate(text):
+            nxt = goto[state].get(ch)
+            while nxt is None and state:
+                state = fail[state]
+                nxt = goto[state].get(ch)
+            state = 0 if nxt is None else nxt
+            b = best[state]
+            if b >= 0 and (found < 0 or rank[b] > rank[found]):
+                found, end = b, i + 1
+
+        if found < 0:
+            return None
+        keyword, handler, _ = self._keywords[found]
+        return KeywordMatch(keyword, handler, end - len(keyword), end)
+
+    async def __call__(self, request: SkillRequest) -> Union[Kakao, bytes, Any]:
+        """Run the handler of the best keyword (or default)"""
+        matched = self.match(request.userRequest.utterance)
+        handler = matched.handler if matched is not None else self.default
+        if handler is None:
+            raise Exception("no keyword matched and no default handler")
+        result = handler(request)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    def __len__(self) -> int:
+        return len(self._keywords)
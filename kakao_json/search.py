@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import heapq
+from collections import Counter
+from operator import itemgetter
+from typing import Optional
+
+import msgspec
+
+from .components.cards import ListCard
+from .components.common import ListItem
+
+__all__ = ["SearchIndex", "choseong", "decompose", "is_choseong"]
+
+_CHO = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONG = ("", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ",
+         "ㄿ", "ㅀ", "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ")
+
+# syllable -> jamo / choseong, built once (11172 syllables)
+_DECOMPOSE = {}
+_CHOSEONG = {}
+for _code in range(0xAC00, 0xD7A4):
+    _i = _code - 0xAC00
+    _syllable = chr(_code)
+    _DECOMPOSE[ord(_syllable)] = _CHO[_i // 588] + _JUNG[_i // 28 % 21] + _JONG[_i % 28]
+    _CHOSEONG[ord(_syllable)] = _CHO[_i // 588]
+_WHITESPACE = dict.fromkeys(map(ord, " \t\r\n"))
+_DECOMPOSE.update(_WHITESPACE)
+_CHOSEONG.update(_WHITESPACE)
+_CHO_SET = frozenset(_CHO) | frozenset("ㄳㄵㄶㄺㄻㄼㄽㄾㄿㅀㅄ")
+_SHARED = itemgetter(1)
+
+# deep copies of results: msgpack round trip is ~8x faster than copy.deepcopy
+_encoder = msgspec.msgpack.Encoder()
+_item_decoder = msgspec.msgpack.Decoder(ListItem)
+
+
+def decompose(text: str) -> str:
+    """"학식 메뉴" -> "ㅎㅏㄱㅅㅣㄱㅁㅔㄴㅠ" (lower case, whitespace removed)"""
+    return text.lower().translate(_DECOMPOSE)
+
+
+def choseong(text: str) -> str:
+    """"학식 메뉴" -> "ㅎㅅㅁㄴ" """
+    return text.lower().translate(_CHOSEONG)
+
+
+def is_choseong(query: str) -> bool:
+    """True if query is made of initial consonants only (ex: ㅎㅅ)"""
+    letters = query.translate(_WHITESPACE)
+    return bool(letters) and all(ch in _CHO_SET for ch in letters)
+
+
+def _grams(text: str, n: int) -> set[str]:
+    padded = f"^{text}$"
+    if len(padded) <= n:
+        return {padded}
+    return {padded[i : i + n] for i in range(len(padded) - n + 1)}
+
+
+class SearchIndex:
+    """# SearchIndex
+
+    오타와 초성 (ㅎㅅ -> 학식) 검색을 지원하는 검색 인덱스입니다. 결과는 바로 ListCard 에 넣을 수 있는 ListItem 입니다.
+
+    - 한글은 자모로 분해해서 3-gram inverted index 를 만듭니다. (오타에 강함)
+    - 초성만 입력한 검색어는 초성 2, 3-gram index 로 찾습니다.
+    - 순위: n-gram 유사도 (Dice) + 앞부분 일치/포함 가산점
+    - 검색어 gram 의 min_match 비율 이상이 겹치는 항목만 결과에 넣습니다. (우연히 gram 하나만 겹친 항목 제외)
+    - 검색어의 gram 이 많으면 (긴 검색어) 드문 gram 부터 budget 만큼만 세고,
+      많이 겹친 candidates 개의 항목만 나머지 gram 을 직접 확인해서 점수를 매깁니다.
+
+    ## Parameters
+
+    candidates: 긴 검색어에서 점수를 매길 최대 항목 수
+
+    budget: 세는 posting 수 (gram 의 절반은 항상 셉니다)
+
+    min_match: 결과에 넣을 최소 일치 비율 (겹친 gram 수 / 검색어 gram 수), 0 이면 제한 없음
+
+    ## Example
+
+    ```python
+    index = SearchIndex()
+    for notice in notices:
+        index.add(notice.title, notice.date, link=notice.url)
+
+    list_card = index.list_card("장학긍", header="검색 결과")  # 오타
+    index.search("ㅈㅎㄱ", k=5)  # 초성
+    ```
+    """
+
+    def __init__(self, candidates: int = 32, budget: int = 2000, min_match: float = 0.25):
+        self.candidates = candidates
+        self.budget = budget
+        self.min_match = min_match
+        self.items: list[ListItem] = []
+        self._jamo: list[str] = []
+        self._cho: list[str] = []
+        self._sizes: list[int] = []
+        self._min_size = 0
+        self._grams: dict[str, list[int]] = {}
+        self._cho_grams: dict[str, list[int]] = {}
+
+    def add(
+        self,
+        title: str,
+        description: Optional[str] = None,
+        link: Optional[str] = None,
+        image_url: Optional[str] = None,
+        text: Optional[str] = None,
+    ) -> int:
+        """Index a new entry, returns its id"""
+        item = ListItem(title, description, image_url)
+        if link:
+            item.set_link(link)
+        return self.add_item(item, text)
+
+    def add_item(self, item: ListItem, text: Optional[str] = None) -> int:
+        """Index an existing ListItem by its title (or text)"""
+        doc = len(self.items)
+        source = item.title if text is None else text
+        jamo = decompose(source)
+        cho = choseong(source)
+        grams = _grams(jamo, 3)
+
+        self.items.append(item)
+        self._jamo.append(jamo)
+        self._cho.append(cho)
+        self._sizes.append(len(grams))
+        if doc == 0 or len(grams) < self._min_size:
+            self._min_size = len(grams)
+        for gram in grams:
+            self._grams.setdefault(gram, []).append(doc)
+        for gram in _grams(cho, 2) | _grams(cho, 3):
+            self._cho_grams.setdefault(gram, []).append(doc)
+        return doc
+
+    def search_ids(self, query: str, k: int = 5) -> list[tuple[int, float]]:
+        """Top k (entry id, score), best first"""
+        if is_choseong(query):
+            return self._search_choseong(choseong(query), k)
+
+        q = decompose(query)
+        if not q or k < 1:
+            return []
+        q_grams = _grams(q, 3)
+        index = self._grams
+        # rarest grams first
+        postings = sorted((len(docs), gram, docs) for gram in q_grams if (docs := index.get(gram)))
+        m = len(postings)
+        if not m:
+            return []
+
+        # count the rarest grams (at least half of them) within budget, frequent grams cost the most
+        # and rank the least. uncounted grams are checked only for the best candidates
+        counts: Counter = Counter()
+        counted = total = 0
+        for size, _, docs in postings:
+            if counted * 2 >= m and total + size > self.budget:
+                break
+            counts.update(docs)
+            counted += 1
+            total += size
+        uncounted = [gram for _, gram, _ in postings[counted:]]
+        rest = len(uncounted)
+
+        sizes, jamo = self._sizes, self._jamo
+        n_q = len(q_grams)
+        need = self.min_match * n_q
+        min_size = self._min_size
+        top: list[tuple[float, int]] = []  # k best (score, -doc), worst first
+        # most shared grams first, stop when no later entry can beat the k-th best
+        if rest:
+            ranked = heapq.nlargest(self.candidates, counts.items(), key=_SHARED)
+        else:
+            ranked = sorted(counts.items(), key=_SHARED, reverse=True)
+        for doc, shared in ranked:
+            if shared + rest < need:
+                break
+            if len(top) == k:
+                most = min(m, shared + rest)
+                # prefix match shares every gram but "x$", substring every gram but "^x" and "x$"
+                bonus = 0.5 if most >= n_q - 1 else 0.25 if most >= n_q - 2 else 0.0
+                if 2 * most / (n_q + max(most, min_size)) + bonus < top[0][0]:
+                    break
+            text = jamo[doc]
+            if rest:
+                padded = f"^{text}$"
+                shared += sum(map(padded.__contains__, uncounted))
+                if shared < need:
+                    continue
+            score = 2 * shared / (n_q + sizes[doc])
+            if text.startswith(q):
+                score += 0.5
+            elif q in text:
+                score += 0.25
+            if len(top) < k:
+                heapq.heappush(top, (score, -doc))
+            elif (score, -doc) > top[0]:
+                heapq.heapreplace(top, (score, -doc))
+        return [(-doc, score) for score, doc in sorted(top, reverse=True)]
+
+    def _search_choseong(self, q: str, k: int) -> list[tuple[int, float]]:
+        postings, cho = self._cho_grams, self._cho
+
+        def rank(docs, prefix_only):
+            scored = []
+            for doc in docs:
+                text = cho[doc]
+                pos = 0 if text.startswith(q) else -1 if prefix_only else text.find(q)
+                if pos >= 0:
+                    # prefix first, then shorter titles
+                    score = (1.0 if pos == 0 else 0.5) + len(q) / len(text)
+                    scored.append((score, -doc))
+            return scored
+
+        # prefix matches rank first, enough of them means no full scan
+        scored = rank(postings.get("^" + q[:2], ()), True)
+        if len(scored) < k and len(q) > 1:
+            n = 3 if len(q) >= 3 else 2
+            grams = {q[i : i + n] for i in range(len(q) - n + 1)}
+            # the rarest gram gives the smallest candidate set, then verify
+            scored = rank(min((postings.get(g, ()) for g in grams), key=len), False)
+        return [(-doc, score) for score, doc in heapq.nlargest(k, scored)]
+
+    def search(self, query: str, k: int = 5) -> list[ListItem]:
+        """Top k ListItems (deep copies, changing them does not change the index)"""
+        items, encode, decode = self.items, _encoder.encode, _item_decoder.decode
+        return [decode(encode(items[doc])) for doc, _ in self.search_ids(query, k)]
+
+    def list_card(
+        self, query: str, header: Optional[str] = None, k: int = 5
+    ) -> Optional[ListCard]:
+        """ListCard of the top results (max 5 items), None if nothing matches"""
+        items = self.search(query, min(k, 5))
+        if not items:
+            return None
+        card = ListCard().set_header(f"'{query}' 검색 결과" if header is None else header)
+        return card.add_item(*items)
+
+    def __len__(self) -> int:
+        return len(self.items)
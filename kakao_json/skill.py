@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable, Optional, Union
+
+import msgspec
+from msgspec import Struct, field
+
+from .kakao import Kakao
+
+__all__ = [
+    "Block",
+    "Intent",
+    "User",
+    "UserRequest",
+    "Bot",
+    "DetailParam",
+    "Action",
+    "SkillRequest",
+    "Handler",
+    "decode_request",
+    "encode_response",
+    "text_response",
+]
+
+
+class Block(Struct, omit_defaults=True):
+    id: str = ""
+    name: str = ""
+
+
+class Intent(Struct, omit_defaults=True):
+    id: str = ""
+    name: str = ""
+    extra: Optional[dict[str, Any]] = None
+
+
+class User(Struct, omit_defaults=True):
+    """# User
+
+    ## Attributes:
+        - id: String, 사용자를 식별할 수 있는 key (봇마다 다름)
+
+        - type: String, 현재는 botUserKey 만 제공
+
+        - properties: Map<String, Any>, plusfriendUserKey, appUserId 등 추가 정보
+    """
+
+    id: str = ""
+    type: str = "botUserKey"
+    properties: dict[str, Any] = {}
+
+
+class UserRequest(Struct, omit_defaults=True):
+    """# UserRequest
+
+    ## Attributes:
+        - timezone: String, 사용자의 시간대 (Asia/Seoul)
+
+        - block: Block, 사용자의 발화에 반응한 블록의 정보
+
+        - utterance: String, 봇 시스템에 전달된 사용자의 발화
+
+        - lang: String, 사용자의 언어 (kr)
+
+        - user: User, 사용자 정보
+
+        - params: Map<String, String>, 요청 파라미터
+
+        - callbackUrl: String, AI 챗봇 콜백 응답을 보낼 url
+    """
+
+    utterance: str = ""
+    user: User = field(default_factory=User)
+    block: Block = field(default_factory=Block)
+    timezone: str = "Asia/Seoul"
+    lang: Optional[str] = None
+    params: dict[str, Any] = {}
+    callbackUrl: Optional[str] = None
+
+
+class Bot(Struct, omit_defaults=True):
+    id: str = ""
+    name: str = ""
+
+
+class DetailParam(Struct, omit_defaults=True):
+    """# DetailParam
+
+    ## Attributes:
+        - origin: String, 사용자 발화에서 추출된 원본 값
+
+        - value: String, 엔티티로 변환된 값 (sys.plugin.* 은 JSON 문자열)
+
+        - groupName: String, 엔티티 그룹 이름
+    """
+
+    origin: str = ""
+    value: Any = None
+    groupName: str = ""
+
+
+class Action(Struct, omit_defaults=True):
+    """# Action
+
+    ## Attributes:
+        - id: String, 스킬 id
+
+        - name: String, 스킬 이름
+
+        - params: Map<String, String>, 사용자 발화에서 추출된 파라미터
+
+        - detailParams: Map<String, DetailParam>, 파라미터의 상세 정보
+
+        - clientExtra: Map<String, Any>, 버튼/바로가기 응답의 extra 값
+    """
+
+    id: str = ""
+    name: str = ""
+    params: dict[str, Any] = {}
+    detailParams: dict[str, DetailParam] = {}
+    clientExtra: Optional[dict[str, Any]] = None
+
+
+class SkillRequest(Struct, omit_defaults=True):
+    """# SkillRequest
+
+    스킬 서버로 들어오는 요청 payload 입니다.
+
+    ```python
+    req = decode_request(await request.body())
+    req.userRequest.utterance
+    req.userRequest.user.id
+    ```
+    """
+
+    userRequest: UserRequest = field(default_factory=UserRequest)
+    intent: Intent = field(default_factory=Intent)
+    bot: Bot = field(default_factory=Bot)
+    action: Action = field(default_factory=Action)
+
+
+Handler = Callable[[SkillRequest], Awaitable[Union[Kakao, bytes]]]
+"""async handler, SkillRequest 를 받아서 Kakao (혹은 이미 encode 된 bytes)를 반환"""
+
+_decoder = msgspec.json.Decoder(SkillRequest)
+
+
+def decode_request(data: Union[bytes, str]) -> SkillRequest:
+    """Decode skill request payload (JSON)"""
+    return _decoder.decode(data)
+
+
+def encode_response(response: Union[Kakao, bytes]) -> bytes:
+    """Kakao -> JSON bytes, bytes are returned as is"""
+    if isinstance(response, (bytes, bytearray, memoryview)):
+        return bytes(response)
+    return response.to_json()
+
+
+def text_response(text: str) -> bytes:
+    """JSON bytes of a response with a single SimpleText (fallback, 거절 응답용)"""
+    k = Kakao()
+    k.add_simple_text(text)
+    return k.to_json()
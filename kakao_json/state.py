@@ -0,0 +1,159 @@
+"""# state
+
+버튼/바로가기/리스트 항목의 `extra` 에 대화 상태를 서명된 짧은 token 으로 담습니다.
+
+다음 요청의 `action.clientExtra` 에서 token 을 검증하고 decode 하므로 세션 저장소를 거치지 않아도 됩니다.
+
+- msgpack 으로 encode 하고, 길면 압축합니다. (deflate)
+- HMAC-SHA256 (16 bytes)으로 서명하므로 사용자가 값을 바꾸면 검증에 실패합니다.
+- 발급 시각이 들어 있어서 max_age 가 지난 token 은 거부합니다.
+- 암호화는 아닙니다. 사용자가 내용을 읽을 수 있으므로 비밀 값은 넣지 마세요.
+
+```python
+class Cart(Struct):
+    page: int
+    items: list[int]
+
+signer = StateSigner(os.environ["STATE_SECRET"], max_age=3600)
+
+button = signer.attach(Button("다음", "block", blockId="..."), Cart(2, [1, 5]))
+k.add_qr("이전", extra=signer.extra(Cart(1, [1, 5])))
+
+cart = signer.from_request(req, Cart)  # None 이면 없거나 잘못된 token
+```
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import hmac
+import struct
+import time
+import zlib
+from typing import Any, Callable, Optional, Sequence, TypeVar, Union
+
+import msgspec
+
+from ._msgpack import decoder
+from .skill import SkillRequest
+
+__all__ = ["InvalidToken", "StateSigner"]
+
+T = TypeVar("T")
+E = TypeVar("E")
+
+_VERSION = 0x10
+_COMPRESSED = 0x01
+_HEADER = struct.Struct(">BI")  # version | flags, issued at (seconds)
+_TAG = 16
+
+_encoder = msgspec.msgpack.Encoder()
+
+
+class InvalidToken(Exception):
+    """Token is malformed, tampered with or expired"""
+
+
+def _key(secret: Union[str, bytes]) -> bytes:
+    return secret.encode() if isinstance(secret, str) else secret
+
+
+class StateSigner:
+    """# StateSigner
+
+    ## Parameters
+
+    secret: 서명 key, 여러 개면 첫 번째로 서명하고 모두로 검증합니다. (key 교체)
+
+    max_age: token 유효 시간 (초), None 이면 만료 없음
+
+    key: extra 에서 token 을 담을 key
+
+    compress_min: 이 길이 이상이면 압축을 시도합니다. (더 짧아질 때만 사용)
+    """
+
+    def __init__(
+        self,
+        secret: Union[str, bytes, Sequence[Union[str, bytes]]],
+        max_age: Optional[float] = None,
+        key: str = "state",
+        compress_min: int = 64,
+        clock: Callable[[], float] = time.time,
+    ):
+        secrets = [secret] if isinstance(secret, (str, bytes)) else list(secret)
+        if not secrets or not all(secrets):
+            raise Exception("secret must not be empty")
+        self.keys = [_key(s) for s in secrets]
+        self.max_age = max_age
+        self.key = key
+        self.compress_min = compress_min
+        self.clock = clock
+        self.invalid = 0
+
+    def _sign(self, key: bytes, message: bytes) -> bytes:
+        return hmac.digest(key, message, hashlib.sha256)[:_TAG]
+
+    def dumps(self, state: Any) -> str:
+        """state (Struct, dict, list ...) -> url safe token"""
+        payload = _encoder.encode(state)
+        flags = 0
+        if len(payload) >= self.compress_min:
+            compressed = zlib.compress(payload, 9, wbits=-15)
+            if len(compressed) < len(payload):
+                payload, flags = compressed, _COMPRESSED
+        message = _HEADER.pack(_VERSION | flags, int(self.clock())) + payload
+        token = message + self._sign(self.keys[0], message)
+        return base64.urlsafe_b64encode(token).rstrip(b"=").decode("ascii")
+
+    def loads(self, token: str, type: Union[type[T], Any] = Any) -> T:
+        """Verify and decode a token, raises InvalidToken"""
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        except (binascii.Error, ValueError, TypeError):
+            raise InvalidToken("malformed token") from None
+        if len(raw) < _HEADER.size + _TAG:
+            raise InvalidToken("malformed token")
+
+        message, tag = raw[:-_TAG], raw[-_TAG:]
+        if not any(hmac.compare_digest(self._sign(key, message), tag) for key in self.keys):
+            raise InvalidToken("bad signature")
+        version, issued = _HEADER.unpack_from(message)
+        if version & 0xF0 != _VERSION:
+            raise InvalidToken("unknown token version")
+        if self.max_age is not None and self.clock() - issued > self.max_age:
+            raise InvalidToken("token expired")
+
+        payload = message[_HEADER.size :]
+        if version & _COMPRESSED:
+            payload = zlib.decompress(payload, wbits=-15)
+        try:
+            return decoder(type).decode(payload)
+        except msgspec.ValidationError as e:
+            raise InvalidToken(f"unexpected state: {e}") from None
+
+    def extra(self, state: Any, extra: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+        """extra dict carrying the token (merged into extra if given)"""
+        out = dict(extra) if extra else {}
+        out[self.key] = self.dumps(state)
+        return out
+
+    def attach(self, target: E, state: Any) -> E:
+        """Put the token in Button / ListItem / QuickReply extra, returns target"""
+        target.set_extra(self.extra(state, target.extra))  # type: ignore
+        return target
+
+    def from_request(
+        self, request: SkillRequest, type: Union[type[T], Any] = Any, default: Any = None
+    ) -> Optional[T]:
+        """State of action.clientExtra, default if missing or invalid (counted in invalid)"""
+        extra = request.action.clientExtra
+        token = extra.get(self.key) if extra else None
+        if not isinstance(token, str):
+            return default
+        try:
+            return self.loads(token, type)
+        except InvalidToken:
+            self.invalid += 1
+            return default
@@ -0,0 +1,100 @@
+import asyncio
+
+import msgspec
+
+from kakao_json import Kakao
+from kakao_json.admission import AdmissionController, busy_text
+from kakao_json.skill import SkillRequest
+
+
+def reply(text):
+    k = Kakao()
+    k.add_simple_text(text)
+    return k
+
+
+class TestAdmissionController:
+    def test_limit_and_queue(self):
+        async def main():
+            admission = AdmissionController(limit=2, queue_size=2, service_time=0.01)
+            running = 0
+            peak = 0
+
+            async def handler(req):
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.02)
+                running -= 1
+                return reply("ok")
+
+            wrapped = admission.wrap(handler)
+            results = await asyncio.gather(*(wrapped(SkillRequest()) for _ in range(6)))
+            return admission, peak, results
+
+        admission, peak, results = asyncio.run(main())
+        assert peak == 2
+        assert [isinstance(r, Kakao) for r in results] == [True] * 4 + [False] * 2
+        assert results[-1] == busy_text()
+        metrics = admission.metrics()
+        assert (metrics.admitted, metrics.shed_full, metrics.active, metrics.queued) == (4, 2, 0, 0)
+        assert metrics.shed_rate == 2 / 6
+        assert b'"shed_full":2' in msgspec.json.encode(metrics)
+
+    def test_shed_by_estimated_wait(self):
+        async def main():
+            # 1s per request, 1 slot: the 4th waiter would finish after 4.5s
+            admission = AdmissionController(limit=1, queue_size=100, deadline=4.5, service_time=1.0)
+            assert await admission.acquire()
+            assert admission.estimated_wait() == 1.0
+            waiters = [asyncio.ensure_future(admission.acquire()) for _ in range(5)]
+            await asyncio.sleep(0)
+            assert admission.queued == 3
+            assert admission.shed_deadline == 2
+            for _ in range(4):
+                admission.release(1.0)
+                await asyncio.sleep(0)
+            return admission, await asyncio.gather(*waiters)
+
+        admission, results = asyncio.run(main())
+        assert results == [True, True, True, False, False]
+        assert admission.active == 0
+
+    def test_queue_timeout_and_cancel(self):
+        async def main():
+            admission = AdmissionController(limit=1, deadline=0.06, service_time=0.01)
+            assert await admission.acquire()
+            assert not await admission.acquire()  # waited 0.05s
+            assert admission.shed_timeout == 1
+
+            waiter = asyncio.ensure_future(admission.acquire())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            await asyncio.gather(waiter, return_exceptions=True)
+            assert admission.queued == 0
+            admission.release()
+            return admission
+
+        admission = asyncio.run(main())
+        assert admission.active == 0
+        assert admission.shed == 1
+
+    def test_slot_handed_over_as_wait_times_out(self, monkeypatch):
+        # release() hands the slot over, the wait still ends with a timeout (same tick)
+        async def wait_for(aw, timeout):
+            await aw
+            raise asyncio.TimeoutError
+
+        monkeypatch.setattr(asyncio, "wait_for", wait_for)
+
+        async def main():
+            admission = AdmissionController(limit=1, deadline=1.0, service_time=0.01)
+            assert await admission.acquire()
+            waiter = asyncio.ensure_future(admission.acquire())
+            await asyncio.sleep(0)
+            admission.release()
+            return admission, await waiter
+
+        admission, admitted = asyncio.run(main())
+        assert not admitted and admission.shed_timeout == 1
+        assert admission.active == 0 and admission.queued == 0  # the slot is not leaked
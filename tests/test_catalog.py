@@ -0,0 +1,92 @@
+import math
+
+import msgspec
+import pytest
+
+from kakao_json import catalog
+from kakao_json.catalog import commerce_carousels, commerce_cards, commerce_prices
+
+NAN = math.nan
+
+# price, discount, discountRate, dicountedPrice -> expected (discount, rate, discounted)
+CASES = [
+    ((10000, 7000, None, 2000), (7000, 80, 2000)),  # discountedPrice wins
+    ((10000, None, 70, 2000), (None, 70, 2000)),
+    ((10000, 7000, None, None), (7000, 70, 3000)),
+    ((10000, None, 30, None), (None, 30, 7000)),
+    ((10000, 1000, 30, None), (1000, 30, 7000)),  # rate before discount
+    ((10000, None, None, None), (None, None, None)),
+    ((10000, 20000, None, None), (20000, 100, 0)),  # clipped
+    ((0, None, None, 0), (None, None, 0)),
+    ((10000, None, 150, None), (None, 100, 0)),  # rate clipped to 0..100
+    ((10000, None, -10, None), (None, 0, 10000)),
+    ((10000, 333.5, None, None), (334, 3, 9666)),  # fractional values are rounded first
+    ((999.9, None, 10, None), (None, 10, 900)),
+]
+
+
+def columns(with_nan=False):
+    missing = NAN if with_nan else None
+    rows = [case[0] for case in CASES]
+    return [[missing if v is None else v for v in col] for col in zip(*rows)]
+
+
+def expected():
+    return [case[1] for case in CASES]
+
+
+class TestCommercePrices:
+    def test_python(self):
+        price, discount, rate, dp = columns()
+        _, d, r, p = catalog._prices_python(price, discount, rate, dp, True)
+        assert list(zip(d, r, p)) == expected()
+
+    def test_numpy(self):
+        np = pytest.importorskip("numpy")
+        price, discount, rate, dp = columns(with_nan=True)
+        out = catalog._prices_numpy(
+            np.array(price), np.array(discount), np.array(rate), np.array(dp), True
+        )
+        assert list(zip(*out[1:])) == expected()
+        assert all(type(v) is int for col in out for v in col if v is not None)
+
+    def test_parity(self):
+        np = pytest.importorskip("numpy")
+        rng = np.random.default_rng(7)
+        n = 2000
+        price = rng.integers(0, 100000, n) + rng.choice([0, 0.5, 0.25, 0.75], n)
+        discount = np.where(rng.random(n) < 0.5, rng.random(n) * 20000 - 1000, np.nan)
+        rate = np.where(rng.random(n) < 0.3, rng.random(n) * 140 - 20, np.nan)
+        dp = np.where(rng.random(n) < 0.2, rng.random(n) * 100000, np.nan)
+        for fill_rate in (True, False):
+            assert catalog._prices_numpy(price, discount, rate, dp, fill_rate) == (
+                catalog._prices_python(price.tolist(), discount.tolist(), rate.tolist(), dp.tolist(), fill_rate)
+            )
+
+    def test_no_fill_rate(self):
+        _, _, rate, dp = commerce_prices([10000], discount=[3000], fill_rate=False)
+        assert (rate, dp) == ([None], [7000])
+
+    def test_length_mismatch(self):
+        with pytest.raises(Exception):
+            commerce_prices([1, 2], discount=[1])
+
+
+class TestCommerceCards:
+    def test_cards(self):
+        cards = commerce_cards(
+            ["a", "b"], [10000, 5000], discount_rate=[10, None], image_url=["https://img/a", None]
+        )
+        assert msgspec.json.encode(cards) == (
+            b'[{"description":"a","price":10000,"currency":"won","discountRate":10,'
+            b'"dicountedPrice":9000,"thumbnails":[{"imageUrl":"https://img/a"}]},'
+            b'{"description":"b","price":5000,"currency":"won"}]'
+        )
+
+    def test_carousels(self):
+        carousels = commerce_carousels(
+            [f"item {i}" for i in range(25)], list(range(1000, 26000, 1000))
+        )
+        assert [len(c.items) for c in carousels] == [10, 10, 5]
+        assert {c.type for c in carousels} == {"commerceCard"}
+        assert carousels[2].items[-1].description == "item 24"
@@ -0,0 +1,75 @@
+import asyncio
+import time
+
+import msgspec
+
+from kakao_json import BasicCard, Kakao, ListItem
+from kakao_json.compose import Composer
+
+
+async def notice():
+    await asyncio.sleep(0.05)
+    card = Kakao().init_list_card().set_header("공지")
+    return card.add_item(ListItem("공지 1"))
+
+
+async def weather():
+    await asyncio.sleep(0.01)
+    return BasicCard().set_title("맑음")
+
+
+async def menu():
+    await asyncio.sleep(0.05)
+    carousel = Kakao().init_carousel()
+    for i in range(2):
+        carousel.add_card(BasicCard().set_title(f"메뉴 {i}"))
+    return carousel
+
+
+async def slow():
+    await asyncio.sleep(1)
+    return BasicCard().set_title("too late")
+
+
+async def broken():
+    raise RuntimeError("backend down")
+
+
+class TestComposer:
+    def test_order_and_concurrency(self):
+        base = Kakao()
+        base.add_qr("처음으로")
+
+        async def main():
+            started = time.perf_counter()
+            k = await Composer(base).slot(notice()).slot(weather).slot(menu()).build()
+            return k, time.perf_counter() - started
+
+        k, elapsed = asyncio.run(main())
+        outputs = k.template.outputs
+        assert [type(o).__name__ for o in outputs] == ["OuterListCard", "OuterBasicCard", "OuterCarousel"]
+        encoded = msgspec.json.decode(k.to_json())["template"]["outputs"]
+        assert encoded[2]["carousel"]["type"] == "basicCard"
+        assert outputs[1].basicCard.title == "맑음"
+        assert k.template.quickReplies[0].label == "처음으로"
+        assert elapsed < 0.1
+
+    def test_timeouts_and_placeholders(self):
+        composer = (
+            Composer()
+            .slot(slow(), timeout=0.02)
+            .slot(weather())
+            .slot(broken(), placeholder="잠시 후 다시 시도해주세요.")
+            .slot(slow(), timeout=0.02, placeholder=BasicCard().set_title("placeholder"))
+        )
+        k = asyncio.run(composer.build())
+        assert [type(o).__name__ for o in k.template.outputs] == [
+            "OuterBasicCard",
+            "OuterSimpleText",
+            "OuterBasicCard",
+        ]
+        assert k.template.outputs[2].basicCard.title == "placeholder"
+        errors = composer.errors
+        assert isinstance(errors[0], asyncio.TimeoutError)
+        assert errors[1] is None
+        assert isinstance(errors[2], RuntimeError)
@@ -0,0 +1,144 @@
+import asyncio
+
+from kakao_json import Kakao
+from kakao_json.deadline import Deadline, DeadlineRunner, retry_text
+from kakao_json.skill import SkillRequest, User, UserRequest
+
+
+def make_request(utterance="공지", callback_url=None, user="u1"):
+    return SkillRequest(
+        UserRequest(utterance=utterance, callbackUrl=callback_url, user=User(user))
+    )
+
+
+def answer(text):
+    k = Kakao()
+    k.add_simple_text(text)
+    return k
+
+
+class TestDeadline:
+    def test_deadline(self):
+        async def main():
+            deadline = Deadline(0.05)
+            assert not deadline.expired()
+            assert 0 < deadline.remaining() <= 0.05
+            slow = await deadline.wait_for(asyncio.sleep(1, "late"), default="default")
+            fast = await Deadline(1).wait_for(asyncio.sleep(0, "fast"))
+            return deadline, slow, fast
+
+        deadline, slow, fast = asyncio.run(main())
+        assert deadline.expired() and deadline.remaining() == 0.0
+        assert (slow, fast) == ("default", "fast")
+
+    def test_fast_handler(self):
+        async def handler(req, deadline):
+            assert isinstance(deadline, Deadline)
+            return answer(req.userRequest.utterance)
+
+        runner = DeadlineRunner(handler, budget=1)
+        body = asyncio.run(runner(make_request()))
+        assert body == answer("공지").to_json()
+        assert runner.timeouts == 0
+
+    def test_fallback_then_cached(self):
+        delay = [0.2]
+
+        async def handler(req, deadline):
+            await asyncio.sleep(delay[0])
+            return answer("late result")
+
+        runner = DeadlineRunner(handler, budget=0.05)
+
+        async def main():
+            first = await runner(make_request())
+            await runner.drain()
+            second = await runner(make_request())
+            other = await runner(make_request("다른 발화"))
+            other_user = await runner(make_request(user="u2"))
+            await runner.drain()
+            return first, second, other, other_user
+
+        first, second, other, other_user = asyncio.run(main())
+        assert first == retry_text()
+        assert second == answer("late result").to_json()
+        assert other == retry_text()
+        # the cached answer belongs to u1
+        assert other_user == retry_text()
+        assert runner.timeouts == 4
+
+    def test_shared_cache_key(self):
+        async def handler(req, deadline):
+            await asyncio.sleep(0.2)
+            return answer("late result")
+
+        runner = DeadlineRunner(
+            handler, budget=0.05, key=lambda req: req.userRequest.utterance
+        )
+
+        async def main():
+            await runner(make_request(user="u1"))
+            await runner.drain()
+            return await runner(make_request(user="u2"))
+
+        assert asyncio.run(main()) == answer("late result").to_json()
+
+    def test_callback(self):
+        sent = []
+
+        async def handler(req, deadline):
+            await asyncio.sleep(0.1)
+            return answer("done")
+
+        async def send_callback(url, body):
+            sent.append((url, body))
+
+        runner = DeadlineRunner(
+            handler, budget=0.02, callback=True, send_callback=send_callback
+        )
+
+        async def main():
+            ack = await runner(make_request(callback_url="https://callback/1"))
+            no_url = await runner(make_request("x"))
+            await runner.drain()
+            return ack, no_url
+
+        ack, no_url = asyncio.run(main())
+        assert ack == b'{"version":"2.0","useCallback":true,"data":{"text":"\xeb\x8b\xb5\xeb\xb3\x80\xec\x9d\x84 \xec\xa4\x80\xeb\xb9\x84\xed\x95\x98\xea\xb3\xa0 \xec\x9e\x88\xec\x96\xb4\xec\x9a\x94."}}'
+        assert no_url == retry_text()
+        assert sent == [("https://callback/1", answer("done").to_json())]
+
+    def test_caller_cancelled(self):
+        started = []
+
+        async def handler(req, deadline):
+            started.append(asyncio.current_task())
+            await asyncio.sleep(1)
+            return answer("never")
+
+        runner = DeadlineRunner(handler, budget=0.5)
+
+        async def main():
+            call = asyncio.ensure_future(runner(make_request()))
+            await asyncio.sleep(0.01)
+            call.cancel()
+            await asyncio.gather(call, return_exceptions=True)
+            await asyncio.sleep(0.01)
+            return started[0].cancelled()
+
+        assert asyncio.run(main())
+
+    def test_late_failure_logged(self, caplog):
+        async def handler(req, deadline):
+            await asyncio.sleep(0.05)
+            raise ValueError("boom")
+
+        runner = DeadlineRunner(handler, budget=0.01)
+
+        async def main():
+            first = await runner(make_request())
+            await runner.drain()
+            return first
+
+        assert asyncio.run(main()) == retry_text()
+        assert [r.exc_info[0] for r in caplog.records] == [ValueError]
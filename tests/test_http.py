@@ -0,0 +1,43 @@
+import asyncio
+
+import pytest
+
+from kakao_json._http import read_chunk, read_head
+
+
+def feed(data: bytes) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+class TestHttp:
+    def test_chunked(self):
+        async def main():
+            reader = feed(
+                b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+                b"3;ext=1\r\nabc\r\n2\r\nde\r\n0\r\n\r\nnext"
+            )
+            status, headers = await read_head(reader)
+            chunks = []
+            while chunk := await read_chunk(reader):
+                chunks.append(chunk)
+            return status, headers, chunks, await reader.read()
+
+        status, headers, chunks, rest = asyncio.run(main())
+        assert (status, headers) == (200, {"transfer-encoding": "chunked"})
+        assert chunks == [b"abc", b"de"]
+        assert rest == b"next"
+
+    def test_head(self):
+        async def head(data):
+            return await read_head(feed(data))
+
+        assert asyncio.run(head(b"HTTP/1.0 206 Partial\r\nContent-Length: 4\r\n\r\n")) == (
+            206, {"content-length": "4", "connection": "close"},
+        )
+        with pytest.raises(EOFError):
+            asyncio.run(head(b""))
+        with pytest.raises(ValueError):
+            asyncio.run(head(b"SSH-2.0\r\n\r\n"))
@@ -0,0 +1,113 @@
+import asyncio
+
+from kakao_json import Kakao
+from kakao_json.idempotency import Idempotency, fingerprint
+from kakao_json.skill import Action, Block, SkillRequest, User, UserRequest
+
+
+def request(user="u1", utterance="공지", params=None):
+    return SkillRequest(
+        UserRequest(utterance=utterance, user=User(user), block=Block("b1")),
+        action=Action(params=params or {}),
+    )
+
+
+class TestFingerprint:
+    def test_fingerprint(self):
+        base = fingerprint(request(params={"a": "1", "b": "2"}))
+        assert base == fingerprint(request(params={"b": "2", "a": "1"}))
+        assert base != fingerprint(request(params={"a": "1", "b": "3"}))
+        assert base != fingerprint(request(user="u2", params={"a": "1", "b": "2"}))
+        assert base != fingerprint(request(utterance="x", params={"a": "1", "b": "2"}))
+
+
+class TestIdempotency:
+    def test_duplicates_share_one_run(self):
+        calls = []
+
+        async def handler(req):
+            calls.append(req)
+            await asyncio.sleep(0.05)
+            k = Kakao()
+            k.add_simple_text(f"run {len(calls)}")
+            return k
+
+        skill = Idempotency(handler)
+
+        async def main():
+            first = await asyncio.gather(*(skill(request()) for _ in range(5)))
+            again = await skill(request())
+            other = await skill(request(user="u2"))
+            return first, again, other
+
+        first, again, other = asyncio.run(main())
+        assert len(calls) == 2
+        assert set(first) == {again}
+        assert b"run 1" in again and b"run 2" in other
+        assert (skill.joined, skill.hits) == (4, 1)
+
+    def test_errors_are_not_cached(self):
+        calls = []
+
+        async def handler(req):
+            calls.append(req)
+            await asyncio.sleep(0.01)
+            if len(calls) == 1:
+                raise RuntimeError("db down")
+            return b'{"ok":true}'
+
+        skill = Idempotency(handler)
+
+        async def main():
+            results = await asyncio.gather(skill(request()), skill(request()), return_exceptions=True)
+            return results, await skill(request())
+
+        results, retried = asyncio.run(main())
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert retried == b'{"ok":true}'
+        assert len(calls) == 2
+
+    def test_retry_after_ttl_window(self):
+        calls = []
+
+        async def handler(req):
+            calls.append(req)
+            return b'{"ok":true}'
+
+        skill = Idempotency(handler, ttl=0.05)
+
+        async def main():
+            await skill(request())
+            await asyncio.sleep(0.03)
+            cached = await skill(request())
+            await asyncio.sleep(0.06)
+            return cached, await skill(request())
+
+        cached, expired = asyncio.run(main())
+        assert cached == expired == b'{"ok":true}'
+        assert len(calls) == 2 and skill.hits == 1
+
+    def test_owner_cancelled(self):
+        calls = []
+
+        async def handler(req):
+            calls.append(req)
+            await asyncio.sleep(0.05)
+            return b'{"ok":true}'
+
+        skill = Idempotency(handler)
+
+        async def main():
+            owner = asyncio.ensure_future(skill(request()))
+            await asyncio.sleep(0)
+            waiter = asyncio.ensure_future(skill(request()))
+            await asyncio.sleep(0.01)
+            owner.cancel()
+            joined = await waiter
+            return owner, joined, await skill(request())
+
+        owner, joined, cached = asyncio.run(main())
+        assert owner.cancelled()
+        assert joined == cached == b'{"ok":true}'
+        assert len(calls) == 1
+        assert (skill.joined, skill.hits) == (1, 1)
@@ -0,0 +1,158 @@
+import asyncio
+import functools
+import struct
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from kakao_json import BasicCard, Profile, Thumbnail
+from kakao_json.image import ImageInfo, ImageProbe, parse_image_size
+from kakao_json.kakao import Carousel
+
+
+def png(width, height):
+    ihdr = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + struct.pack(">I", 13) + b"IHDR" + ihdr + b"\x00" * 64
+
+
+def gif(width, height):
+    return b"GIF89a" + struct.pack("<HH", width, height) + b"\x00" * 16
+
+
+def jpeg(width, height):
+    app0 = b"\xff\xe0" + struct.pack(">H", 16) + b"JFIF\x00" + b"\x00" * 9
+    sof0 = b"\xff\xc0" + struct.pack(">HBHHB", 11, 8, height, width, 1) + b"\x00" * 3
+    return b"\xff\xd8" + app0 + sof0 + b"\xff\xd9"
+
+
+def webp_vp8x(width, height):
+    body = b"VP8X" + struct.pack("<I", 10) + b"\x00" * 4
+    body += (width - 1).to_bytes(3, "little") + (height - 1).to_bytes(3, "little")
+    return b"RIFF" + struct.pack("<I", len(body) + 4) + b"WEBP" + body
+
+
+def webp_vp8l(width, height):
+    bits = (width - 1) | ((height - 1) << 14)
+    body = b"VP8L" + struct.pack("<I", 5) + b"\x2f" + struct.pack("<I", bits)
+    return b"RIFF" + struct.pack("<I", len(body) + 4) + b"WEBP" + body
+
+
+def webp_vp8(width, height):
+    frame = b"\x00\x00\x00" + b"\x9d\x01\x2a" + struct.pack("<HH", width, height)
+    body = b"VP8 " + struct.pack("<I", len(frame)) + frame
+    return b"RIFF" + struct.pack("<I", len(body) + 4) + b"WEBP" + body
+
+
+class TestParse:
+    @pytest.mark.parametrize(
+        "data, expected",
+        [
+            (png(800, 400), ImageInfo("png", 800, 400)),
+            (gif(320, 240), ImageInfo("gif", 320, 240)),
+            (jpeg(1024, 768), ImageInfo("jpeg", 1024, 768)),
+            (webp_vp8x(800, 800), ImageInfo("webp", 800, 800)),
+            (webp_vp8l(640, 320), ImageInfo("webp", 640, 320)),
+            (webp_vp8(400, 200), ImageInfo("webp", 400, 200)),
+        ],
+    )
+    def test_formats(self, data, expected):
+        assert parse_image_size(data) == expected
+
+    def test_truncated_and_unknown(self):
+        assert parse_image_size(png(1, 1)[:20]) is None
+        assert parse_image_size(jpeg(10, 10)[:12]) is None
+        assert parse_image_size(b"not an image") is None
+
+
+@pytest.fixture
+def server(tmp_path):
+    files = {
+        "a.png": png(800, 400),
+        "b.jpg": jpeg(800, 800),
+        "c.gif": gif(180, 180),
+        "d.webp": webp_vp8x(600, 300),
+        "e.txt": b"hello",
+    }
+    for name, data in files.items():
+        (tmp_path / name).write_bytes(data)
+
+    hits = []
+
+    class Handler(SimpleHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            hits.append(self.path)
+            super().do_GET()
+
+        def log_message(self, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(
+        ("127.0.0.1", 0), functools.partial(Handler, directory=str(tmp_path))
+    )
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}", hits
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestImageProbe:
+    def test_probe_many(self, server):
+        base, hits = server
+
+        async def main():
+            async with ImageProbe(max_connections=2) as probe:
+                urls = [f"{base}/{name}" for name in ("a.png", "b.jpg", "c.gif", "d.webp", "e.txt", "missing.png")]
+                first = await probe.probe_many(urls * 3)
+                second = await probe.probe_many(urls)
+                return first, second
+
+        first, second = asyncio.run(main())
+        assert [i and (i.width, i.height) for i in second] == [
+            (800, 400), (800, 800), (180, 180), (600, 300), None, None,
+        ]
+        assert first == second * 3
+        assert len(hits) == 6  # duplicates and repeats come from the cache
+
+    def test_fill(self, server):
+        base, _ = server
+        carousel = Carousel()
+        carousel.add_card(BasicCard().set_thumbnail(Thumbnail(f"{base}/a.png", fixedRatio=True)))
+        carousel.add_card(BasicCard().set_thumbnail(Thumbnail(f"{base}/b.jpg", width=1, height=1)))
+        profile = Profile().for_item_card("profile", f"{base}/c.gif")
+
+        async def main():
+            async with ImageProbe() as probe:
+                await probe.fill(carousel, profile)
+                return await probe.for_list_card(f"{base}/d.webp")
+
+        thumbnail = asyncio.run(main())
+        assert (carousel.items[0].thumbnail.width, carousel.items[0].thumbnail.height) == (800, 400)
+        assert (carousel.items[1].thumbnail.width, carousel.items[1].thumbnail.height) == (1, 1)
+        assert (profile.width, profile.height) == (180, 180)
+        assert (thumbnail.imageUrl, thumbnail.width, thumbnail.height) == (f"{base}/d.webp", 600, 300)
+
+    def test_owner_cancelled(self, monkeypatch):
+        async def slow(self, url):
+            await asyncio.sleep(0.05)
+            return ImageInfo("png", 10, 20)
+
+        monkeypatch.setattr(ImageProbe, "_probe", slow)
+
+        async def main():
+            async with ImageProbe() as probe:
+                owner = asyncio.ensure_future(probe.probe("http://x/a.png"))
+                await asyncio.sleep(0)
+                joined = asyncio.ensure_future(probe.probe("http://x/a.png"))
+                await asyncio.sleep(0.01)
+                owner.cancel()
+                info = await joined
+                return owner.cancelled(), info, await probe.probe("http://x/a.png")
+
+        cancelled, info, cached = asyncio.run(main())
+        assert cancelled
+        assert (info.width, info.height) == (10, 20)
+        assert cached == info
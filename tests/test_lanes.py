@@ -0,0 +1,187 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from kakao_json import Kakao
+from kakao_json.lanes import LaneScheduler
+from kakao_json.skill import SkillRequest
+
+
+def reply(text):
+    k = Kakao()
+    k.add_simple_text(text)
+    return k
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLaneScheduler:
+    def test_declared_lanes_and_threads(self):
+        threads = {}
+
+        def cached(req):
+            threads["fast"] = threading.current_thread()
+            return b"cached"
+
+        def db(req):
+            threads["slow"] = threading.current_thread()
+            return reply("db")
+
+        async def main():
+            lanes = LaneScheduler()
+            fast = lanes.wrap(cached, lane="fast")
+            slow = lanes.wrap(db, lane="slow")
+            results = await asyncio.gather(fast(SkillRequest()), slow(SkillRequest()))
+            lanes.shutdown()
+            return lanes, results
+
+        lanes, results = asyncio.run(main())
+        assert results[0] == b"cached"
+        assert results[1].to_json() == reply("db").to_json()
+        assert threads["fast"] is threading.main_thread()
+        assert threads["slow"].name.startswith("kakao-slow-lane")
+        assert lanes.metrics()["slow"].completed == 1
+
+    def test_learned_lane(self):
+        clock = Clock()
+        cost = 0.001
+
+        async def search(req):
+            clock.now += cost
+            return b"ok"
+
+        async def main():
+            nonlocal cost
+            lanes = LaneScheduler(threshold=0.005, min_samples=4, clock=clock)
+            handler = lanes.wrap(search, name="search")
+            seen = []
+            for _ in range(4):
+                await handler(SkillRequest())
+                seen.append(lanes.lane_of("search"))
+            cost = 0.05  # backend slowdown
+            await handler(SkillRequest())
+            seen.append(lanes.lane_of("search"))
+            lanes.shutdown()
+            return lanes, seen
+
+        lanes, seen = asyncio.run(main())
+        assert seen == ["slow", "slow", "slow", "fast", "slow"]
+        stats = lanes.stats()[0]
+        assert (stats.name, stats.lane, stats.declared, stats.calls) == ("search", "slow", False, 5)
+
+    def test_slow_lane_does_not_block_fast_lane(self):
+        async def main():
+            lanes = LaneScheduler(slow_limit=2, slow_queue=2)
+            release = asyncio.Event()
+
+            async def slow(req):
+                await release.wait()
+                return reply("slow")
+
+            async def fast(req):
+                return b"fast"
+
+            slow_handler = lanes.wrap(slow, lane="slow")
+            fast_handler = lanes.wrap(fast, lane="fast")
+            pending = [asyncio.ensure_future(slow_handler(SkillRequest())) for _ in range(6)]
+            await asyncio.sleep(0)
+
+            start = time.perf_counter()
+            fast_result = await fast_handler(SkillRequest())
+            fast_latency = time.perf_counter() - start
+
+            release.set()
+            slow_results = await asyncio.gather(*pending)
+            lanes.shutdown()
+            return lanes, fast_result, fast_latency, slow_results
+
+        lanes, fast_result, fast_latency, slow_results = asyncio.run(main())
+        assert fast_result == b"fast"
+        assert fast_latency < 0.01
+        # 2 running + 2 queued, the rest got the busy response
+        assert sum(isinstance(r, bytes) for r in slow_results) == 2
+        assert lanes.metrics()["slow"].shed_full == 2
+
+    def test_slowed_learned_route_leaves_room_for_declared_fast(self):
+        delay = 0.0
+
+        async def search(req):
+            await asyncio.sleep(delay)
+            return b"search"
+
+        async def menu(req):
+            return b"menu"
+
+        async def main():
+            nonlocal delay
+            lanes = LaneScheduler(threshold=0.005, fast_limit=8, min_samples=4)
+            search_handler = lanes.wrap(search, name="search")
+            menu_handler = lanes.wrap(menu, lane="fast")
+            for _ in range(8):
+                await search_handler(SkillRequest())
+            learned = lanes.lane_of("search")
+
+            delay = 0.2  # backend slowdown, a burst arrives before any slow call finishes
+            burst = [asyncio.ensure_future(search_handler(SkillRequest())) for _ in range(20)]
+            await asyncio.sleep(0)
+            fast_active = lanes.metrics()["fast"].active
+
+            start = time.perf_counter()
+            menu_result = await menu_handler(SkillRequest())
+            menu_latency = time.perf_counter() - start
+
+            await asyncio.sleep(0.02)
+            demoted = lanes.lane_of("search")  # calls still running
+            results = await asyncio.gather(*burst)
+            lanes.shutdown()
+            return learned, fast_active, menu_result, menu_latency, demoted, results
+
+        learned, fast_active, menu_result, menu_latency, demoted, results = asyncio.run(main())
+        assert learned == "fast"
+        assert fast_active == 4  # learned_limit = fast_limit / 2, the rest ran in the slow lane
+        assert menu_result == b"menu" and menu_latency < 0.05
+        assert demoted == "slow"
+        assert results == [b"search"] * 20
+
+    def test_learned_sync_handler_stays_off_the_loop(self):
+        clock = Clock()
+        threads = []
+
+        def lookup(req):
+            threads.append(threading.current_thread())
+            return b"ok"
+
+        async def main():
+            lanes = LaneScheduler(min_samples=2, clock=clock)
+            handler = lanes.wrap(lookup, name="lookup")
+            for _ in range(4):
+                await handler(SkillRequest())
+            lanes.shutdown()
+            return lanes
+
+        lanes = asyncio.run(main())
+        assert lanes.lane_of("lookup") == "fast"
+        assert threads[0].name.startswith("kakao-slow-lane")
+        assert threads[-1].name.startswith("kakao-fast-lane")
+        assert threading.main_thread() not in threads
+
+    def test_duplicate_names(self):
+        lanes = LaneScheduler()
+
+        def handler(req):
+            return b"ok"
+
+        lanes.wrap(handler, lane="fast")
+        with pytest.raises(Exception):
+            lanes.wrap(handler, lane="slow")
+        lanes.wrap(handler, lane="slow", name="handler (slow)")
+        assert [s.name for s in lanes.stats()][1] == "handler (slow)"
+        lanes.shutdown()
@@ -0,0 +1,89 @@
+import msgspec
+import pytest
+
+from kakao_json import BasicCard, Button, CommerceCard, ItemCard, Kakao, ListCard, ListItem
+from kakao_json.components.cards import Head, ImageTitle, ItemList
+from kakao_json.components.common import Profile, Thumbnail
+from kakao_json.kakao import Carousel
+from kakao_json.layout import CarouselLayout
+
+
+def item_card(i, **fields):
+    return ItemCard([ItemList("가격", f"{i}원")], title=f"상품 {i}", **fields)
+
+
+class TestCarouselLayout:
+    def test_groups_mixed_types(self):
+        cards = (
+            [BasicCard().set_title(f"b{i}") for i in range(12)]
+            + [ListCard().set_header(f"l{i}") for i in range(6)]
+            + [CommerceCard(f"c{i}", 1000, "won") for i in range(2)]
+        )
+        cards.insert(3, CommerceCard("first", 1000, "won"))
+        carousels = CarouselLayout()(cards)
+        assert [(c.type, len(c.items)) for c in carousels] == [
+            ("basicCard", 10), ("basicCard", 2), ("commerceCard", 3), ("listCard", 5), ("listCard", 1),
+        ]
+        assert carousels[2].items[0].description == "first"
+
+        k = CarouselLayout().add_to(Kakao(), cards[:2])
+        assert msgspec.json.decode(k.to_json())["template"]["outputs"][0]["carousel"]["type"] == "basicCard"
+
+        with pytest.raises(Exception):
+            CarouselLayout()([ListItem("not a card")])
+
+    def test_uniform_ratio(self):
+        cards = [
+            BasicCard().set_thumbnail(Thumbnail("a", fixedRatio=True)),
+            BasicCard().set_thumbnail(Thumbnail("b", fixedRatio=True)),
+            BasicCard().set_image("c"),
+            BasicCard(),
+        ]
+        CarouselLayout()(cards)
+        assert [c.thumbnail.fixedRatio for c in cards[:3]] == [True, True, True]
+        # fixedRatio needs width and height, sizes already known are kept
+        assert [(c.thumbnail.width, c.thumbnail.height) for c in cards[:3]] == [(800, 800)] * 3
+        sized = [BasicCard().set_thumbnail(Thumbnail("d", width=600, height=300)), BasicCard().set_image("e")]
+        CarouselLayout(ratio="square")(sized)
+        assert [(c.thumbnail.width, c.thumbnail.height) for c in sized] == [(600, 300), (800, 800)]
+
+        CarouselLayout(ratio="wide")(cards)
+        assert b"fixedRatio" not in msgspec.json.encode(cards)
+
+        # itemCard carousels are 2:1 only
+        items = [item_card(i, thumbnail=Thumbnail(f"{i}", fixedRatio=True)) for i in range(2)]
+        CarouselLayout(ratio="square")(items)
+        assert [c.thumbnail.fixedRatio for c in items] == [None, None]
+
+    def test_item_card_shared_fields(self):
+        cards = [
+            item_card(0, head=Head("헤드"), imageTitle=ImageTitle("t", None, None)),
+            item_card(1, head=Head("헤드")),
+            item_card(2, profile=Profile(nickname="프로필")),
+            item_card(3, buttons=[Button("1"), Button("2"), Button("3")], buttonLayout="vertical"),
+        ]
+        cards[3].itemList = [ItemList(str(i), "v") for i in range(7)]
+        shared_head = Head("추천")
+        (carousel,) = CarouselLayout(shared={"head": shared_head})(cards)
+
+        assert carousel.type == "itemCard"
+        assert [c.head.title for c in cards] == ["헤드", "헤드", "추천", "추천"]
+        assert all(c.profile is None for c in cards)
+        assert all(c.imageTitle is None for c in cards)  # no shared value, dropped everywhere
+        assert len(cards[3].buttons) == 2 and cards[3].buttonLayout is None
+        assert len(cards[3].itemList) == 5
+        # filled cards get their own copies of the shared value
+        assert cards[2].head is not shared_head and cards[2].head is not cards[3].head
+        cards[2].head.title = "changed"
+        assert cards[3].head.title == "추천" and shared_head.title == "추천"
+
+        with pytest.raises(Exception):
+            CarouselLayout(strict=True)([item_card(0, head=Head("h")), item_card(1)])
+        with pytest.raises(Exception):
+            CarouselLayout(shared={"title": "x"})
+
+    def test_add_card_rejects_mixed_types(self):
+        carousel = Carousel().add_card(BasicCard())
+        with pytest.raises(Exception):
+            carousel.add_card(ListCard())
+        assert carousel.type == "basicCard" and len(carousel.items) == 1
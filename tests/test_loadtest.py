@@ -0,0 +1,72 @@
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from kakao_json import Kakao
+from kakao_json.loadtest import generate_requests, percentile, run_asgi, run_http
+from kakao_json.skill import decode_request
+
+
+async def app(scope, receive, send):
+    message = await receive()
+    req = decode_request(message["body"])
+    k = Kakao()
+    k.add_simple_text(req.userRequest.utterance)
+    body = k.to_json()
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": body})
+
+
+class TestLoadTest:
+    def test_generate_requests(self):
+        payloads = generate_requests(200, seed=1, users=10)
+        assert payloads == generate_requests(200, seed=1, users=10)
+
+        requests = [decode_request(p) for p in payloads]
+        assert len({r.userRequest.user.id for r in requests}) <= 10
+        assert len({r.userRequest.utterance for r in requests}) > 5
+        assert all(r.userRequest.block.id for r in requests)
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 99) == 99
+        assert percentile(values, 100) == 100
+        assert percentile([], 50) == 0.0
+
+    def test_run_asgi(self):
+        report = asyncio.run(run_asgi(app, generate_requests(50), rps=500, duration=0.1))
+        assert report.requests == 50
+        assert report.errors == 0
+        assert report.status == {200: 50}
+        assert report.size["min"] > 0
+        assert report.latency_ms["p50"] <= report.latency_ms["p99"] <= report.latency_ms["max"]
+
+    def test_run_http(self):
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                out = b'{"ok":' + str(len(body)).encode() + b"}"
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(out)))
+                self.end_headers()
+                self.wfile.write(out)
+
+            def log_message(self, *args):
+                pass
+
+        httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        try:
+            url = f"http://127.0.0.1:{httpd.server_address[1]}/skill"
+            report = asyncio.run(
+                run_http(url, generate_requests(20), rps=200, duration=0.1, connections=4)
+            )
+        finally:
+            httpd.shutdown()
+            httpd.server_close()
+        assert report.requests == 20
+        assert report.errors == 0
+        assert report.throughput > 0
@@ -0,0 +1,145 @@
+from dataclasses import dataclass
+from typing import NamedTuple
+
+import msgspec
+import pytest
+
+from kakao_json import BasicCard, Button, CommerceCard, ItemCard, ListItem, Thumbnail
+from kakao_json.components.cards import Head as Head_, ItemList as ItemList_
+from kakao_json.mapper import CardMapper, const
+
+
+@dataclass
+class Item:
+    name: str
+    number: int
+    url: str
+
+
+class Row(NamedTuple):
+    name: str
+    number: int
+    url: str
+
+
+class Model:
+    def __init__(self, name, number, url):
+        self.name, self.number, self.url = name, number, url
+
+
+class TestCardMapper:
+    def test_list_item_from_many_sources(self):
+        to_item = CardMapper(
+            ListItem,
+            title="name",
+            description=lambda o: f"{o['number'] if isinstance(o, dict) else o.number}번",
+            link="url",
+            action=const("message"),
+        )
+        expected = ListItem("a", "1번", link=None, action="message")
+        expected.set_link("https://a")
+        sources = [
+            Item("a", 1, "https://a"),
+            Row("a", 1, "https://a"),
+            Model("a", 1, "https://a"),
+            {"name": "a", "number": 1, "url": "https://a"},
+        ]
+        assert to_item.map(sources) == [expected] * 4
+        assert to_item(sources[0]) == expected
+
+    def test_setters(self):
+        to_item = CardMapper(ListItem, title="name", link="url")
+        by_hand = ListItem("a").set_title("a").set_link("https://a")
+        assert to_item(Item("a", 1, "https://a")) == by_hand
+        assert by_hand.action == "message"
+
+        to_card = CardMapper(
+            CommerceCard,
+            description="name",
+            price="number",
+            currency="url",
+            thumbnails=lambda o: ["https://1", "https://2"],
+        )
+        card = to_card({"name": "a", "number": 1, "url": "won"})
+        assert [type(t) for t in card.thumbnails] == [Thumbnail, Thumbnail]
+        assert [t.imageUrl for t in card.thumbnails] == ["https://1", "https://2"]
+        with pytest.raises(Exception):
+            to_card({"name": "a", "number": 1, "url": "dollar"})  # set_currency checks the value
+
+    def test_list_card(self):
+        to_item = CardMapper(ListItem, title="name", link="url")
+        card = to_item.list_card([Item(f"I {i}", i, f"https://{i}") for i in range(7)], header="제목")
+        assert card.header.title == "제목"
+        assert [i.title for i in card.items] == [f"I {i}" for i in range(5)]
+        assert card.items[0].link.web == "https://0"
+
+    def test_carousels(self):
+        to_card = CardMapper(BasicCard, title="name", thumbnail="url")
+        items = [Item(f"I {i}", i, f"https://img/{i}") for i in range(23)]
+        carousel = to_card.carousel(items[:3])
+        assert carousel.type == "basicCard"
+        assert msgspec.json.encode(carousel.items[0]) == b'{"title":"I 0","thumbnail":{"imageUrl":"https://img/0"}}'
+        assert [len(c.items) for c in to_card.carousels(items)] == [10, 10, 3]
+        assert [len(c.items) for c in to_card.carousels(items, size=1)] == [1] * 23
+        with pytest.raises(Exception):
+            to_card.carousel(items)
+        for size in (0, 11, -1):
+            with pytest.raises(Exception):
+                to_card.carousels(items, size=size)
+
+    def test_const_values_are_copied(self):
+        to_card = CardMapper(
+            BasicCard,
+            title="name",
+            buttons=const([Button("자세히", "webLink", webLinkUrl="https://a")]),
+        )
+        to_item = CardMapper(ListItem, title="name", extra=const({"tags": ["a"]}))
+        items = [Item(f"I {i}", i, f"https://img/{i}") for i in range(2)]
+
+        first, second = to_card.map(items)
+        first.buttons[0].label = "changed"
+        first.buttons.append(Button("추가", "message"))
+        assert len(second.buttons) == 1 and second.buttons[0].label == "자세히"
+
+        a, b = to_item.map(items)
+        a.extra["tags"].append("b")
+        assert b.extra == {"tags": ["a"]}
+
+    def test_item_and_commerce_card(self):
+        @dataclass
+        class Product:
+            name: str
+            price: int
+            image: str
+            seller: dict
+
+        p = Product("신발", 10000, "https://img/shoe", {"name": "가게"})
+        item_card = CardMapper(
+            ItemCard, title="name", head="seller.name", itemList={"가격": "price", "상품": "name"}
+        )
+        item = item_card({"name": p.name, "price": p.price, "seller": p.seller})
+        assert msgspec.json.encode(item) == msgspec.json.encode(
+            ItemCard(
+                [ItemList_("가격", "10000"), ItemList_("상품", "신발")],
+                head=Head_("가게"),
+                title="신발",
+            )
+        )
+
+        commerce = CardMapper(
+            CommerceCard, description="name", price="price", currency=const("won"), thumbnails="image"
+        )(p)
+        assert msgspec.json.encode(commerce) == (
+            b'{"description":"\xec\x8b\xa0\xeb\xb0\x9c","price":10000,"currency":"won",'
+            b'"thumbnails":[{"imageUrl":"https://img/shoe"}]}'
+        )
+
+    def test_invalid(self):
+        with pytest.raises(Exception):
+            CardMapper(ListItem, unknown="name")
+        with pytest.raises(Exception):
+            CardMapper(ListItem, title="name; import os")
+        with pytest.raises(Exception):
+            CardMapper(CommerceCard, description="name")  # price and currency are required
+        with pytest.raises(Exception):
+            CardMapper(ListItem, title="name").carousel([Item("a", 1, "u")])
@@ -0,0 +1,61 @@
+import asyncio
+import os
+from dataclasses import dataclass
+
+import pytest
+
+from kakao_json import BasicCard, Kakao
+from kakao_json.kakao import Carousel
+from kakao_json.offload import Offloader, function_name
+
+
+@dataclass
+class Product:
+    name: str
+    price: int
+
+
+def render_products(products: list[Product], title: str = "상품") -> Kakao:
+    k = Kakao()
+    carousel = Carousel()
+    for product in products:
+        # typed arguments: dataclasses, not dicts
+        assert isinstance(product, Product)
+        carousel.add_card(BasicCard().set_title(product.name).set_desc(f"{title} {product.price}원"))
+    k.add_output(carousel)
+    return k
+
+
+def worker_pid() -> bytes:
+    return str(os.getpid()).encode()
+
+
+class TestOffloader:
+    def test_render_in_workers(self):
+        products = [Product(f"p{i}", i * 100) for i in range(3)]
+
+        async def main():
+            async with Offloader(max_workers=2).register(render_products).register(worker_pid) as offloader:
+                pids = await offloader.start()
+                body = await offloader.render(render_products, products, title="가격")
+                by_name = await offloader.render(function_name(render_products), products=products)
+                pid = await offloader.render(worker_pid)
+            return pids, body, by_name, pid
+
+        pids, body, by_name, pid = asyncio.run(main())
+        assert len(pids) == 2 and os.getpid() not in pids
+        assert body == render_products(products, title="가격").to_json()
+        assert by_name == render_products(products).to_json()
+        assert int(pid) in pids
+
+    def test_invalid_functions(self):
+        def local(x: int) -> Kakao:
+            return Kakao()
+
+        def varargs(*items):
+            return Kakao()
+
+        with pytest.raises(Exception):
+            Offloader().register(local)
+        with pytest.raises(Exception):
+            Offloader().register(varargs)
@@ -0,0 +1,73 @@
+import threading
+
+import msgspec
+
+from kakao_json import BasicCard, Kakao
+from kakao_json.parallel import encode_many, freeze
+
+
+def build(i):
+    k = Kakao()
+    k.add_qr(f"qr {i}")
+    carousel = k.init_carousel()
+    for j in range(3):
+        carousel.add_card(BasicCard().set_title(f"{i}-{j}").set_image("https://img"))
+    k.add_output(carousel)
+    return k
+
+
+def hammer(fn, threads=8):
+    barrier = threading.Barrier(threads)
+
+    def run(t):
+        barrier.wait()
+        fn(t)
+
+    workers = [threading.Thread(target=run, args=(t,)) for t in range(threads)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+
+
+class TestParallel:
+    def test_freeze_is_a_snapshot(self):
+        k = build(0)
+        frozen = freeze(k)
+        k.add_qr("later")
+        assert frozen.to_json() == build(0).to_json()
+        assert freeze(frozen) is frozen
+        assert str(frozen) == str(build(0))
+
+    def test_concurrent_appends_are_not_lost(self):
+        k = Kakao()
+        carousel = k.init_carousel()
+
+        def append(t):
+            for i in range(2000):
+                k.add_qr(f"{t}-{i}")
+                carousel.add_card(BasicCard().set_title(f"{t}-{i}"))
+
+        hammer(append)
+        assert len(k.template.quickReplies) == 8 * 2000
+        assert len(carousel.items) == 8 * 2000
+        assert carousel.type == "basicCard"
+
+    def test_shared_frozen_from_threads(self):
+        frozen = [freeze(build(i)) for i in range(50)]
+        expected = [f.json for f in frozen]
+        results = {}
+
+        def encode(t):
+            results[t] = encode_many(frozen + [build(i) for i in range(50)], max_workers=2, chunk_size=7)
+
+        hammer(encode)
+        for out in results.values():
+            assert out == expected * 2
+
+    def test_encode_many(self):
+        items = [build(i) for i in range(300)]
+        expected = [msgspec.json.encode(k) for k in items]
+        assert encode_many(items, chunk_size=16) == expected
+        assert encode_many(items, max_workers=1) == expected
+        assert encode_many([]) == []
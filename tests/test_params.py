@@ -0,0 +1,82 @@
+import datetime
+
+import msgspec
+import pytest
+
+from kakao_json import params
+from kakao_json.params import ParamParser, PluginDate, PluginDatetime, PluginTime, parse_value, register
+from kakao_json.skill import decode_request
+
+PLUGIN_DATE = '{"value":"2026-10-19","userTimeZone":"UTC+9","date":"2026-10-19","dateTag":"today","dateHeadword":null}'
+
+REQUEST = msgspec.json.encode(
+    {
+        "action": {
+            "params": {"day": PLUGIN_DATE, "count": "3", "place": "강남구", "memo": "hi"},
+            "detailParams": {
+                "day": {"origin": "오늘", "value": PLUGIN_DATE, "groupName": ""},
+                "count": {"origin": "세 개", "value": "3", "groupName": ""},
+                "place": {"origin": "강남구", "value": "강남구", "groupName": ""},
+                "amount": {"origin": "2,500개", "value": '{"amount":2500,"unit":null}', "groupName": ""},
+            },
+        }
+    }
+)
+
+
+class TestParams:
+    def test_parse_request(self):
+        parser = ParamParser(
+            day="sys.plugin.date", count="sys.number", place="sys.location",
+            amount="sys.number", memo="sys.text", missing="sys.number",
+        )
+        values = parser.parse(decode_request(REQUEST))
+        assert values == {
+            "day": PluginDate(datetime.date(2026, 10, 19), "UTC+9", "today"),
+            "count": 3,
+            "place": "강남구",
+            "amount": 2500,
+            "memo": "hi",  # from action.params, unknown entity as is
+            "missing": None,
+        }
+        assert parser.get(decode_request(REQUEST), "day").value == datetime.date(2026, 10, 19)
+
+    def test_entities(self):
+        assert parse_value("sys.date", "2026-10-19").value == datetime.date(2026, 10, 19)
+        assert parse_value("sys.date", PLUGIN_DATE).dateTag == "today"
+        assert parse_value("sys.number", "2.5") == 2.5
+        assert parse_value("sys.number", "1,000") == 1000
+        assert parse_value("sys.number", 7) == 7
+
+        time = parse_value("sys.plugin.time", '{"value":"15:30:00","userTimeZone":"UTC+9","time":"15:30:00","hour":3,"minute":30,"second":null,"timeHeadword":"pm"}')
+        assert time == PluginTime(datetime.time(15, 30), "UTC+9", "pm", 3, 30)
+
+        dt = parse_value("sys.plugin.datetime", {"value": "2026-10-19T15:30:00", "dateTag": "today"})
+        assert dt == PluginDatetime(datetime.datetime(2026, 10, 19, 15, 30), dateTag="today")
+
+        with pytest.raises(msgspec.ValidationError):
+            parse_value("sys.plugin.date", '{"value":"not a date"}')
+
+    def test_cached(self):
+        assert parse_value("sys.plugin.date", PLUGIN_DATE) is parse_value("sys.plugin.date", PLUGIN_DATE)
+
+        calls = []
+
+        @register("test.upper")
+        def upper(value):
+            calls.append(value)
+            return value.upper()
+
+        parser = ParamParser(a="test.upper", b="test.upper")
+        req = decode_request(b'{"action":{"params":{"a":"x","b":"x"}}}')
+        assert parser.parse(req) == {"a": "X", "b": "X"}
+        assert calls == ["x"]
+
+    def test_register_after_parser(self, monkeypatch):
+        monkeypatch.setattr(params, "_PARSERS", dict(params._PARSERS))
+        parser = ParamParser(a="test.late")
+        req = decode_request(b'{"action":{"params":{"a":"x"}}}')
+        assert parser.parse(req) == {"a": "x"} and parser.get(req, "a") == "x"
+
+        register("test.late")(str.upper)
+        assert parser.parse(req) == {"a": "X"} and parser.get(req, "a") == "X"
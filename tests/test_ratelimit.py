@@ -0,0 +1,102 @@
+import asyncio
+
+from kakao_json import Kakao
+from kakao_json.ratelimit import RateLimiter, slow_down_text
+from kakao_json.skill import SkillRequest, User, UserRequest
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def request(user_id):
+    return SkillRequest(UserRequest(utterance="hi", user=User(user_id)))
+
+
+class TestRateLimiter:
+    def test_burst_and_refill(self):
+        clock = Clock()
+        limiter = RateLimiter(rate=2, per=1, burst=3, clock=clock)
+        assert [limiter.allow("a") for _ in range(4)] == [True, True, True, False]
+        assert limiter.allow("b")
+        assert limiter.retry_after("a") == 0.5
+
+        clock.now += 0.5
+        assert limiter.allow("a")
+        assert not limiter.allow("a")
+        clock.now += 10
+        assert [limiter.allow("a") for _ in range(4)] == [True, True, True, False]
+        assert limiter.limited == 3
+
+    def test_check_and_wrap(self):
+        clock = Clock()
+        limiter = RateLimiter(rate=1, per=60, clock=clock)
+        assert limiter.check(request("a")) is None
+        assert limiter.check(request("a")) == slow_down_text()
+
+        calls = []
+
+        async def handler(req):
+            calls.append(req)
+            k = Kakao()
+            k.add_simple_text("ok")
+            return k
+
+        wrapped = limiter.wrap(handler)
+        first = asyncio.run(wrapped(request("b")))
+        second = asyncio.run(wrapped(request("b")))
+        assert isinstance(first, Kakao)
+        assert second == limiter.response
+        assert len(calls) == 1
+
+    def test_idle_users_expire(self):
+        clock = Clock()
+        limiter = RateLimiter(rate=10, per=1, burst=5, clock=clock)
+        for i in range(1000):
+            limiter.allow(f"user {i}")
+        assert len(limiter) == 1000
+
+        clock.now += limiter.generation
+        assert limiter.allow("user 0")
+        assert len(limiter) == 1000  # previous generation kept until the next rotation
+        clock.now += limiter.generation
+        assert limiter.allow("active")
+        assert len(limiter) == 2
+
+        clock.now += limiter.generation * 2
+        assert limiter.allow("active")
+        assert len(limiter) == 1
+
+    def test_expired_freed_incrementally(self):
+        clock = Clock()
+        limiter = RateLimiter(rate=10, per=1, burst=5, clock=clock)
+        for i in range(1000):
+            limiter.allow(f"user {i}")
+
+        clock.now += limiter.generation * 2
+        assert limiter.allow("active")
+        expired = lambda: sum(map(len, limiter._expired))
+        # rotation does not free the 999 expired users at once
+        assert 990 <= expired() < 1000
+        for _ in range(10):
+            limiter.allow("active")
+        assert 950 <= expired() < 990
+        for _ in range(300):
+            limiter.allow("active")
+        assert expired() == 0 and not limiter._expired
+        assert limiter.allow("user 5")  # expired users start over
+
+    def test_limit_survives_rotation(self):
+        clock = Clock()
+        limiter = RateLimiter(rate=1, per=60, clock=clock)
+        assert limiter.allow("a")
+        clock.now += limiter.generation - 1
+        assert not limiter.allow("a")
+        clock.now += 0.5
+        assert not limiter.allow("a")
+        clock.now += 0.5
+        assert limiter.allow("a")
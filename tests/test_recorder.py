@@ -0,0 +1,127 @@
+import asyncio
+import os
+
+import msgspec
+
+from kakao_json import Kakao
+from kakao_json.loadtest import call_asgi, generate_requests
+from kakao_json.recorder import Recorder, RecorderMiddleware, main, read_records, replay
+from kakao_json.skill import decode_request
+
+
+def handler(req):
+    k = Kakao()
+    k.add_simple_text(req.userRequest.utterance)
+    return k
+
+
+async def app(scope, receive, send):
+    message = await receive()
+    body = handler(decode_request(message["body"])).to_json()
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": body})
+
+
+class TestRecorder:
+    def test_record_and_rotate(self, tmp_path):
+        payloads = generate_requests(200)
+        with Recorder(str(tmp_path), max_bytes=20000, max_files=3) as recorder:
+            for p in payloads:
+                assert recorder.record(p, b'{"ok":true}', 0.001)
+
+        files = sorted(os.listdir(tmp_path))
+        assert len(files) == 3
+        assert all(f.startswith("skill-") and f.endswith(".ndjson.gz") for f in files)
+        assert recorder.recorded == 200 and recorder.dropped == 0
+
+        records = list(read_records(*recorder.files))
+        assert 0 < len(records) < 200
+        assert [bytes(r.request) for r in records] == payloads[-len(records):]
+        assert bytes(records[0].response) == b'{"ok":true}'
+
+    def test_middleware_and_replay(self, tmp_path):
+        payloads = generate_requests(30)
+        recorder = Recorder(str(tmp_path), compress=False)
+        wrapped = RecorderMiddleware(app, recorder, path="/skill")
+
+        async def send_all():
+            for p in payloads:
+                await call_asgi(wrapped, p, "/skill")
+            await call_asgi(wrapped, payloads[0], "/other")
+
+        asyncio.run(send_all())
+        recorder.close()
+
+        records = list(read_records(*recorder.files))
+        assert len(records) == 30
+        assert all(r.status == 200 and r.duration > 0 for r in records)
+
+        report = asyncio.run(replay(iter(records), app=app))
+        assert (report.total, report.matched, report.errors) == (30, 30, 0)
+
+        def changed(req):
+            k = handler(req)
+            if req.userRequest.utterance == "도움말":
+                k.add_qr("new")
+            return k
+
+        report = asyncio.run(replay(iter(records), handler=changed))
+        expected = [
+            i for i, r in enumerate(records)
+            if decode_request(bytes(r.request)).userRequest.utterance == "도움말"
+        ]
+        assert report.mismatched == expected
+        assert report.matched == 30 - len(expected)
+
+    def test_cli(self, tmp_path, capsys):
+        with Recorder(str(tmp_path)) as recorder:
+            for p in generate_requests(5):
+                recorder.record(p, handler(decode_request(p)).to_json(), 0.002)
+
+        code = main(["replay", str(tmp_path / "*.ndjson.gz"), "--target", "tests.test_recorder:handler"])
+        assert code == 0
+        assert "matched    5, mismatched 0" in capsys.readouterr().out
+
+    def test_multiline_and_non_json_bodies(self, tmp_path):
+        payload = generate_requests(1)[0]
+        pretty = msgspec.json.format(payload, indent=2)
+        assert pretty.count(b"\n") > 1
+
+        async def broken(scope, receive, send):
+            await receive()
+            await send({"type": "http.response.start", "status": 500, "headers": []})
+            await send({"type": "http.response.body", "body": b"Internal Server Error"})
+
+        recorder = Recorder(str(tmp_path), compress=False)
+        recorder.record(pretty, b'{\n  "version": "2.0"\n}', 0.001)
+        asyncio.run(call_asgi(RecorderMiddleware(broken, recorder), pretty, "/skill"))
+        recorder.close()
+
+        with open(recorder.files[0], "rb") as f:
+            assert f.read().count(b"\n") == 2
+        first, error = read_records(*recorder.files)
+        assert first.request_body() == payload and first.encoded == 0
+        assert first.response_body() == b'{"version":"2.0"}'
+        assert error.status == 500 and error.encoded == 2
+        assert error.request_body() == payload
+        assert error.response_body() == b"Internal Server Error"
+
+        report = asyncio.run(replay(iter([first, error]), app=broken))
+        assert (report.total, report.matched, report.errors) == (2, 1, 0)
+
+    def test_skip_bad_lines(self, tmp_path):
+        with Recorder(str(tmp_path), compress=False) as recorder:
+            for p in generate_requests(3):
+                recorder.record(p, b"{}", 0.001)
+        path = recorder.files[0]
+        with open(path, "rb") as f:
+            lines = f.read().splitlines(keepends=True)
+        with open(path, "wb") as f:
+            f.write(lines[0] + b'{"request": \n' + b"not json\n" + lines[1] + lines[2][:20])
+
+        records = read_records(path)
+        assert len(list(records)) == 2
+        assert records.skipped == 3
+
+        report = asyncio.run(replay(read_records(path), handler=handler))
+        assert (report.total, report.skipped) == (2, 3)
@@ -0,0 +1,87 @@
+import asyncio
+import threading
+
+from kakao_json import Kakao
+from kakao_json.deadline import retry_text
+from kakao_json.refresher import Refresher
+from kakao_json.skill import SkillRequest
+
+
+def reply(text):
+    k = Kakao()
+    k.add_simple_text(text)
+    return k
+
+
+class TestRefresher:
+    def test_sync_builder_in_thread(self):
+        threads = []
+
+        def notice():
+            threads.append(threading.current_thread())
+            return reply(f"notice {len(threads)}")
+
+        async def main():
+            refresher = Refresher()
+            refresher.add("notice", notice, interval=0.05)
+            assert refresher.get("notice") == retry_text()
+            async with refresher:
+                first = refresher.get("notice")
+                await asyncio.sleep(0.12)
+                later = await refresher.handler("notice")(SkillRequest())
+            return first, later
+
+        first, later = asyncio.run(main())
+        assert first == reply("notice 1").to_json()
+        assert later != first
+        assert threading.main_thread() not in threads
+
+    def test_last_good_bytes_on_failure(self):
+        calls = 0
+
+        async def notice():
+            nonlocal calls
+            calls += 1
+            if calls > 1:
+                raise ValueError("scrape failed")
+            return reply("ok")
+
+        async def main():
+            refresher = Refresher()
+            refresher.schedule("notice", interval=60, retry=0.01)(notice)
+            assert await refresher.refresh("notice")
+            assert not await refresher.refresh("notice")
+            return refresher
+
+        refresher = asyncio.run(main())
+        assert refresher.get("notice") == reply("ok").to_json()
+        status = refresher.status("notice")
+        assert status.ready and status.failures == 1
+        assert status.error == "ValueError: scrape failed"
+
+    def test_refresh_in_progress_is_joined(self):
+        calls = 0
+
+        async def slow():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            return reply(str(calls))
+
+        async def main():
+            refresher = Refresher()
+            refresher.add("slow", slow, interval=60)
+            await refresher.refresh("slow")
+            pending = asyncio.ensure_future(refresher.refresh("slow"))
+            await asyncio.sleep(0)
+            # the old bytes are served while the refresh runs
+            during = refresher.get("slow")
+            assert refresher.status("slow").refreshing
+            results = await asyncio.gather(pending, refresher.refresh("slow"))
+            return during, results, refresher.get("slow")
+
+        during, results, after = asyncio.run(main())
+        assert during == reply("1").to_json()
+        assert results == [True, True]
+        assert calls == 2
+        assert after == reply("2").to_json()
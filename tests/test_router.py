@@ -0,0 +1,80 @@
+import asyncio
+import random
+
+import pytest
+
+from kakao_json import Kakao
+from kakao_json.router import KeywordRouter, normalize
+from kakao_json.skill import SkillRequest, UserRequest
+
+
+def text(value):
+    async def handler(req):
+        k = Kakao()
+        k.add_simple_text(value)
+        return k
+
+    handler.value = value
+    return handler
+
+
+class TestKeywordRouter:
+    def test_normalize(self):
+        assert normalize(" 학식  메뉴\n") == "학식메뉴"
+        assert normalize("ＡＢＣ") == "abc"
+
+    def test_best_match(self):
+        menu, today_menu, notice, urgent = text("menu"), text("today"), text("notice"), text("urgent")
+        router = KeywordRouter()
+        router.add(["학식", "식단"], menu)
+        router.add("오늘 학식", today_menu)
+        router.add(["공지", "알림"], notice)
+        router.add("긴급", urgent, priority=1)
+
+        assert router.match("학식 알려줘").handler is menu
+        assert router.match("오늘학식 뭐야").handler is today_menu  # longer keyword wins
+        assert router.match("식단 공지").handler is menu  # same length: registered first
+        assert router.match("긴급 공지 있어?").handler is urgent  # priority
+        assert router.match("날씨 어때") is None
+
+        matched = router.match("지금 오늘 학식")
+        assert (matched.keyword, matched.start, matched.end) == ("오늘학식", 2, 6)
+
+    def test_suffix_keywords(self):
+        short, long = text("short"), text("long")
+        router = KeywordRouter().add("bc", short).add("abcd", long)
+        assert router.match("xabcx").handler is short
+        assert router.match("xabcdx").handler is long
+        assert KeywordRouter().add("aab", short).match("aaab").keyword == "aab"
+
+    def test_matches_linear_scan(self):
+        rng = random.Random(0)
+        syllables = "가나다라마바사아자차카타파하"
+        keywords = list({"".join(rng.choices(syllables, k=rng.randint(1, 4))) for _ in range(300)})
+        router = KeywordRouter()
+        for i, keyword in enumerate(keywords):
+            router.add(keyword, text(str(i)))
+
+        def brute(utterance):
+            hits = [(len(k), -i) for i, k in enumerate(keywords) if k in utterance]
+            return keywords[-max(hits)[1]] if hits else None
+
+        for _ in range(300):
+            utterance = "".join(rng.choices(syllables, k=rng.randint(0, 20)))
+            matched = router.match(utterance)
+            assert (matched and matched.keyword) == brute(utterance)
+
+    def test_dispatch(self):
+        router = KeywordRouter(default=text("default"))
+
+        @router.route("공지")
+        def notice(req):
+            return b'{"sync":true}'
+
+        def request(utterance):
+            return SkillRequest(UserRequest(utterance=utterance))
+
+        assert asyncio.run(router(request("공지 보여줘"))) == b'{"sync":true}'
+        assert b"default" in asyncio.run(router(request("안녕"))).to_json()
+        with pytest.raises(Exception):
+            asyncio.run(KeywordRouter()(request("안녕")))
@@ -0,0 +1,97 @@
+import random
+
+import msgspec
+
+from kakao_json.search import SearchIndex, choseong, decompose, is_choseong
+
+TITLES = [
+    "장학금 신청 안내",
+    "학식 메뉴",
+    "국가장학금 2차 신청",
+    "도서관 휴관 안내",
+    "학사 일정",
+    "셔틀버스 시간표",
+    "Python 특강",
+]
+
+
+def make_index():
+    index = SearchIndex()
+    for i, title in enumerate(TITLES):
+        index.add(title, f"desc {i}", link=f"https://notice/{i}")
+    return index
+
+
+class TestJamo:
+    def test_decompose(self):
+        assert decompose("학식 메뉴") == "ㅎㅏㄱㅅㅣㄱㅁㅔㄴㅠ"
+        assert decompose("닭 ABC") == "ㄷㅏㄺabc"
+        assert choseong("학식 메뉴") == "ㅎㅅㅁㄴ"
+
+    def test_is_choseong(self):
+        assert is_choseong("ㅎㅅ")
+        assert is_choseong("ㅈㅎ ㄱ")
+        assert not is_choseong("학ㅅ")
+        assert not is_choseong("")
+
+
+class TestSearchIndex:
+    def test_exact_and_typo(self):
+        index = make_index()
+        assert index.search("학식", k=1)[0].title == "학식 메뉴"
+        assert index.search("장학금", k=2)[0].title == "장학금 신청 안내"
+        assert {i.title for i in index.search("장학금", k=2)} == {"장학금 신청 안내", "국가장학금 2차 신청"}
+        assert index.search("장학긍", k=1)[0].title == "장학금 신청 안내"  # typo
+        assert index.search("셔틀 버스", k=1)[0].title == "셔틀버스 시간표"  # spacing
+        assert index.search("python", k=1)[0].title == "Python 특강"
+        assert index.search("zzzz") == []
+
+    def test_min_match(self):
+        index = make_index()
+        # "학식" shares only "ㅅㅣㄱ" (시간표) with the shuttle notice
+        assert "셔틀버스 시간표" not in {i.title for i in index.search("학식")}
+        assert index.search("식당") == []
+        assert index.search("메뉴판", k=1)[0].title == "학식 메뉴"
+        loose = SearchIndex(min_match=0)
+        for title in TITLES:
+            loose.add(title)
+        assert "셔틀버스 시간표" in {i.title for i in loose.search("학식")}
+
+    def test_choseong(self):
+        index = make_index()
+        assert [i.title for i in index.search("ㅎㅅ")] == ["학식 메뉴", "학사 일정"]
+        assert [i.title for i in index.search("ㅈㅎㄱ")] == ["장학금 신청 안내", "국가장학금 2차 신청"]
+        assert [i.title for i in index.search("ㄷ")] == ["도서관 휴관 안내"]
+
+    def test_results_are_copies(self):
+        index = make_index()
+        item = index.search("학식", k=1)[0]
+        item.set_title("changed")
+        item.link.web = "https://changed"
+        assert index.items[1].title == "학식 메뉴"
+        assert index.items[1].link.web == "https://notice/1"
+
+    def test_long_query_pruning(self):
+        rng = random.Random(0)
+        words = ["".join(chr(0xAC00 + rng.randrange(11172)) for _ in range(3)) for _ in range(300)]
+        titles = [" ".join(rng.choices(words, k=4)) for _ in range(3000)]
+        pruned, full = SearchIndex(budget=100), SearchIndex(budget=10**9)
+        for title in titles:
+            pruned.add(title)
+            full.add(title)
+        for title in titles[:50]:
+            query = title[:-1] + chr(ord(title[-1]) + 1)  # typo in the last syllable
+            best = full.search_ids(query, k=1)
+            assert pruned.search_ids(query, k=1) == best
+            assert titles[best[0][0]] == title
+
+    def test_list_card(self):
+        index = make_index()
+        card = index.list_card("ㅎㅅ")
+        assert msgspec.json.encode(card) == (
+            b'{"header":{"title":"\'\xe3\x85\x8e\xe3\x85\x85\' \xea\xb2\x80\xec\x83\x89 \xea\xb2\xb0\xea\xb3\xbc"},'
+            b'"items":[{"title":"\xed\x95\x99\xec\x8b\x9d \xeb\xa9\x94\xeb\x89\xb4","description":"desc 1","link":{"web":"https://notice/1"}},'
+            b'{"title":"\xed\x95\x99\xec\x82\xac \xec\x9d\xbc\xec\xa0\x95","description":"desc 4","link":{"web":"https://notice/4"}}]}'
+        )
+        assert index.list_card("zzzz") is None
+        assert len(index.list_card("안내", k=10).items) <= 5
@@ -0,0 +1,80 @@
+import msgspec
+import pytest
+
+from kakao_json import BasicCard, Button, CommerceCard, ItemCard, Kakao, ListCard, ListItem
+from kakao_json.components.cards import Head, ItemList, OuterItemCard
+from kakao_json.components.common import Thumbnail
+from kakao_json.kakao import Carousel, OuterCarousel
+from kakao_json import snapshot
+
+
+def full_response():
+    k = Kakao()
+    k.add_simple_text("안녕하세요")
+    k.add_simple_image("https://img/1.png", "이미지")
+
+    list_card = ListCard().set_header("공지")
+    list_card.add_item(ListItem("제목").set_desc("설명").set_link("https://naver.com"))
+    list_card.add_button(Button("더보기", "webLink", webLinkUrl="https://a", extra={"page": 2}))
+    k.add_output(list_card)
+
+    carousel = Carousel()
+    for i in range(3):
+        carousel.add_card(BasicCard().set_title(f"card {i}").set_image(f"https://img/{i}"))
+    k.template.outputs.append(carousel)  # bare Carousel in outputs
+
+    commerce = Carousel()
+    commerce.add_card(CommerceCard("신발", 10000, "won", thumbnails=[Thumbnail("https://img/s")]))
+    k.template.outputs.append(OuterCarousel(commerce))
+
+    items = Carousel()
+    items.add_card(ItemCard([ItemList("가격", "1000")], head=Head("메뉴")))
+    k.template.outputs.append(OuterCarousel(items))
+    k.add_qr("처음으로")
+    return k
+
+
+class TestSnapshot:
+    def test_round_trip_kakao(self):
+        k = full_response()
+        data = snapshot.dumps(k)
+        restored = snapshot.loads(data)
+        assert restored.to_json() == k.to_json()
+        assert len(data) < len(k.to_json())
+
+        outputs = restored.template.outputs
+        assert type(outputs[3]) is Carousel
+        assert type(outputs[3].items[0]) is BasicCard
+        assert type(outputs[4].carousel.items[0]) is CommerceCard
+        assert type(outputs[5].carousel.items[0]) is ItemCard
+
+        # restored tree is mutable
+        restored.add_qr("더보기")
+        outputs[3].items[0].set_title("changed")
+        assert b'"title":"changed"' in restored.to_json()
+        assert b"changed" not in k.to_json()
+
+    def test_components(self):
+        carousel = Carousel().add_card(ListCard().set_header("a"))
+        restored = snapshot.loads(snapshot.dumps(carousel), Carousel)
+        assert type(restored.items[0]) is ListCard
+        assert msgspec.json.encode(restored) == msgspec.json.encode(carousel)
+
+        card = BasicCard().set_title("t").set_image("https://img")
+        assert snapshot.loads(snapshot.dumps(card), BasicCard) == card
+
+    def test_edge_cases(self):
+        empty = Kakao()
+        assert snapshot.loads(snapshot.dumps(empty)).to_json() == empty.to_json()
+        no_template = Kakao(template=None)
+        assert snapshot.loads(snapshot.dumps(no_template)).to_json() == no_template.to_json()
+
+        # OuterItemCard wraps a ListCard, restored as the equivalent OuterListCard
+        k = Kakao()
+        k.template.outputs.append(OuterItemCard(ListCard().set_header("h")))
+        assert snapshot.loads(snapshot.dumps(k)).to_json() == k.to_json()
+
+        k = Kakao()
+        k.template.outputs.append(ListItem("not an output"))
+        with pytest.raises(Exception):
+            snapshot.dumps(k)
@@ -0,0 +1,79 @@
+import msgspec
+import pytest
+from msgspec import Struct
+
+from kakao_json import Button, Kakao, ListItem
+from kakao_json.skill import decode_request
+from kakao_json.state import InvalidToken, StateSigner
+
+
+class Cart(Struct):
+    page: int
+    items: list[int]
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_800_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def request_with(extra):
+    return decode_request(msgspec.json.encode({"action": {"clientExtra": extra}}))
+
+
+class TestStateSigner:
+    def test_round_trip_and_attach(self):
+        signer = StateSigner("secret")
+        token = signer.dumps(Cart(2, [1, 5]))
+        assert signer.loads(token, Cart) == Cart(2, [1, 5])
+        assert signer.loads(token) == {"page": 2, "items": [1, 5]}
+
+        button = signer.attach(Button("다음", "block", blockId="b").set_extra({"keep": 1}), Cart(3, []))
+        item = signer.attach(ListItem("항목"), {"id": 7})
+        k = Kakao()
+        k.add_qr("이전", extra=signer.extra(Cart(1, [])))
+        assert button.extra["keep"] == 1
+        assert signer.from_request(request_with(button.extra), Cart) == Cart(3, [])
+        assert signer.from_request(request_with(item.extra)) == {"id": 7}
+        qr = msgspec.json.decode(k.to_json())["template"]["quickReplies"][0]
+        assert signer.from_request(request_with(qr["extra"]), Cart) == Cart(1, [])
+
+    def test_compression(self):
+        signer = StateSigner("secret")
+        big = Cart(1, [7] * 500)
+        token = signer.dumps(big)
+        assert len(token) < len(msgspec.json.encode(big)) / 4
+        assert signer.loads(token, Cart) == big
+
+    def test_tampering_and_expiry(self):
+        clock = Clock()
+        signer = StateSigner("secret", max_age=60, clock=clock)
+        token = signer.dumps({"admin": False})
+
+        raw = bytearray(token.encode())
+        raw[10] = ord("A") if raw[10] != ord("A") else ord("B")
+        for bad in (raw.decode(), "!!!", "", token[:-2]):
+            with pytest.raises(InvalidToken):
+                signer.loads(bad)
+        with pytest.raises(InvalidToken):
+            StateSigner("other").loads(token)
+        with pytest.raises(InvalidToken):
+            signer.loads(token, Cart)
+
+        assert signer.from_request(request_with({"state": "tampered"}), default="fallback") == "fallback"
+        assert signer.from_request(request_with(None)) is None
+        assert signer.invalid == 1
+
+        clock.now += 61
+        with pytest.raises(InvalidToken):
+            signer.loads(token)
+
+    def test_key_rotation(self):
+        old = StateSigner("old")
+        rotated = StateSigner(["new", "old"])
+        assert rotated.loads(old.dumps([1])) == [1]
+        with pytest.raises(InvalidToken):
+            old.loads(rotated.dumps([1]))